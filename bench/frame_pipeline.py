@@ -0,0 +1,123 @@
+"""
+Benchmark of the camera frame pipeline on synthetic frames.
+
+Times the quality gate on rejected (dark) frames: the low-resolution gate
+used by the camera against the previous full-resolution path (500px LANCZOS
+resize, then PIL "L" and "HSV" conversions). Then, for each image profile of
+MODE_CONFIGS, times the resize and encode of an accepted frame and reports
+the payload size sent to the VLM.
+
+Run from the repository root:
+    python -m bench.frame_pipeline [--runs N]
+"""
+
+import argparse
+import tempfile
+import time
+
+import numpy as np
+from PIL import Image
+
+from models import ImageCodec, MODE_CONFIGS
+from tools.camera import Camera, CapturedFrame, DEFAULT_IMAGE_PROFILE
+
+RESOLUTIONS = {"720p": (1280, 720), "1080p": (1920, 1080)}
+
+
+def synthetic_frame(width, height, dark=False, seed=0):
+    """RGB uint8 frame with gradients, a solid block and sensor noise."""
+    rng = np.random.default_rng(seed)
+    y, x = np.mgrid[0:height, 0:width]
+    frame = np.stack([(x / 5) % 256, (y / 3) % 256, ((x + y) / 7) % 256], -1)
+    frame = frame.astype(np.float32)
+    frame[height // 4 : height * 3 // 4, width // 4 : width // 2] = [200, 40, 60]
+    frame += rng.normal(0, 8, frame.shape)
+    if dark:
+        frame *= 0.02
+    return np.clip(frame, 0, 255).astype(np.uint8)
+
+
+def make_camera():
+    """Camera with the .env.example thresholds, saving into a temporary directory."""
+    return Camera(
+        frames_dir=tempfile.mkdtemp(),
+        darkness_threshold=12,
+        hue_uniformity_threshold=5,
+        saturation_uniformity_threshold=15,
+    )
+
+
+def median_ms(function, runs):
+    """Median wall time of function(), in milliseconds."""
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return float(np.median(times)) * 1000
+
+
+def full_resolution_gate(frame):
+    """The quality check as it ran before the low-resolution gate."""
+    image = Image.fromarray(frame)
+    ratio = 500 / max(image.size)
+    image = image.resize(tuple(int(x * ratio) for x in image.size), Image.LANCZOS)
+    hsv = np.array(image.convert("HSV"))
+    return np.array(image.convert("L")).mean(), hsv[:, :, 0].std(), hsv[:, :, 1].std()
+
+
+def bench_gate(camera, runs):
+    """Per-frame time and throughput of the gate on rejected frames."""
+    print("Quality gate on rejected (dark) frames")
+    for name, (width, height) in RESOLUTIONS.items():
+        frame = synthetic_frame(width, height, dark=True)
+        before = median_ms(lambda: full_resolution_gate(frame), runs)
+        after = median_ms(
+            lambda: camera._process_frame(frame, 1, False, DEFAULT_IMAGE_PROFILE), runs
+        )
+        print(
+            f"  {name:>5}: full resolution {before:7.2f} ms ({1000 / before:6.0f} fps)"
+            f" -> low resolution {after:6.3f} ms ({1000 / after:6.0f} fps)"
+        )
+
+
+def bench_profiles(camera, runs, resolution="720p"):
+    """Resize and encode time, and payload size, of each image profile."""
+    print(f"Resize and encode of an accepted {resolution} frame, per image profile")
+    frame = synthetic_frame(*RESOLUTIONS[resolution])
+    profiles = {}
+    for mode, mode_config in MODE_CONFIGS.items():
+        profiles.setdefault(mode_config.image_profile, []).append(mode.value)
+
+    for profile, modes in profiles.items():
+
+        def resize_and_encode():
+            image = camera._resize_frame(frame, profile.max_side, profile.resample)
+            captured = CapturedFrame(image, profile=profile)
+            captured.encode()
+            return captured
+
+        total = median_ms(resize_and_encode, runs)
+        captured = resize_and_encode()
+        print(
+            f"  {ImageCodec(profile.codec).value} {profile.max_side}px {profile.resample} "
+            f"q{profile.quality} detail={profile.detail} ({len(modes)} modes): "
+            f"{total:.1f} ms (encode {captured.encode_time * 1000:.1f} ms), "
+            f"payload {len(captured.payload) / 1024:.1f} KB, "
+            f"data URL {len(captured.data_url) / 1024:.1f} KB"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=50, help="runs per measurement")
+    args = parser.parse_args()
+
+    camera = make_camera()
+    bench_gate(camera, args.runs)
+    bench_profiles(camera, args.runs)
+    camera.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Benchmark of the ElevenLabs time to first audio on a fake synthesis stream.
+
+The fake API yields CHUNKS chunks CHUNK_INTERVAL seconds apart, so the whole
+utterance takes CHUNKS * CHUNK_INTERVAL seconds to synthesize. The buffered
+provider can only play once all of it has arrived; the streaming provider
+plays the first chunk as soon as it arrives. Then cancels a streamed
+utterance mid-way and reports how many chunks were still pulled and played.
+
+Run from the repository root:
+    python -m bench.tts_first_audio [--runs N]
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+import numpy as np
+
+import tts_providers.elevenlabs_provider as elevenlabs_provider
+
+CHUNKS = 10
+CHUNK_INTERVAL = 0.1  # seconds between fake synthesis chunks
+
+
+def fake_generate(text, voice=None, model=None, stream=False):
+    """Stand-in for elevenlabs.generate, paced like a network stream."""
+
+    def chunks():
+        for i in range(CHUNKS):
+            time.sleep(CHUNK_INTERVAL)
+            yield bytes([i]) * 1024
+
+    if stream:
+        return chunks()
+    return b"".join(chunks())
+
+
+class FakePlayer:
+    """Stand-in for the mpv player, counting the chunks it receives."""
+
+    played = 0
+
+    def write(self, chunk):
+        FakePlayer.played += 1
+
+    def finish(self):
+        pass
+
+    def abort(self):
+        pass
+
+
+def install_fakes():
+    """Replace the ElevenLabs API, the voices and the players with fakes."""
+    archive_dir = tempfile.mkdtemp()
+    elevenlabs_provider.generate = fake_generate
+    elevenlabs_provider.play = lambda audio: None
+    elevenlabs_provider._StreamPlayer = FakePlayer
+    elevenlabs_provider._create_voice = lambda mode: None
+    elevenlabs_provider._new_archive_path = lambda: os.path.join(
+        tempfile.mkdtemp(dir=archive_dir), "audio.wav"
+    )
+
+
+def bench_first_audio(runs):
+    buffered = elevenlabs_provider.ElevenLabsProvider()
+    streaming = elevenlabs_provider.ElevenLabsStreamingProvider()
+    buffered._initialized = streaming._initialized = True
+
+    buffered_times, streaming_times = [], []
+    for _ in range(runs):
+        buffered.play_audio("Hello there")
+        buffered_times.append(buffered.last_time_to_first_audio)
+        asyncio.run(streaming.play_audio_async("Hello there"))
+        streaming_times.append(streaming.last_time_to_first_audio)
+
+    print(f"Time to first audio, median of {runs} runs")
+    print(f"  buffered  {np.median(buffered_times):.2f}s")
+    print(f"  streaming {np.median(streaming_times):.2f}s")
+
+
+def bench_cancel():
+    streaming = elevenlabs_provider.ElevenLabsStreamingProvider()
+    streaming._initialized = True
+
+    async def cancel_mid_utterance():
+        task = asyncio.create_task(streaming.play_audio_async("Hello there"))
+        await asyncio.sleep(CHUNKS * CHUNK_INTERVAL / 3)
+        task.cancel()
+        start = time.perf_counter()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+        return time.perf_counter() - start
+
+    FakePlayer.played = 0
+    elapsed = asyncio.run(cancel_mid_utterance())
+    print(
+        f"Cancel after {CHUNKS * CHUNK_INTERVAL / 3:.2f}s: returned in "
+        f"{elapsed * 1000:.0f} ms, {FakePlayer.played}/{CHUNKS} chunks played"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="runs per measurement")
+    args = parser.parse_args()
+
+    install_fakes()
+    bench_first_audio(args.runs)
+    bench_cancel()
+
+
+if __name__ == "__main__":
+    main()
@@ -41,7 +41,14 @@ def make_arguments(parser_description):
         "--provider-name",
         type=str,
         default=None,
-        help="TTS provider to use (elevenlabs, playht). If not specified, uses TTS_PROVIDER env var or defaults to elevenlabs.",
+        help="TTS provider to use (elevenlabs, elevenlabs_stream, playht). If not specified, uses TTS_PROVIDER env var or defaults to elevenlabs.",
+    )
+
+    parser.add_argument(
+        "--record-source",
+        type=str,
+        default=None,
+        help="Record source to use (sqs, socket, file). If not specified, uses RECORD_SOURCE env var or defaults to sqs.",
     )
 
     parser.add_argument(
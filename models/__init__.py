@@ -3,17 +3,23 @@ from .narrator_mode import (
     NarratorModeModel,
     CameraMethod,
     CaptureMode,
+    ImageCodec,
+    ImageProfile,
     ModeConfig,
     MODE_CONFIGS,
 )
 from .record import RecordModel
+from .agent_config import AgentConfig
 
 __all__ = [
     "NarratorMode",
     "NarratorModeModel",
     "CameraMethod",
     "CaptureMode",
+    "ImageCodec",
+    "ImageProfile",
     "ModeConfig",
     "MODE_CONFIGS",
     "RecordModel",
+    "AgentConfig",
 ]
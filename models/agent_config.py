@@ -0,0 +1,21 @@
+from typing import Optional, Tuple
+from pydantic import BaseModel, Field
+
+
+class AgentConfig(BaseModel):
+    """Configuration of a narrator agent, read from its agents/<name>.env file."""
+
+    agent: str = Field(..., description="Agent key, e.g. davide")
+    name: Optional[str] = Field(None, description="Display name of the agent")
+    prompt: Optional[str] = Field(None, description="System prompt")
+    first_image_prompt: Optional[str] = None
+    new_image_prompt: Optional[str] = None  # Falls back to first_image_prompt
+    elevenlabs_voice_id: Optional[str] = None
+    elevenlabs_stability: Optional[float] = None
+    elevenlabs_similarity: Optional[float] = None
+    elevenlabs_style: Optional[float] = None
+    playht_voice_id: Optional[str] = None
+    filler_phrases: Tuple[str, ...] = ()
+
+    class Config:
+        frozen = True  # Shared between tasks, replaced as a whole on reload
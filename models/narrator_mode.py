@@ -20,6 +20,27 @@ class CaptureMode(str, Enum):
     HYBRID = "hybrid"  # Continuous with record override
 
 
+class ImageCodec(str, Enum):
+    """Codecs for the frames sent to the VLM."""
+
+    JPEG = "jpeg"
+    WEBP = "webp"
+
+
+class ImageProfile(BaseModel):
+    """How the frames of a mode are resized and encoded for the VLM."""
+
+    max_side: int = 500  # pixels on the longest side
+    resample: str = "lanczos"  # PIL filter: nearest, bilinear, bicubic, lanczos
+    codec: ImageCodec = ImageCodec.JPEG
+    quality: int = 75
+    detail: str = "high"  # VLM detail level: low, high or auto
+
+    class Config:
+        use_enum_values = True
+        frozen = True
+
+
 class NarratorMode(str, Enum):
     """
     Enumeration of available narrator modes.
@@ -45,6 +66,11 @@ class ModeConfig(BaseModel):
     camera_method: CameraMethod = CameraMethod.STANDARD
     capture_mode: CaptureMode = CaptureMode.CONTINUOUS
     sleep_interval: float = 3.0  # seconds between captures in continuous mode
+    min_sample_rate: float = 1.0  # frames/sec analysed by movement detection when idle
+    max_sample_rate: float = 5.0  # frames/sec analysed by movement detection on motion
+    max_staleness: float = 20.0  # seconds after which a pipelined narration is dropped
+    stream_response: bool = False  # speak each sentence as soon as the VLM streams it
+    image_profile: ImageProfile = ImageProfile()
     description: str = ""
     agent: Optional[str] = (
         None  # Agent name for voice/personality (e.g., "davide", "bortis"). None for no agent..
@@ -75,6 +101,7 @@ MODE_CONFIGS = {
         camera_method=CameraMethod.STANDARD,
         capture_mode=CaptureMode.RECORD_TRIGGERED,
         sleep_interval=1.0,
+        stream_response=True,
         description="Davide interaction mode, capture triggered by questions",
         agent="davide",
     ),
@@ -83,6 +110,7 @@ MODE_CONFIGS = {
         camera_method=CameraMethod.STANDARD,
         capture_mode=CaptureMode.RECORD_TRIGGERED,
         sleep_interval=1.0,
+        stream_response=True,
         description="Bortis interaction mode, capture triggered by questions",
         agent="bortis",
     ),
@@ -127,6 +155,15 @@ MODE_CONFIGS = {
         camera_method=CameraMethod.MOVEMENT_DETECTION,
         capture_mode=CaptureMode.CONTINUOUS,
         sleep_interval=1.0,
+        min_sample_rate=0.5,
+        max_sample_rate=8.0,
+        image_profile=ImageProfile(
+            max_side=384,
+            resample="bilinear",
+            codec=ImageCodec.WEBP,
+            quality=60,
+            detail="low",
+        ),
         description="Security monitoring with movement detection",
     ),
 }
@@ -3,6 +3,8 @@ import sys
 import base64
 import time
 import json
+import random
+import signal
 import asyncio
 
 from openai import OpenAI, AsyncOpenAI
@@ -10,17 +12,22 @@ from openai import OpenAI, AsyncOpenAI
 from utils.env_utils import (
     get_env_var,
     get_agent_name,
+    get_filler_phrases,
+    AGENT_REGISTRY,
 )
 from utils.common_utils import (
-    maybe_start_alternative_narrator,
     cut_to_n_words,
     count_tokens,
     FRAMES_DIR,
 )
 from tools import Camera
-from tools.ai import analyze_image, analyze_image_async
+from tools.ai import analyze_image, analyze_image_async, analyze_image_stream
+from tools.capture_scheduler import CaptureScheduler
+from tools.pipeline import NarrationJob, PipelineStats
+from tools.conversation import ConversationWindow, SCRIPT_TOKEN_BUDGET
 import tools.audio_feedback as audio_feedback
-import tools.db_parser as db
+from tools.audio_engine import get_audio_engine
+from record_sources.source_factory import SourceFactory
 from tts_providers.provider_factory import ProviderFactory
 from tts_providers.base_provider import AsyncTTSProvider
 from models import NarratorMode, RecordModel, CameraMethod, CaptureMode, MODE_CONFIGS
@@ -36,6 +43,7 @@ class Narrator:
         debug_chat=False,
         provider_name=None,
         continue_on_error=True,
+        record_source=None,
     ):
         print(f"☕ Waking up the narrator...")
 
@@ -50,21 +58,28 @@ class Narrator:
         self.max_times = float(get_env_var("MAX_TIMES") or "inf")
         self.count = 0
 
-        # Initialize mode
-        self.current_mode = NarratorMode.STARTUP
-
         # Communication between tasks
         self.record_queue = asyncio.Queue()
-        self.capture_trigger = asyncio.Event()
         self.shutdown_event = asyncio.Event()
 
+        # Capture -> VLM -> TTS pipeline, bounded queues between stages
+        pipeline_depth = int(get_env_var("PIPELINE_DEPTH") or "1")
+        self.analysis_queue = asyncio.Queue(maxsize=pipeline_depth)
+        self.speech_queue = asyncio.Queue(maxsize=pipeline_depth)
+        self.pipeline_stats = PipelineStats()
+        self.speaking = asyncio.Lock()  # Held while a narration or a filler plays
+
+        # Initialize mode, captures are scheduled from its configuration
+        self._current_mode = NarratorMode.STARTUP
+        self.capture_scheduler = CaptureScheduler(MODE_CONFIGS[self._current_mode])
+
         # State management
-        self.last_capture_time = 0
-        self.script = []
         self.tts_error_occurred = False
         self.tts_error = None
         self.current_record = None
+        self.record_received_at = None  # For record-to-capture latency reporting
         self.last_text = None
+        self.last_filler = None
 
         # Initialize camera
         self.camera = Camera(
@@ -75,9 +90,13 @@ class Narrator:
                 "SATURATION_UNIFORMITY_THRESHOLD"
             ),
             movement_threshold=os.environ.get("MOVEMENT_THRESHOLD"),
+            frame_max_age=os.environ.get("FRAME_MAX_AGE"),
+            single_pass_stats=os.environ.get("SINGLE_PASS_STATS"),
+            warm_frame_max_age=os.environ.get("WARM_FRAME_MAX_AGE"),
         )
         # Note: camera setup will be done async in run() method
         self.reader = None
+        self.audio_engine = None
 
         # Movement debugging will be handled in async initialization
 
@@ -85,13 +104,37 @@ class Narrator:
         self.sync_client = OpenAI()
         self.async_client = AsyncOpenAI()
 
+        # Script resent to the VLM with every call, kept within a token budget
+        self.script = ConversationWindow(
+            self.async_client,
+            max_tokens=int(os.environ.get("SCRIPT_TOKEN_BUDGET", SCRIPT_TOKEN_BUDGET)),
+        )
+
         # Initialize TTS provider
         self.tts_provider = None
 
+        # Initialize record source (SQS, local socket or watched file)
+        self.record_source = SourceFactory.create_source(
+            record_source, verbose=debug_chat
+        )
+
+    @property
+    def current_mode(self):
+        """Current narrator mode."""
+        return self._current_mode
+
+    @current_mode.setter
+    def current_mode(self, mode):
+        """Switch mode and reschedule pending captures accordingly."""
+        self._current_mode = mode
+        self.capture_scheduler.set_mode(MODE_CONFIGS[mode])
+
     async def _initialize_tts_provider(self):
         """Initialize TTS provider with error handling."""
         try:
-            self.tts_provider = ProviderFactory.create_provider(self.provider_name)
+            self.tts_provider = ProviderFactory.create_failover_provider(
+                self.provider_name
+            )
             if isinstance(self.tts_provider, AsyncTTSProvider):
                 await self.tts_provider.initialize_async()
             else:
@@ -103,12 +146,16 @@ class Narrator:
             self.tts_error = e
 
     async def _handle_tts_error_recovery(self):
-        """Handle TTS error recovery when continue_on_error is True."""
+        """
+        Handle TTS error recovery when continue_on_error is True.
+        Failover between the primary and standby providers already happens
+        within each utterance, so this runs when both failed: the providers
+        are reinitialized in process, keeping the camera and pipeline state.
+        """
         print("🔧 Attempting TTS error recovery...")
 
-        # Try to reinitialize current provider
         try:
-            print(f"🔄 Attempting to reinitialize current TTS provider...")
+            print(f"🔄 Attempting to reinitialize the TTS providers...")
             if self.tts_provider:
                 if isinstance(self.tts_provider, AsyncTTSProvider):
                     await self.tts_provider.cleanup_async()
@@ -124,50 +171,18 @@ class Narrator:
             await self._initialize_tts_provider()
 
             if not self.tts_error_occurred:
-                print("✅ TTS provider successfully reinitialized")
-                return
-
-        except Exception as e:
-            print(f"❌ Failed to reinitialize current provider: {e}")
-
-        # Try alternative provider if current one failed
-        try:
-            if self.tts_provider and hasattr(self.tts_provider, "provider_name"):
-                current_provider = self.tts_provider.provider_name
-            else:
-                current_provider = self.provider_name or "elevenlabs"
-
-            alternative_provider = (
-                "playht" if current_provider.lower() == "elevenlabs" else "elevenlabs"
-            )
-
-            print(
-                f"🔄 Attempting to switch to alternative TTS provider: {alternative_provider}"
-            )
-
-            # Reset error state and try alternative
-            self.tts_error_occurred = False
-            self.tts_error = None
-            self.tts_provider = None
-            self.provider_name = alternative_provider
-
-            await self._initialize_tts_provider()
-
-            if not self.tts_error_occurred:
-                print(
-                    f"✅ Successfully switched to alternative TTS provider: {alternative_provider}"
-                )
+                print("✅ TTS providers successfully reinitialized")
                 return
 
         except Exception as e:
-            print(f"❌ Failed to initialize alternative provider: {e}")
+            print(f"❌ Failed to reinitialize the TTS providers: {e}")
 
         # If all recovery attempts fail, continue without TTS
         print("All TTS recovery attempts failed.")
         print(
             "🔇 To continue without audio output, the env variable ALLOW_NO_TTS must set to True."
         )
-        if os.environ.get("ALLOW_NO_TTS").lower() == "true":
+        if os.environ.get("ALLOW_NO_TTS", "false").lower() == "true":
             print("🔇 ALLOW_NO_TTS is set to True, continuing without audio output.")
         else:
             print("🔇 ALLOW_NO_TTS is not set to True, shutting down.")
@@ -178,28 +193,39 @@ class Narrator:
         # Reset error state so the narrator doesn't keep trying
         self.tts_error_occurred = False
 
-    def _get_camera_capture_method(self, camera_method: CameraMethod):
+    def _get_camera_capture_method(self, mode_config):
         """Get the appropriate camera capture method based on mode configuration."""
+        camera_method = mode_config.camera_method
+        profile = mode_config.image_profile
+        sample_rates = {
+            "min_rate": mode_config.min_sample_rate,
+            "max_rate": mode_config.max_sample_rate,
+        }
         if camera_method == CameraMethod.MOVEMENT_DETECTION:
-            return lambda: self.camera.capture_movement(self.reader)
+            return lambda: self.camera.capture_movement(
+                self.reader, profile=profile, **sample_rates
+            )
         elif camera_method == CameraMethod.DEBUG:
-            return lambda: self.camera.capture(self.reader, debugging=True)
+            return lambda: self.camera.capture(
+                self.reader, debugging=True, profile=profile
+            )
         elif camera_method == CameraMethod.DEBUG_MOVEMENT:
-            return lambda: self.camera.capture_movement(self.reader, debugging=True)
+            return lambda: self.camera.capture_movement(
+                self.reader, debugging=True, profile=profile, **sample_rates
+            )
         else:  # STANDARD
-            return lambda: self.camera.capture(self.reader)
+            return lambda: self.camera.capture(self.reader, profile=profile)
 
     async def _record_processing_task(self):
-        """Continuously process incoming records."""
-        print("🔄 Starting record processing task...")
+        """Process incoming records as soon as the record source pushes them."""
+        print(
+            f"🔄 Starting record processing task ({self.record_source.source_name} source)..."
+        )
 
         print("🔄 Waiting for a message...")
         while not self.shutdown_event.is_set():
             try:
-                # Fetch new record
-                record_data = await db.fetch_record(self.debug_chat)
-
-                if record_data:
+                async for record_data in self.record_source.records():
                     record = await self._handle_new_record(record_data)
                     if record:
                         # Put record in queue for camera task to process
@@ -211,9 +237,10 @@ class Narrator:
                             CaptureMode.RECORD_TRIGGERED,
                             CaptureMode.HYBRID,
                         ]:
-                            self.capture_trigger.set()
+                            self.capture_scheduler.trigger()
 
-                await asyncio.sleep(0.5)  # Brief pause between record polls
+                    if self.shutdown_event.is_set():
+                        break
 
             except Exception as e:
                 print(f"Error in record processing: {e}")
@@ -222,52 +249,33 @@ class Narrator:
         print("🔄 Shutdown event received. Shutting down record processing task.")
 
     async def _camera_capture_task(self):
-        """Handle camera captures based on current mode configuration."""
+        """
+        Capture stage: capture when the scheduler says one is due and hand the
+        frame to the analysis stage. The bounded queue holds captures back while
+        the later stages are busy.
+        """
         print("📸 Starting camera capture task...")
 
         while not self.shutdown_event.is_set():
             try:
-                mode_config = MODE_CONFIGS[self.current_mode]
-                current_time = time.time()
-
-                should_capture = False
-
-                if mode_config.capture_mode == CaptureMode.CONTINUOUS:
-                    # Continuous capture with sleep intervals
-                    if (
-                        current_time - self.last_capture_time
-                        >= mode_config.sleep_interval
-                    ):
-                        should_capture = True
-
-                elif mode_config.capture_mode == CaptureMode.RECORD_TRIGGERED:
-                    # Only capture when triggered by new record
-                    if self.capture_trigger.is_set():
-                        should_capture = True
-                        self.capture_trigger.clear()
-
-                elif mode_config.capture_mode == CaptureMode.HYBRID:
-                    # Continuous with record override
-                    if self.capture_trigger.is_set():
-                        should_capture = True
-                        self.capture_trigger.clear()
-                    elif (
-                        current_time - self.last_capture_time
-                        >= mode_config.sleep_interval
-                    ):
-                        should_capture = True
-
-                if should_capture:
-                    await self._perform_capture_and_respond(mode_config)
-                    self.last_capture_time = current_time
-
-                    self.count += 1
-                    if self.count >= self.max_times:
-                        print(f"Reached maximum iterations ({self.max_times})")
-                        self.shutdown_event.set()
-                        break
-
-                await asyncio.sleep(0.1)  # Brief pause to prevent busy waiting
+                # Sleeps until the next interval, a record trigger or a mode change
+                mode_config, _ = await self.capture_scheduler.wait_for_capture()
+
+                capture_time = time.time()
+                with self.pipeline_stats.stage("capture"):
+                    job = await self._capture_for_narration(mode_config)
+                self.capture_scheduler.mark_captured(capture_time)
+                if job:
+                    await self.analysis_queue.put(job)
+
+                self.count += 1
+                if self.count >= self.max_times:
+                    print(f"Reached maximum iterations ({self.max_times})")
+                    # Let the narrations already in the pipeline finish
+                    await self.analysis_queue.join()
+                    await self.speech_queue.join()
+                    self.shutdown_event.set()
+                    break
 
             except Exception as e:
                 print(f"Error in camera capture task: {e}")
@@ -275,6 +283,64 @@ class Narrator:
 
         print("🔄 Shutdown event received. Shutting down camera capture task.")
 
+    async def _analysis_task(self):
+        """Analysis stage: turn captured frames into text while earlier narrations play."""
+        print("🧠 Starting analysis task...")
+
+        while not self.shutdown_event.is_set():
+            job = await self.analysis_queue.get()
+            try:
+                stale_reason = job.stale_reason(self.current_mode, self.current_record)
+                if stale_reason:
+                    print(f"🗑️ Discarding capture before analysis: {stale_reason}")
+                    self.pipeline_stats.discarded += 1
+                    job.cancel()
+                    continue
+
+                if job.text is None and job.mode_config.stream_response:
+                    # Sentences are spoken as they stream in, hand the job over at once
+                    job.sentences = asyncio.Queue()
+                    job.stream_task = asyncio.create_task(self._analyze_streamed(job))
+                elif job.text is None:
+                    with self.pipeline_stats.stage("analyze"):
+                        await self._analyze(job)
+                await self.speech_queue.put(job)
+
+            except Exception as e:
+                print(f"Error in analysis task: {e}")
+            finally:
+                self.analysis_queue.task_done()
+
+    async def _speech_task(self):
+        """Speech stage: play narrations in order, dropping the ones gone stale."""
+        print("🎙️ Starting speech task...")
+
+        while not self.shutdown_event.is_set():
+            job = await self.speech_queue.get()
+            try:
+                stale_reason = job.stale_reason(self.current_mode, self.current_record)
+                if stale_reason:
+                    print(f"🗑️ Discarding narration before speaking: {stale_reason}")
+                    self.pipeline_stats.discarded += 1
+                    job.cancel()
+                    if job.script_entry in self.script:
+                        self.script.remove(job.script_entry)
+                    continue
+
+                if job.filler_task:
+                    # The answer starts as soon as the filler ends
+                    await job.filler_task
+                async with self.speaking:
+                    with self.pipeline_stats.stage("speak"):
+                        await self._speak(job)
+                self.pipeline_stats.narrations += 1
+                print(f"📊 Pipeline: {self.pipeline_stats.summary()}")
+
+            except Exception as e:
+                print(f"Error in speech task: {e}")
+            finally:
+                self.speech_queue.task_done()
+
     async def _handle_new_record(self, record_data: dict) -> RecordModel:
         """Process new record and update mode."""
         try:
@@ -299,14 +365,15 @@ class Narrator:
             print(f"📋 Mode config: {MODE_CONFIGS[record.mode].description}")
 
             self.current_record = record
+            self.record_received_at = time.time()
             return record
 
         except Exception as e:
             print(f"Error processing record: {e}")
             return None
 
-    async def _perform_capture_and_respond(self, mode_config):
-        """Perform camera capture and generate response."""
+    async def _capture_for_narration(self, mode_config):
+        """Perform camera capture. Returns the NarrationJob to analyze, or None."""
         agent_name = get_agent_name(self.current_mode.value)
 
         # Handle startup mode specially
@@ -314,84 +381,249 @@ class Narrator:
             await asyncio.sleep(mode_config.sleep_interval)
             self.current_mode = NarratorMode.WAIT_FOR_INSTRUCTIONS
             print("🚀 Startup complete, switched to waiting mode")
-            return
+            return None
+
+        job = NarrationJob(self.current_mode, mode_config, self.current_record)
 
         # Use recovery text if this is an error recovery
         if self.recovery_text and self.count == 0:
-            text = self.recovery_text
+            job.text = self.recovery_text
             self.recovery_text = None  # Clear after use
             print(f"🔄 Using recovery text from error restart")
-        else:
-            # Capture image
-            print(f"👀 {agent_name} is looking... (Mode: {self.current_mode.value})")
-            capture_method = self._get_camera_capture_method(mode_config.camera_method)
-            base64_image = await capture_method()
+            return job
+
+        # Capture image
+        print(f"👀 {agent_name} is looking... (Mode: {self.current_mode.value})")
+        if self.record_received_at:
+            latency = time.time() - self.record_received_at
+            print(f"⏱️ Record-to-capture latency: {latency:.3f}s")
+            self.record_received_at = None
+        if mode_config.capture_mode == CaptureMode.RECORD_TRIGGERED:
+            # Mask the capture and VLM latency with a short cached filler
+            job.filler_task = self._start_filler(job)
+        job.frame = await self._take_warm_frame(mode_config)
+        if job.frame is None:
+            capture_method = self._get_camera_capture_method(mode_config)
+            job.frame = await capture_method()
+
+        if not mode_config.agent:
+            print(
+                f"🔄 No agent set for mode {self.current_mode.value}, no thinking and voice will be used."
+            )
+            return None
 
-            if not mode_config.agent:
-                print(
-                    f"🔄 No agent set for mode {self.current_mode.value}, no thinking and voice will be used."
-                )
-                return
+        return job
 
-            # Create message object for AI analysis
-            message = {
-                "content": self.current_record.content if self.current_record else None,
-                "mode": self.current_mode.value,
-            }
-
-            # Analyze image
-            print(f"🧠 {agent_name} is thinking...")
-            vlm_inputs = [
-                self.current_mode.value,
-                message,
-                base64_image,
-                self.script,
-            ]
-            if isinstance(self.tts_provider, AsyncTTSProvider):
-                text = await analyze_image_async(
+    def _uses_warm_frame(self, mode_config):
+        """Whether records of the mode can be answered with the camera's warm frame."""
+        return (
+            self.camera.warm_frame_max_age > 0
+            and mode_config.agent
+            and mode_config.capture_mode == CaptureMode.RECORD_TRIGGERED
+            and mode_config.camera_method == CameraMethod.STANDARD
+        )
+
+    def _keeps_warm_frame(self, mode_config):
+        """
+        Whether to keep the warm frame fresh while in the mode. The camera idles
+        until the next record, which may switch to any mode using the warm
+        frame, so this includes modes without an agent (WAIT_FOR_INSTRUCTIONS).
+        """
+        return (
+            mode_config.capture_mode == CaptureMode.RECORD_TRIGGERED
+            and mode_config.camera_method == CameraMethod.STANDARD
+            and any(self._uses_warm_frame(config) for config in MODE_CONFIGS.values())
+        )
+
+    async def _take_warm_frame(self, mode_config):
+        """The camera's warm frame if it is fresh enough to answer the record, else None."""
+        if not self._uses_warm_frame(mode_config):
+            return None
+        frame = await self.camera.take_warm_frame(mode_config.image_profile)
+        if frame is not None:
+            age = time.time() - frame.timestamp
+            print(f"⚡ Answering with a warm frame grabbed {age:.2f}s ago")
+        return frame
+
+    async def _warm_frame_task(self):
+        """
+        Keep the camera's warm frame fresh while waiting for records, so that
+        a record can go straight to the VLM without a capture.
+        """
+        interval = self.camera.warm_frame_max_age / 2
+        while not self.shutdown_event.is_set():
+            mode_config = MODE_CONFIGS[self.current_mode]
+            if self._keeps_warm_frame(mode_config):
+                try:
+                    await self.camera.refresh_warm_frame(self.reader)
+                except Exception as e:
+                    print(f"Warning: Could not refresh the warm frame: {e}")
+            await asyncio.sleep(interval)
+
+    async def _analyze(self, job):
+        """Generate the narration text for a captured frame."""
+        agent_name = get_agent_name(job.mode.value)
+
+        # Create message object for AI analysis
+        message = {
+            "content": job.record.content if job.record else None,
+            "mode": job.mode.value,
+        }
+
+        # Analyze image
+        print(f"🧠 {agent_name} is thinking...")
+        vlm_inputs = [
+            job.mode.value,
+            message,
+            job.frame,
+            self.script.messages(),
+            self.script.record_usage,
+        ]
+        if isinstance(self.tts_provider, AsyncTTSProvider):
+            text = await analyze_image_async(
+                self.async_client,
+                *vlm_inputs,
+            )
+        else:
+            # Run sync analysis in executor to avoid blocking
+            loop = asyncio.get_running_loop()
+            text = await loop.run_in_executor(
+                None,
+                analyze_image,
+                self.sync_client,
+                *vlm_inputs,
+            )
+
+        # Cut to appropriate length
+        max_tokens = int(get_env_var("MAX_TOKENS"))
+        job.text = cut_to_n_words(text, int(max_tokens * 5 / 4))
+
+        # Add to conversation script now, so the next analysis does not repeat it
+        job.script_entry = {"role": "assistant", "content": job.text}
+        self.script.append(job.script_entry)
+
+    async def _analyze_streamed(self, job):
+        """Stream the narration text for a captured frame into job.sentences."""
+        agent_name = get_agent_name(job.mode.value)
+        message = {
+            "content": job.record.content if job.record else None,
+            "mode": job.mode.value,
+        }
+        max_tokens = int(get_env_var("MAX_TOKENS"))
+
+        print(f"🧠 {agent_name} is thinking (streaming)...")
+        sentences = []
+        try:
+            with self.pipeline_stats.stage("analyze"):
+                async for sentence in analyze_image_stream(
                     self.async_client,
-                    *vlm_inputs,
-                )
-            else:
-                # Run sync analysis in executor to avoid blocking
-                loop = asyncio.get_running_loop()
-                text = await loop.run_in_executor(
-                    None,
-                    analyze_image,
-                    self.sync_client,
-                    *vlm_inputs,
-                )
+                    job.mode.value,
+                    message,
+                    job.frame,
+                    self.script.messages(),
+                    int(max_tokens * 5 / 4),
+                    on_usage=self.script.record_usage,
+                ):
+                    sentences.append(sentence)
+                    await job.sentences.put(sentence)
+
+            job.text = " ".join(sentences)
+            job.script_entry = {"role": "assistant", "content": job.text}
+            self.script.append(job.script_entry)
+        except Exception as e:
+            print(f"Error during streamed analysis: {e}")
+            job.text = " ".join(sentences)
+        finally:
+            job.sentences.put_nowait(None)
+
+    async def _play_text(self, text, job):
+        """Play text with the TTS provider of the narrator."""
+        if self.debug_chat or not self.tts_provider or not job.mode_config.agent:
+            return
+        if isinstance(self.tts_provider, AsyncTTSProvider):
+            await self.tts_provider.play_audio_async(text, job.mode.value)
+        else:
+            # Run sync TTS in executor if it might be slow
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(
+                None,
+                self.tts_provider.play_audio,
+                text,
+                job.mode.value,
+            )
+
+    def _start_filler(self, job):
+        """Start playing a filler phrase of the job's agent. Returns the task, or None."""
+        phrases = get_filler_phrases(job.mode.value)
+        if not phrases or self.debug_chat or not self.tts_provider:
+            return None
+        # Avoid repeating the last filler, unless the agent has only that one
+        phrases = [
+            phrase for phrase in phrases if phrase != self.last_filler
+        ] or phrases
+        self.last_filler = random.choice(phrases)
+        print(f"💭 {self.last_filler}")
+        return asyncio.create_task(self._play_filler(self.last_filler, job))
+
+    async def _play_filler(self, text, job):
+        """
+        Play a filler phrase, never failing the narration it precedes.
+        Waits for the narration playing, if any, so the two never overlap.
+        """
+        try:
+            async with self.speaking:
+                await self._play_text(text, job)
+        except Exception as e:
+            print(f"Warning: Could not play filler: {e}")
+
+    async def _warm_fillers(self):
+        """Synthesize the filler phrases of every agent into the TTS cache."""
+        if not hasattr(self.tts_provider, "warm_async"):
+            return
+        warmed = 0
+        for mode, mode_config in MODE_CONFIGS.items():
+            if mode_config.capture_mode != CaptureMode.RECORD_TRIGGERED:
+                continue
+            for phrase in get_filler_phrases(mode.value):
+                try:
+                    warmed += await self.tts_provider.warm_async(phrase, mode.value)
+                except Exception as e:
+                    print(f"Warning: Could not warm filler '{phrase}': {e}")
+        if warmed:
+            print(f"💭 Synthesized {warmed} filler phrases into the TTS cache")
+
+    def _report_first_audio(self, job):
+        """Print the time from capture to the moment the first text is sent to TTS."""
+        print(
+            f"⏱️ First text sent to TTS {time.time() - job.created_at:.2f}s after capture"
+        )
+
+    async def _speak(self, job):
+        """Play the narration of a job."""
+        agent_name = get_agent_name(job.mode.value)
 
         # Process and play response
         try:
             print(f"🎙️ {agent_name} says:")
-            print(f"💬 {text}")
+            if job.sentences is not None:
+                # Play each sentence as soon as the VLM completes it
+                first = True
+                while (sentence := await job.sentences.get()) is not None:
+                    print(f"💬 {sentence}")
+                    if first:
+                        self._report_first_audio(job)
+                        first = False
+                    await self._play_text(sentence, job)
+                text = job.text
+            else:
+                text = job.text
+                print(f"💬 {text}")
+                self._report_first_audio(job)
+                await self._play_text(text, job)
+
             print(f"📏 Length: {len(text)} | Tokens: {count_tokens(text)}")
             self.last_text = text
 
-            # Cut to appropriate length
-            max_tokens = int(get_env_var("MAX_TOKENS"))
-            text = cut_to_n_words(text, int(max_tokens * 5 / 4))
-
-            # Play audio
-            if not self.debug_chat and self.tts_provider and mode_config.agent:
-                if isinstance(self.tts_provider, AsyncTTSProvider):
-                    await self.tts_provider.play_audio_async(
-                        text, self.current_mode.value
-                    )
-                else:
-                    # Run sync TTS in executor if it might be slow
-                    loop = asyncio.get_running_loop()
-                    await loop.run_in_executor(
-                        None,
-                        self.tts_provider.play_audio,
-                        text,
-                        self.current_mode.value,
-                    )
-
-            # Add to conversation script
-            self.script.append({"role": "assistant", "content": text})
-
             # Brief pause between responses
             print(f"😴 {agent_name} taking a brief pause...")
             await asyncio.sleep(1)
@@ -410,6 +642,15 @@ class Narrator:
     async def run(self):
         """Main async run loop with concurrent record processing and camera capture."""
         try:
+            # Reload the agent configurations when their files change or on SIGHUP
+            loop = asyncio.get_running_loop()
+            AGENT_REGISTRY.start_watching()
+            if hasattr(signal, "SIGHUP"):
+                loop.add_signal_handler(signal.SIGHUP, AGENT_REGISTRY.request_reload)
+
+            # Open the audio output and preload the feedback cues
+            self.audio_engine = await loop.run_in_executor(None, get_audio_engine)
+
             # Initialize camera async
             print("📷 Initializing camera...")
             self.reader = await self.camera.get_camera("<video0>")
@@ -442,25 +683,40 @@ class Narrator:
                 )
                 print("📢 Narrator will run without TTS audio output")
 
+            # Cache the filler phrases in the background
+            if self.tts_provider and not self.debug_chat:
+                asyncio.create_task(self._warm_fillers())
+
+            # Start receiving records
+            await self.record_source.start()
+
             print(f"🎬 Starting narrator with mode: {self.current_mode.value}")
             print(f"📖 {MODE_CONFIGS[self.current_mode].description}")
 
             # Create concurrent tasks
             tasks = [
                 asyncio.create_task(self._camera_capture_task()),
+                asyncio.create_task(self._analysis_task()),
+                asyncio.create_task(self._speech_task()),
                 asyncio.create_task(self._record_processing_task()),
             ]
+            if self.camera.warm_frame_max_age > 0:
+                tasks.append(asyncio.create_task(self._warm_frame_task()))
 
-            # Run tasks until shutdown or error
+            # Run tasks until shutdown or error. The record source may block
+            # waiting for records, so shutdown is awaited explicitly.
+            shutdown_task = asyncio.create_task(self.shutdown_event.wait())
             try:
-                await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+                await asyncio.wait(
+                    tasks + [shutdown_task], return_when=asyncio.FIRST_COMPLETED
+                )
             except Exception as e:
                 print(f"Error in main tasks: {e}")
                 self.tts_error_occurred = True
                 self.tts_error = e
 
             # Cleanup tasks
-            for task in tasks:
+            for task in tasks + [shutdown_task]:
                 if not task.done():
                     task.cancel()
                     try:
@@ -493,14 +749,22 @@ class Narrator:
                 else:
                     self.tts_provider.cleanup()
 
+            # Stop receiving records
+            await self.record_source.close()
+
             # Turn off audio feedback
             if not self.tts_error_occurred:
                 audio_feedback.turnoff()
 
-            # Close camera
+            # Close camera and flush pending frame uploads
+            loop = asyncio.get_running_loop()
             if self.reader:
-                loop = asyncio.get_running_loop()
                 await loop.run_in_executor(None, self.reader.close)
+            await loop.run_in_executor(None, self.camera.close)
+
+            # Let the queued audio play out, then close the output stream
+            if self.audio_engine:
+                await loop.run_in_executor(None, self.audio_engine.close)
 
             if self.tts_error_occurred:
                 await self.handle_tts_error()
@@ -509,45 +773,17 @@ class Narrator:
             print(f"Warning: Error during cleanup: {e}")
 
     async def handle_tts_error(self):
-        """Handle TTS errors by trying alternative provider."""
+        """
+        Report a TTS error that stopped the narrator. Switching to the standby
+        provider happens in process while running, the narrator is not respawned.
+        """
         if self.tts_error_occurred:
             print(f"💥 TTS error occurred: {self.tts_error}")
 
-            # If continue_on_error is True, don't start alternative narrator
             if self.continue_on_error:
-                print(
-                    "🔄 TTS error handled with continue_on_error=True, not starting alternative narrator"
-                )
-                return
-
-            if self.last_text is None:
-                print("💥 No last text to use for error recovery")
+                print("🔄 TTS error handled with continue_on_error=True")
                 return
 
-            if self.from_error:
-                print(
-                    "💥 Error recovery is not supported for narrators already started from an error"
-                )
-                return
-
-            # Try alternative provider
-            alternative_provider = (
-                "playht"
-                if self.tts_provider and self.tts_provider.provider_name == "ElevenLabs"
-                else "elevenlabs"
-            )
-            print(f"🔄 Trying alternative TTS provider: {alternative_provider}")
-
-            # Start alternative narrator with different provider
-            import subprocess
-
-            command = [
-                "python",
-                "narrator.py",
-                "--from-error",
-                "--text",
-                self.last_text,
-                "--provider-name",
-                alternative_provider,
-            ]
-            subprocess.run(command)
+            print("💥 No TTS provider could speak, the narrator stopped")
+            if self.last_text is not None:
+                print(f"💥 Last narration: {self.last_text}")
@@ -0,0 +1 @@
+# Package for record sources feeding the narrator
@@ -0,0 +1,32 @@
+from abc import ABC, abstractmethod
+from typing import AsyncIterator
+
+
+class RecordSource(ABC):
+    """Abstract base class for record sources."""
+
+    @abstractmethod
+    async def start(self) -> None:
+        """Start receiving records (open connections, sockets, files, etc.)."""
+        pass
+
+    @abstractmethod
+    def records(self) -> AsyncIterator[dict]:
+        """
+        Yield raw record data as soon as it arrives.
+
+        Yields:
+            Dictionaries that validate as RecordModel
+        """
+        pass
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Stop receiving records and release resources."""
+        pass
+
+    @property
+    @abstractmethod
+    def source_name(self) -> str:
+        """Return the name of this source."""
+        pass
@@ -0,0 +1,149 @@
+import os
+import json
+import uuid
+import asyncio
+
+from .base_source import RecordSource
+
+DEFAULT_SOCKET_PATH = "/tmp/narrator.sock"
+DEFAULT_RECORDS_FILE = "records.jsonl"
+FILE_POLL_INTERVAL = 0.05  # seconds between checks for new lines in the records file
+
+
+def parse_record_line(line):
+    """
+    Parse one JSON line into record data with a fresh id.
+    Client ids are replaced: the id names files written by the narrator.
+    """
+    record_data = json.loads(line)
+    if not isinstance(record_data, dict):
+        raise ValueError(f"a record must be a JSON object, got {line!r}")
+    record_data["id"] = str(uuid.uuid4())
+    return record_data
+
+
+class _QueuedRecordSource(RecordSource):
+    """Base for local sources: records are pushed into a queue and yielded immediately."""
+
+    def __init__(self, verbose=False):
+        self.verbose = verbose
+        self._queue = asyncio.Queue()
+
+    def push(self, record_data):
+        """Push record data to the narrator without waiting."""
+        if self.verbose:
+            print(f"New message: {record_data}")
+        self._queue.put_nowait(record_data)
+
+    async def records(self):
+        """Yield records as soon as they are pushed."""
+        while True:
+            yield await self._queue.get()
+
+
+class SocketRecordSource(_QueuedRecordSource):
+    """
+    Record source listening on a Unix socket.
+    Clients write one JSON record per line and get "ok" or an error back per line, e.g.:
+        echo '{"mode": "ask_davide", "content": "Who am I?"}' | nc -U /tmp/narrator.sock
+    """
+
+    def __init__(self, socket_path=None, verbose=False):
+        super().__init__(verbose)
+        self.socket_path = socket_path or os.environ.get(
+            "RECORD_SOCKET_PATH", DEFAULT_SOCKET_PATH
+        )
+        self._server = None
+
+    async def start(self) -> None:
+        """Start listening on the socket."""
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)  # Stale socket from a previous run
+        self._server = await asyncio.start_unix_server(
+            self._handle_client, path=self.socket_path
+        )
+        print(f"🔌 Listening for records on {self.socket_path}")
+
+    async def _handle_client(self, reader, writer):
+        """Read JSON lines from a client and push each record."""
+        try:
+            while line := await reader.readline():
+                if not line.strip():
+                    continue
+                try:
+                    self.push(parse_record_line(line))
+                    writer.write(b"ok\n")
+                except ValueError as e:
+                    writer.write(f"error: {e}\n".encode())
+                await writer.drain()
+        finally:
+            writer.close()
+
+    async def close(self) -> None:
+        """Stop listening and remove the socket."""
+        if self._server:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+
+    @property
+    def source_name(self) -> str:
+        """Return the name of this source."""
+        return "Socket"
+
+
+class FileRecordSource(_QueuedRecordSource):
+    """
+    Record source watching a JSONL file: every line appended to it is a record.
+    Lines already in the file when the narrator starts are skipped.
+    """
+
+    def __init__(self, path=None, verbose=False):
+        super().__init__(verbose)
+        self.path = path or os.environ.get("RECORDS_FILE", DEFAULT_RECORDS_FILE)
+        self._watch_task = None
+
+    async def start(self) -> None:
+        """Start watching the file from its current end."""
+        offset = os.path.getsize(self.path) if os.path.exists(self.path) else 0
+        self._watch_task = asyncio.create_task(self._watch(offset))
+        print(f"📄 Watching {self.path} for records")
+
+    async def _watch(self, offset):
+        """Push complete lines appended after offset."""
+        pending = b""
+        while True:
+            size = os.path.getsize(self.path) if os.path.exists(self.path) else 0
+            if size < offset:
+                offset = 0  # File was truncated or replaced
+            if size > offset:
+                with open(self.path, "rb") as f:
+                    f.seek(offset)
+                    data = f.read(size - offset)
+                offset = size
+                *lines, pending = (pending + data).split(b"\n")
+                for line in lines:
+                    if not line.strip():
+                        continue
+                    try:
+                        self.push(parse_record_line(line))
+                    except ValueError as e:
+                        print(f"Skipping invalid record line in {self.path}: {e}")
+            await asyncio.sleep(FILE_POLL_INTERVAL)
+
+    async def close(self) -> None:
+        """Stop watching the file."""
+        if self._watch_task:
+            self._watch_task.cancel()
+            try:
+                await self._watch_task
+            except asyncio.CancelledError:
+                pass
+            self._watch_task = None
+
+    @property
+    def source_name(self) -> str:
+        """Return the name of this source."""
+        return "File"
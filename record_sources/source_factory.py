@@ -0,0 +1,49 @@
+import os
+
+from .base_source import RecordSource
+from .sqs_source import SQSRecordSource
+from .local_source import SocketRecordSource, FileRecordSource
+
+
+class SourceFactory:
+    """Factory for creating record source instances."""
+
+    SOURCES = {
+        "sqs": SQSRecordSource,
+        "socket": SocketRecordSource,
+        "file": FileRecordSource,
+    }
+
+    @classmethod
+    def create_source(cls, source_name: str = None, verbose=False) -> RecordSource:
+        """
+        Create a record source instance.
+
+        Args:
+            source_name: Name of the source to create. If None, uses RECORD_SOURCE env var.
+            verbose: Whether the source should print every received message
+
+        Returns:
+            Record source instance
+
+        Raises:
+            ValueError: If source_name is not supported
+        """
+        if source_name is None:
+            source_name = os.environ.get("RECORD_SOURCE", "sqs")
+
+        source_name = source_name.lower()
+
+        if source_name not in cls.SOURCES:
+            available = ", ".join(cls.SOURCES.keys())
+            raise ValueError(
+                f"Unsupported record source '{source_name}'. Available: {available}"
+            )
+
+        source_class = cls.SOURCES[source_name]
+        return source_class(verbose=verbose)
+
+    @classmethod
+    def get_available_sources(cls) -> list[str]:
+        """Get list of available source names."""
+        return list(cls.SOURCES.keys())
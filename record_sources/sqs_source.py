@@ -0,0 +1,36 @@
+from .base_source import RecordSource
+
+
+class SQSRecordSource(RecordSource):
+    """Record source long polling the AWS SQS queue."""
+
+    def __init__(self, verbose=False):
+        self.verbose = verbose
+        self._closed = False
+        self._executor = None
+
+    async def start(self) -> None:
+        """Start the SQS thread, the SQS client is created lazily on first poll."""
+        import tools.db_parser as db
+
+        self._closed = False
+        self._executor = db.SQSExecutor()
+
+    async def records(self):
+        """Yield records from each long poll, in queue order."""
+        import tools.db_parser as db
+
+        while not self._closed:
+            for record_data in await db.fetch_records(self._executor, self.verbose):
+                yield record_data
+
+    async def close(self) -> None:
+        """Stop polling without waiting for the long poll in flight."""
+        self._closed = True
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+
+    @property
+    def source_name(self) -> str:
+        """Return the name of this source."""
+        return "SQS"
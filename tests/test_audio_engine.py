@@ -0,0 +1,72 @@
+import time
+
+import numpy as np
+
+from tools.audio_engine import AudioEngine
+
+SAMPLE_RATE = 22050
+BLOCK_SIZE = 512
+
+
+class FakeOutputStream:
+    """Output stream playing blocks at speed times real time."""
+
+    def __init__(self, speed=20):
+        self.speed = speed
+        self.blocks = 0
+        self.closed = False
+
+    def write(self, block):
+        time.sleep(BLOCK_SIZE / SAMPLE_RATE / self.speed)
+        self.blocks += 1
+
+    def stop(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+def _engine(tmp_path, speed=20):
+    engine = AudioEngine(cue_dir=str(tmp_path), block_size=BLOCK_SIZE)
+    engine._stream = FakeOutputStream(speed)
+    engine._thread.start()
+    return engine
+
+
+def _pcm(seconds):
+    samples = np.sin(np.arange(int(seconds * SAMPLE_RATE)) / 10) * 10000
+    return samples.astype("<i2").tobytes()
+
+
+def test_writes_wait_while_the_stream_is_buffered(tmp_path):
+    engine = _engine(tmp_path)
+    stream = engine.open_stream(SAMPLE_RATE, 1, 2, max_buffered=0.5)
+    try:
+        assert stream.write(_pcm(0.2)).done()
+        ready = stream.write(_pcm(2.0))
+
+        # Queued audio stays as int16 PCM until it is mixed
+        assert all(isinstance(block, bytes) for block in stream._source._blocks)
+        assert not ready.done()
+        # Resolved once played down to the limit, about 1.7s of audio at 20x
+        ready.result(timeout=2)
+        assert stream._source._buffered <= 0.5 * SAMPLE_RATE * 2
+        stream.finish().result(timeout=2)
+    finally:
+        engine.close()
+
+
+def test_close_drops_unfinished_streams(tmp_path):
+    engine = _engine(tmp_path, speed=1)
+    stream = engine.open_stream(SAMPLE_RATE, 1, 2)
+    stream.write(_pcm(0.1))  # Never finished
+
+    start = time.perf_counter()
+    engine.close(timeout=0.2)
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 1.0
+    assert not engine._thread.is_alive()
+    assert engine._stream.closed
+    assert stream.abort().done()
@@ -0,0 +1,75 @@
+import asyncio
+
+import pytest
+
+from tts_providers.base_provider import AsyncTTSProvider
+from tts_providers.cached_provider import CachedTTSProvider, TTSCache
+
+
+class FakeProvider(AsyncTTSProvider):
+    """Provider streaming a fixed clip per text, counting syntheses and playbacks."""
+
+    def __init__(self):
+        self.synthesized = 0
+        self.played = []
+
+    async def initialize_async(self):
+        pass
+
+    async def play_audio_async(self, text, mode="", sink=None):
+        self.synthesized += 1
+        for chunk in (text.encode(), b"-audio"):
+            if sink is not None:
+                sink(chunk)
+        self.played.append(text.encode() + b"-audio")
+
+    async def synthesize_async(self, text, mode=""):
+        self.synthesized += 1
+        return text.encode() + b"-audio"
+
+    async def play_bytes_async(self, audio, mode=""):
+        self.played.append(audio)
+
+    def voice_signature(self, mode=""):
+        return {"provider": "Fake", "voice": mode}
+
+    async def cleanup_async(self):
+        pass
+
+    @property
+    def provider_name(self):
+        return "Fake"
+
+
+def test_live_utterances_are_streamed_not_cached(tmp_path):
+    cache = TTSCache(str(tmp_path))
+    provider = CachedTTSProvider(FakeProvider(), cache)
+    chunks = []
+
+    asyncio.run(provider.play_audio_async("Once upon a time", sink=chunks.append))
+    asyncio.run(provider.play_audio_async("Once upon a time"))
+
+    assert chunks == [b"Once upon a time", b"-audio"]
+    assert provider.provider.synthesized == 2
+    assert cache.usage()["clips"] == 0
+
+
+def test_warmed_phrases_are_replayed_from_the_cache(tmp_path):
+    cache = TTSCache(str(tmp_path))
+    provider = CachedTTSProvider(FakeProvider(), cache)
+
+    assert asyncio.run(provider.warm_async("Hmm, let me see"))
+    assert not asyncio.run(provider.warm_async("Hmm, let me see"))
+    asyncio.run(provider.play_audio_async("Hmm, let me see"))
+
+    assert provider.provider.synthesized == 1
+    assert provider.provider.played == [b"Hmm, let me see-audio"]
+    assert cache.stats["hits"] == 1
+
+
+def test_providers_must_support_caching():
+    class NoReplayProvider(FakeProvider):
+        play_bytes_async = AsyncTTSProvider.play_bytes_async
+
+    with pytest.raises(TypeError, match="play_bytes_async"):
+        NoReplayProvider()
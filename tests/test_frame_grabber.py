@@ -0,0 +1,138 @@
+import asyncio
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from tools.camera import FRAME_GRABBER_RESUME_SKIP, Camera, FrameGrabber
+
+FRAME_INTERVAL = 0.005  # seconds between fake camera frames
+
+
+class FakeReader:
+    """imageio-like reader producing numbered frames, optionally failing."""
+
+    def __init__(self, fail=False, scene=None):
+        self.fail = fail
+        self.scene = scene  # Optional function of the read count returning a frame
+        self.reads = 0
+        self.closed = False
+        self._lock = threading.Lock()
+
+    def get_next_data(self):
+        time.sleep(FRAME_INTERVAL)
+        if self.fail:
+            raise IOError("device disconnected")
+        with self._lock:
+            self.reads += 1
+            if self.scene is not None:
+                return self.scene(self.reads)
+            return np.full((2, 2, 3), self.reads % 256, np.uint8)
+
+    def close(self):
+        self.closed = True
+
+
+def test_reads_only_while_resumed():
+    reader = FakeReader()
+    grabber = FrameGrabber(reader).start()
+    try:
+        time.sleep(0.1)
+        assert reader.reads == 0
+
+        async def grab():
+            with grabber.streaming():
+                return await grabber.next_frame()
+
+        timestamp, frame = asyncio.run(grab())
+        # Frames buffered while paused are skipped
+        assert frame[0, 0, 0] > FRAME_GRABBER_RESUME_SKIP
+
+        time.sleep(0.05)
+        paused_reads = reader.reads
+        time.sleep(0.1)
+        assert reader.reads == paused_reads
+        assert grabber.latest() is None
+    finally:
+        grabber.close()
+    assert reader.closed
+
+
+def test_streams_until_the_last_consumer_pauses():
+    reader = FakeReader()
+    grabber = FrameGrabber(reader).start()
+    try:
+        grabber.resume()
+        grabber.resume()
+        grabber.pause()
+        time.sleep(0.1)
+        assert reader.reads > 0
+        grabber.pause()
+        time.sleep(0.05)
+        paused_reads = reader.reads
+        time.sleep(0.1)
+        assert reader.reads == paused_reads
+    finally:
+        grabber.close()
+
+
+def test_next_frame_needs_a_resumed_grabber():
+    grabber = FrameGrabber(FakeReader()).start()
+    try:
+        with pytest.raises(RuntimeError):
+            asyncio.run(grabber.next_frame())
+    finally:
+        grabber.close()
+
+
+def test_read_errors_stop_the_grabber_and_reach_the_consumer():
+    grabber = FrameGrabber(FakeReader(fail=True), max_read_errors=3).start()
+
+    async def grab():
+        with grabber.streaming():
+            return await asyncio.wait_for(grabber.next_frame(), timeout=5)
+
+    try:
+        with pytest.raises(IOError, match="3 read errors"):
+            asyncio.run(grab())
+        # Later captures fail right away instead of waiting for a frame
+        with pytest.raises(IOError):
+            asyncio.run(grab())
+        assert not grabber._thread.is_alive()
+    finally:
+        grabber.close()
+
+
+def test_idle_capture_pauses_the_grabber(tmp_path):
+    rng = np.random.default_rng(0)
+    dark = np.zeros((90, 160, 3), np.uint8)
+    textured = rng.integers(0, 256, (90, 160, 3), dtype=np.uint8)
+    lights_on = threading.Event()
+    reader = FakeReader(scene=lambda _: textured if lights_on.is_set() else dark)
+    grabber = FrameGrabber(reader).start()
+    camera = Camera(
+        frames_dir=str(tmp_path),
+        darkness_threshold=12,
+        hue_uniformity_threshold=5,
+        saturation_uniformity_threshold=15,
+    )
+
+    async def capture_in_the_dark():
+        capture = asyncio.create_task(camera.capture(grabber))
+        await asyncio.sleep(1.0)
+        dark_reads = reader.reads
+        lights_on.set()
+        captured = await asyncio.wait_for(capture, timeout=10)
+        return dark_reads, captured
+
+    try:
+        dark_reads, captured = asyncio.run(capture_in_the_dark())
+    finally:
+        grabber.close()
+        camera.close()
+
+    # Streaming the whole second would read about 1 / FRAME_INTERVAL frames
+    assert dark_reads < 0.25 / FRAME_INTERVAL
+    assert captured is not None
+    assert camera.capture_state_times["idle"] > 0.5
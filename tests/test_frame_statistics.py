@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+from PIL import Image
+
+from tools.camera import FrameStatistics
+
+# Differences allowed against PIL's "L" and "HSV" conversions
+BRIGHTNESS_TOLERANCE = 1e-4
+HUE_STD_TOLERANCE = 0.0063  # PIL rounds hue per pixel slightly differently
+SAT_STD_TOLERANCE = 1e-3
+
+
+def _gradient():
+    y, x = np.mgrid[0:90, 0:120]
+    return np.stack([x * 2, y * 2, x + y], -1).astype(np.uint8)
+
+
+def _primaries():
+    colors = np.array(
+        [[255, 0, 0], [0, 255, 0], [0, 0, 255], [255, 255, 0], [0, 255, 255]],
+        dtype=np.uint8,
+    )
+    return np.repeat(np.repeat(colors[:, None, :], 16, axis=1), 12, axis=0)
+
+
+FRAMES = {
+    "black": np.zeros((60, 80, 3), np.uint8),
+    "gray": np.full((60, 80, 3), 128, np.uint8),
+    "gradient": _gradient(),
+    "primaries": _primaries(),
+    **{
+        f"random_{seed}": np.random.default_rng(seed).integers(
+            0, 256, (72, 96, 3), dtype=np.uint8
+        )
+        for seed in range(6)
+    },
+}
+
+
+def _pil_statistics(rgb):
+    """Brightness, hue std and saturation std the way the camera used to compute them."""
+    image = Image.fromarray(rgb)
+    hsv = np.array(image.convert("HSV"))
+    return (
+        np.array(image.convert("L")).mean(),
+        hsv[:, :, 0].std(),
+        hsv[:, :, 1].std(),
+    )
+
+
+@pytest.mark.parametrize("single_pass", [False, True])
+@pytest.mark.parametrize("name", sorted(FRAMES))
+def test_matches_pil_conversions(name, single_pass):
+    rgb = FRAMES[name]
+    brightness, hue_std, sat_std = FrameStatistics(single_pass).compute(rgb)
+    expected_brightness, expected_hue_std, expected_sat_std = _pil_statistics(rgb)
+
+    assert brightness == pytest.approx(expected_brightness, abs=BRIGHTNESS_TOLERANCE)
+    assert hue_std == pytest.approx(expected_hue_std, abs=HUE_STD_TOLERANCE)
+    assert sat_std == pytest.approx(expected_sat_std, abs=SAT_STD_TOLERANCE)
+
+
+def test_luminance_matches_pil_exactly():
+    rgb = FRAMES["random_0"]
+    expected = np.array(Image.fromarray(rgb).convert("L"))
+    np.testing.assert_array_equal(FrameStatistics().luminance(rgb), expected)
@@ -0,0 +1,159 @@
+import os
+import threading
+import time
+
+from tools.frame_uploader import FrameUploader
+
+UPLOAD_DELAY = 0.2  # seconds each fake upload takes
+
+
+class SlowS3Client:
+    """Fake S3 client whose uploads take UPLOAD_DELAY seconds each."""
+
+    def __init__(self, delay=UPLOAD_DELAY):
+        self.delay = delay
+        self.uploaded = {}
+        self._lock = threading.Lock()
+
+    def upload_fileobj(self, fileobj, bucket, key, ExtraArgs=None):
+        time.sleep(self.delay)
+        with self._lock:
+            self.uploaded[key] = fileobj.read()
+
+
+class FailingS3Client:
+    def upload_fileobj(self, fileobj, bucket, key, ExtraArgs=None):
+        raise ConnectionError("S3 unreachable")
+
+
+def _spilled(spill_dir):
+    return sorted(
+        os.path.relpath(os.path.join(root, name), spill_dir).replace(os.sep, "/")
+        for root, _, files in os.walk(spill_dir)
+        for name in files
+    )
+
+
+def test_full_queue_spills_without_blocking(tmp_path):
+    client = SlowS3Client()
+    uploader = FrameUploader(
+        client, "bucket", str(tmp_path), queue_size=2, workers=1
+    ).start()
+
+    start = time.perf_counter()
+    accepted = [uploader.submit(f"frames/{i}.jpg", b"frame %d" % i) for i in range(8)]
+    elapsed = time.perf_counter() - start
+
+    # Submitting never waits on the slow uploads
+    assert elapsed < UPLOAD_DELAY
+    # The worker holds at most one frame, the queue two, the rest is spilled
+    assert accepted[:2] == [True, True]
+    assert accepted.count(False) >= 5
+    spilled = [f"frames/{i}.jpg" for i, ok in enumerate(accepted) if not ok]
+    assert _spilled(str(tmp_path)) == spilled
+    assert uploader.stats["spilled"] == len(spilled)
+
+    uploader.flush(timeout=5.0)
+
+
+def test_flush_uploads_queued_frames(tmp_path):
+    client = SlowS3Client()
+    uploader = FrameUploader(
+        client, "bucket", str(tmp_path), queue_size=4, workers=2
+    ).start()
+    frames = {f"frames/{i}.jpg": b"frame %d" % i for i in range(4)}
+    for key, data in frames.items():
+        assert uploader.submit(key, data)
+
+    uploader.flush(timeout=5.0)
+
+    assert client.uploaded == frames
+    assert uploader.pending() == 0
+    assert uploader.stats["uploaded"] == len(frames)
+    assert _spilled(str(tmp_path)) == []
+    assert not any(worker.is_alive() for worker in uploader._workers)
+
+
+def test_flush_spills_what_misses_the_deadline(tmp_path):
+    client = SlowS3Client()
+    uploader = FrameUploader(
+        client, "bucket", str(tmp_path), queue_size=4, workers=1
+    ).start()
+    for i in range(4):
+        uploader.submit(f"frames/{i}.jpg", b"frame %d" % i)
+
+    uploader.flush(timeout=UPLOAD_DELAY / 2)
+
+    # Nothing is lost: every frame is either uploaded or spilled to disk
+    assert sorted(client.uploaded) + _spilled(str(tmp_path)) == sorted(
+        f"frames/{i}.jpg" for i in range(4)
+    )
+    assert uploader.stats["spilled"] >= 2
+
+
+def test_failed_uploads_are_retried_then_spilled(tmp_path):
+    uploader = FrameUploader(
+        FailingS3Client(), "bucket", str(tmp_path), workers=1, backoff=0.01
+    ).start()
+    uploader.submit("frames/0.jpg", b"frame 0")
+
+    uploader.flush(timeout=5.0)
+
+    assert uploader.stats["retries"] == uploader.max_retries
+    assert uploader.stats["failed"] == 1
+    assert _spilled(str(tmp_path)) == ["frames/0.jpg"]
+
+
+class StuckS3Client:
+    """Fake S3 client whose uploads hang until released."""
+
+    def __init__(self):
+        self.release = threading.Event()
+
+    def upload_fileobj(self, fileobj, bucket, key, ExtraArgs=None):
+        self.release.wait()
+
+
+def test_spill_drops_the_oldest_frames_over_the_size_limit(tmp_path):
+    uploader = FrameUploader(
+        FailingS3Client(), "bucket", str(tmp_path), max_spill_bytes=3 * 100
+    )
+    for i in range(5):
+        uploader._spill(f"frames/{i}.jpg", bytes(100))
+
+    assert _spilled(str(tmp_path)) == [f"frames/{i}.jpg" for i in (2, 3, 4)]
+    assert uploader.stats["spilled"] == 5
+    assert uploader.stats["dropped"] == 2
+
+
+def test_spill_drops_frames_over_the_age_limit(tmp_path):
+    old = tmp_path / "frames" / "old.jpg"
+    old.parent.mkdir()
+    old.write_bytes(b"old frame")
+    two_days_ago = time.time() - 48 * 3600
+    os.utime(old, (two_days_ago, two_days_ago))
+
+    uploader = FrameUploader(
+        FailingS3Client(), "bucket", str(tmp_path), max_spill_age=24 * 3600
+    )
+    uploader._spill("frames/new.jpg", b"new frame")
+
+    assert _spilled(str(tmp_path)) == ["frames/new.jpg"]
+    assert uploader.stats["dropped"] == 1
+
+
+def test_flush_does_not_hang_on_stuck_workers(tmp_path):
+    client = StuckS3Client()
+    uploader = FrameUploader(
+        client, "bucket", str(tmp_path), queue_size=1, workers=2
+    ).start()
+    for i in range(4):
+        uploader.submit(f"frames/{i}.jpg", b"frame %d" % i)
+
+    start = time.perf_counter()
+    uploader.flush(timeout=0.5)
+    elapsed = time.perf_counter() - start
+    client.release.set()
+
+    # The deadline and the one second of grace given to the workers
+    assert elapsed < 0.5 + 1.5
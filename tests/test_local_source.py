@@ -0,0 +1,41 @@
+import asyncio
+import json
+
+import pytest
+
+from record_sources.local_source import FileRecordSource, parse_record_line
+
+
+def test_client_ids_are_replaced():
+    record = parse_record_line(b'{"id": "../../etc/cron.d/x", "mode": "ask_davide"}')
+
+    assert record["id"] != "../../etc/cron.d/x"
+    assert record["id"].replace("-", "").isalnum()
+    assert record["mode"] == "ask_davide"
+
+
+@pytest.mark.parametrize("line", [b"[1, 2]", b'"text"', b"3", b"null", b"{"])
+def test_non_object_lines_are_rejected(line):
+    with pytest.raises(ValueError):
+        parse_record_line(line)
+
+
+def test_file_source_skips_invalid_lines(tmp_path):
+    path = tmp_path / "records.jsonl"
+    path.write_text("")
+    source = FileRecordSource(path=str(path))
+
+    async def append_and_receive():
+        await source.start()
+        with open(path, "a") as f:
+            f.write("[1, 2]\n")
+            f.write(json.dumps({"mode": "ask_davide", "content": "hi"}) + "\n")
+        records = source.records()
+        try:
+            return await asyncio.wait_for(records.__anext__(), timeout=2)
+        finally:
+            await source.close()
+
+    record = asyncio.run(append_and_receive())
+
+    assert record["content"] == "hi"
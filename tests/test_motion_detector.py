@@ -0,0 +1,103 @@
+import numpy as np
+import pytest
+
+from tools.camera import Camera, FrameStatistics, MotionDetector
+
+
+def _scene(seed=0):
+    """Grayscale thumbnail with gradients, a bright block and sensor noise."""
+    rng = np.random.default_rng(seed)
+    y, x = np.mgrid[0:90, 0:160]
+    scene = 30 + x * 0.8 + y * 0.6
+    scene[20:60, 40:80] = 200
+    scene += rng.normal(0, 2, scene.shape)
+    return np.clip(scene, 0, 255).astype(np.uint8)
+
+
+def _update(before, after):
+    detector = MotionDetector()
+    detector.update(before)
+    return detector.update(after)
+
+
+@pytest.mark.parametrize(
+    "lighting",
+    [
+        pytest.param(lambda scene: scene * 0.9, id="dim 10%"),
+        pytest.param(lambda scene: scene * 0.7, id="dim 30%"),
+        pytest.param(lambda scene: scene * 1.15, id="brighten 15%"),
+        pytest.param(lambda scene: scene + 20.0, id="offset"),
+        pytest.param(lambda scene: scene * 0.9 + 10.0, id="gain and offset"),
+    ],
+)
+def test_global_lighting_changes_are_not_motion(lighting):
+    before = _scene(seed=1)
+    after = np.clip(lighting(_scene(seed=2).astype(np.float32)), 0, 255)
+
+    result = _update(before, after.astype(np.uint8))
+
+    assert not result.detected
+    assert result.active_fraction == 0.0
+
+
+@pytest.mark.parametrize("gain", [1.0, 0.9])
+def test_moving_object_is_detected(gain):
+    before = _scene(seed=1)
+    after = _scene(seed=2).astype(np.float32)
+    after[60:80, 120:150] = 0
+    after = np.clip(after * gain, 0, 255).astype(np.uint8)
+
+    result = _update(before, after)
+
+    assert result.detected
+    left, top, right, bottom = result.bbox
+    assert 0.6 <= left and right <= 1.0
+    assert 0.5 <= top and bottom <= 1.0
+
+
+def _camera_frames(sigma, seed, n=30, moving=False):
+    """360p RGB frames of a static scene with per-channel sensor noise."""
+    rng = np.random.default_rng(seed)
+    y, x = np.mgrid[0:360, 0:640]
+    scene = np.stack([(x / 2.5) % 256, (y / 1.5) % 256, ((x + y) / 3.5) % 256], -1)
+    scene = scene.astype(np.float32)
+    scene[90:270, 160:320] = [200, 40, 60]
+    for i in range(n):
+        frame = scene.copy()
+        if moving:
+            left = 50 + i * 18
+            frame[150:230, left : left + 60] = 20
+        frame += rng.normal(0, sigma, frame.shape)
+        yield np.clip(frame, 0, 255).astype(np.uint8)
+
+
+def _thumbnails(frames, gate):
+    """Grayscale thumbnails, through the camera gate view or strided without low-pass."""
+    statistics = FrameStatistics()
+    for frame in frames:
+        view = Camera._thumbnail(None, frame) if gate else frame[::4, ::4]
+        yield statistics.luminance(view)
+
+
+@pytest.mark.parametrize("gate", [True, False], ids=["gate view", "strided"])
+@pytest.mark.parametrize("sigma", [5, 8, 12])
+def test_static_scene_with_sensor_noise_is_not_motion(sigma, gate):
+    detector = MotionDetector()
+    detections = [
+        detector.update(gray).detected
+        for gray in _thumbnails(_camera_frames(sigma, seed=sigma), gate)
+    ]
+
+    assert not any(detections)
+
+
+@pytest.mark.parametrize("gate", [True, False], ids=["gate view", "strided"])
+def test_moving_object_is_detected_in_sensor_noise(gate):
+    detector = MotionDetector()
+    detector.update(next(_thumbnails(_camera_frames(8, seed=0, n=1), gate)))
+    detections = [
+        detector.update(gray).detected
+        for gray in _thumbnails(_camera_frames(8, seed=1, n=20, moving=True), gate)
+    ]
+
+    assert all(detections)
@@ -0,0 +1,89 @@
+import numpy as np
+import pytest
+from PIL import Image
+
+from tools.camera import Camera
+
+# Thresholds of .env.example
+DARKNESS_THRESHOLD = 12
+HUE_UNIFORMITY_THRESHOLD = 5
+SATURATION_UNIFORMITY_THRESHOLD = 15
+
+
+def _noisy(color, sigma, seed, shape=(720, 1280)):
+    """Uniform frame of color with per-channel Gaussian sensor noise."""
+    rng = np.random.default_rng(seed)
+    frame = np.broadcast_to(np.array(color, np.float32), (*shape, 3))
+    return np.clip(frame + rng.normal(0, sigma, (*shape, 3)), 0, 255).astype(np.uint8)
+
+
+def _textured(seed, shape=(720, 1280)):
+    """Gradients, a solid block and sensor noise."""
+    rng = np.random.default_rng(seed)
+    height, width = shape
+    y, x = np.mgrid[0:height, 0:width]
+    frame = np.stack([(x / 5) % 256, (y / 3) % 256, ((x + y) / 7) % 256], -1)
+    frame = frame.astype(np.float32)
+    frame[height // 4 : height * 3 // 4, width // 4 : width // 2] = [200, 40, 60]
+    return np.clip(frame + rng.normal(0, 8, frame.shape), 0, 255).astype(np.uint8)
+
+
+def _blobs(seed, shape=(720, 1280)):
+    """Smooth random colour patches with sensor noise."""
+    rng = np.random.default_rng(seed)
+    small = Image.fromarray(rng.integers(0, 256, (9, 16, 3), dtype=np.uint8))
+    frame = np.asarray(small.resize(shape[::-1], Image.BICUBIC), np.float32)
+    return np.clip(frame + rng.normal(0, 6, frame.shape), 0, 255).astype(np.uint8)
+
+
+FRAMES = {
+    "gray wall": (_noisy(128, 12, seed=0), True),
+    "noisy gray wall": (_noisy(128, 20, seed=1), True),
+    "beige wall": (_noisy((200, 180, 150), 12, seed=2), True),
+    "dark room": (_noisy(6, 8, seed=3), True),
+    "gray wall 1080p": (_noisy(128, 12, seed=4, shape=(1080, 1920)), True),
+    "textured": (_textured(seed=5), False),
+    "textured 1080p": (_textured(seed=6, shape=(1080, 1920)), False),
+    "colour patches": (_blobs(seed=7), False),
+}
+
+
+@pytest.fixture(scope="module")
+def camera(tmp_path_factory):
+    return Camera(
+        frames_dir=str(tmp_path_factory.mktemp("frames")),
+        darkness_threshold=DARKNESS_THRESHOLD,
+        hue_uniformity_threshold=HUE_UNIFORMITY_THRESHOLD,
+        saturation_uniformity_threshold=SATURATION_UNIFORMITY_THRESHOLD,
+    )
+
+
+def _full_resolution_rejects(frame):
+    """The quality check as it ran before the low-resolution gate."""
+    image = Image.fromarray(frame)
+    ratio = 500 / max(image.size)
+    image = image.resize(tuple(int(x * ratio) for x in image.size), Image.LANCZOS)
+    hsv = np.array(image.convert("HSV"))
+    return (
+        np.array(image.convert("L")).mean() < DARKNESS_THRESHOLD
+        or hsv[:, :, 1].std() < SATURATION_UNIFORMITY_THRESHOLD
+        or hsv[:, :, 0].std() < HUE_UNIFORMITY_THRESHOLD
+    )
+
+
+@pytest.mark.parametrize("name", sorted(FRAMES))
+def test_gate_matches_full_resolution_path(camera, name):
+    frame, rejected = FRAMES[name]
+
+    assert _full_resolution_rejects(frame) == rejected
+    assert camera._check_image_quality(camera._thumbnail(frame), 1) == rejected
+
+
+def test_thumbnail_is_the_box_mean():
+    frame = np.random.default_rng(8).integers(0, 256, (720, 1280, 3), dtype=np.uint8)
+
+    thumbnail = Camera._thumbnail(None, frame)
+
+    expected = frame.reshape(45, 16, 80, 16, 3).mean(axis=(1, 3))
+    assert thumbnail.shape == (45, 80, 3)
+    assert np.abs(thumbnail - expected).max() <= 0.5
@@ -0,0 +1,95 @@
+import asyncio
+import json
+import threading
+import time
+
+import pytest
+
+import tools.db_parser as db
+from record_sources.sqs_source import SQSRecordSource
+
+
+class FakeSQSClient:
+    """Stub SQS client counting calls, long polling until messages are queued."""
+
+    def __init__(self, batches=(), wait=0.05):
+        self.batches = list(batches)
+        self.wait = wait
+        self.receive_calls = 0
+        self.delete_calls = 0
+        self.deleted = []
+        self.release = threading.Event()
+
+    def receive_message(self, QueueUrl, MaxNumberOfMessages, WaitTimeSeconds, **_):
+        self.receive_calls += 1
+        if not self.batches:
+            self.release.wait(self.wait)
+            return {}
+        return {"Messages": self.batches.pop(0)[:MaxNumberOfMessages]}
+
+    def delete_message_batch(self, QueueUrl, Entries):
+        self.delete_calls += 1
+        self.deleted.extend(entry["ReceiptHandle"] for entry in Entries)
+        return {"Successful": Entries}
+
+
+def _message(i):
+    return {
+        "MessageId": f"m{i}",
+        "ReceiptHandle": f"r{i}",
+        "Body": json.dumps({"text": f"record {i}"}),
+    }
+
+
+@pytest.fixture
+def sqs(monkeypatch):
+    def install(client):
+        monkeypatch.setattr(db, "_sqs", client)
+        return client
+
+    return install
+
+
+def test_each_batch_costs_one_receive_and_one_delete(sqs):
+    client = sqs(FakeSQSClient([[_message(i) for i in range(10)], [_message(10)]]))
+    source = SQSRecordSource()
+
+    async def receive(n):
+        await source.start()
+        records = []
+        async for record in source.records():
+            records.append(record)
+            if len(records) == n:
+                break
+        await source.close()
+        return records
+
+    records = asyncio.run(receive(11))
+
+    assert [record["id"] for record in records] == [f"m{i}" for i in range(11)]
+    assert client.receive_calls == 2
+    assert client.delete_calls == 2
+    assert client.deleted == [f"r{i}" for i in range(11)]
+
+
+def test_close_does_not_wait_for_the_long_poll(sqs):
+    client = sqs(FakeSQSClient(wait=30))
+    source = SQSRecordSource()
+
+    async def poll_then_close():
+        await source.start()
+        poll = asyncio.create_task(source.records().__anext__())
+        await asyncio.sleep(0.1)
+        start = time.perf_counter()
+        poll.cancel()
+        await source.close()
+        return time.perf_counter() - start
+
+    try:
+        assert asyncio.run(poll_then_close()) < 1.0
+        # The long poll still in flight runs on a daemon thread, so it cannot delay exit
+        assert source._executor._thread.daemon
+        with pytest.raises(RuntimeError):
+            source._executor.submit(print)
+    finally:
+        client.release.set()
@@ -1,3 +1,9 @@
-from .camera import Camera
+from .camera import Camera, CapturedFrame, FrameGrabber, MotionDetector, MotionResult
 
-__all__ = ["Camera"]
+__all__ = [
+    "Camera",
+    "CapturedFrame",
+    "FrameGrabber",
+    "MotionDetector",
+    "MotionResult",
+]
@@ -1,3 +1,5 @@
+import re
+
 from utils.env_utils import (
     get_agent_prompt,
     get_env_var,
@@ -6,9 +8,10 @@ from utils.env_utils import (
 )
 
 MAX_TOKENS = int(get_env_var("MAX_TOKENS"))
+SENTENCE_END = re.compile(r"(?<=[.!?…])\s+")
 
 
-def analyze_image(client, mode, message, base64_image, script):
+def analyze_image(client, mode, message, image, script, on_usage=None):
     """Analyze image using OpenAI GPT-4o model synchronously."""
     response = client.chat.completions.create(
         model="gpt-4o",
@@ -20,15 +23,17 @@ def analyze_image(client, mode, message, base64_image, script):
         ]
         + script
         + generate_new_line(
-            mode, message, base64_image, len(script) == 0
+            mode, message, image, len(script) == 0
         ),  # If the script is empty this is the starting image
         max_tokens=MAX_TOKENS,
     )
+    if on_usage and response.usage:
+        on_usage(response.usage)
     response_text = response.choices[0].message.content
     return response_text
 
 
-async def analyze_image_async(client, mode, message, base64_image, script):
+async def analyze_image_async(client, mode, message, image, script, on_usage=None):
     """Analyze image using OpenAI GPT-4o model asynchronously."""
     response = await client.chat.completions.create(
         model="gpt-4o",
@@ -40,15 +45,75 @@ async def analyze_image_async(client, mode, message, base64_image, script):
         ]
         + script
         + generate_new_line(
-            mode, message, base64_image, len(script) == 0
+            mode, message, image, len(script) == 0
         ),  # If the script is empty this is the starting image
         max_tokens=MAX_TOKENS,
     )
+    if on_usage and response.usage:
+        on_usage(response.usage)
     response_text = response.choices[0].message.content
     return response_text
 
 
-def generate_new_line(mode, message, base64_image, first_prompt_bool):
+async def analyze_image_stream(
+    client, mode, message, image, script, max_words, on_usage=None
+):
+    """
+    Analyze image using OpenAI GPT-4o model with a streamed completion.
+    Yields each sentence as soon as it is complete, stopping once max_words are spoken.
+    """
+    stream = await client.chat.completions.create(
+        model="gpt-4o",
+        messages=[
+            {
+                "role": "system",
+                "content": get_agent_prompt(mode),
+            },
+        ]
+        + script
+        + generate_new_line(
+            mode, message, image, len(script) == 0
+        ),  # If the script is empty this is the starting image
+        max_tokens=MAX_TOKENS,
+        stream=True,
+        stream_options={"include_usage": True},
+    )
+
+    buffer = ""
+    words_left = max_words
+    try:
+        async for chunk in stream:
+            if on_usage and chunk.usage:
+                # Sent with the last chunk of a stream read to the end
+                on_usage(chunk.usage)
+            if not chunk.choices or not chunk.choices[0].delta.content:
+                continue
+            buffer += chunk.choices[0].delta.content
+
+            # Everything before the last sentence boundary is complete
+            *sentences, buffer = SENTENCE_END.split(buffer)
+            for sentence in sentences:
+                sentence, words_left = _cut_to_budget(sentence, words_left)
+                if sentence:
+                    yield sentence
+                if words_left <= 0:
+                    return
+
+        sentence, _ = _cut_to_budget(buffer, words_left)
+        if sentence:
+            yield sentence
+    finally:
+        # Stop generating tokens nobody will hear
+        await stream.close()
+
+
+def _cut_to_budget(sentence, words_left):
+    """Cut a sentence to the remaining word budget. Returns (sentence, words_left)."""
+    words = sentence.split()[:words_left]
+    return " ".join(words), words_left - len(words)
+
+
+def generate_new_line(mode, message, image, first_prompt_bool):
     if first_prompt_bool:
         prompt = get_first_image_prompt(mode)
     else:
@@ -66,8 +131,8 @@ def generate_new_line(mode, message, base64_image, first_prompt_bool):
                 {
                     "type": "image_url",
                     "image_url": {
-                        "url": f"data:image/jpg;base64,{base64_image}",
-                        "detail": "high",
+                        "url": image.data_url,
+                        "detail": image.detail,
                     },
                 },
             ],
@@ -0,0 +1,350 @@
+import os
+import wave
+import queue
+import itertools
+import threading
+from collections import deque
+from concurrent.futures import Future
+
+import numpy as np
+import sounddevice as sd
+
+CUE_DIR = os.path.join(os.getcwd(), "assets")
+AUDIO_ENGINE_SAMPLE_RATE = 22050  # PlayHT output rate, so speech needs no resampling
+AUDIO_ENGINE_BLOCK_SIZE = 512  # frames mixed per write, about 23 ms
+PRIORITY_CUE = 1
+PRIORITY_SPEECH = 2
+DUCK_GAIN = 0.3  # gain of a source while a higher priority source is playing
+AUDIO_ENGINE_MAX_BUFFERED = 5.0  # seconds of stream audio queued before writers wait
+
+_engine = None
+_engine_lock = threading.Lock()
+
+
+def get_audio_engine():
+    """Get the shared audio engine, starting it on first use."""
+    global _engine
+    with _engine_lock:
+        if _engine is None:
+            _engine = AudioEngine().start()
+        return _engine
+
+
+def pcm_to_samples(data, sample_rate, channels, sample_width, target_rate):
+    """Convert little-endian PCM bytes to mono float32 samples at the target rate."""
+    if sample_width == 1:
+        samples = (np.frombuffer(data, np.uint8).astype(np.float32) - 128) / 128
+    elif sample_width == 2:
+        samples = np.frombuffer(data, "<i2").astype(np.float32) / 32768
+    elif sample_width == 4:
+        samples = np.frombuffer(data, "<i4").astype(np.float32) / 2147483648
+    else:
+        raise ValueError(f"Unsupported PCM sample width: {sample_width}")
+
+    if channels > 1:
+        samples = samples.reshape(-1, channels).mean(axis=1)
+    if sample_rate != target_rate and len(samples):
+        length = round(len(samples) * target_rate / sample_rate)
+        positions = np.arange(length) * (sample_rate / target_rate)
+        samples = np.interp(positions, np.arange(len(samples)), samples)
+    return samples.astype(np.float32, copy=False)
+
+
+class _Source:
+    """
+    Audio played by the engine: queued blocks and a completion future.
+    Blocks are float32 samples, or PCM bytes converted by convert at mix time.
+    """
+
+    def __init__(self, priority, path=None, convert=None, max_buffered=None):
+        self.priority = priority
+        self.path = path  # Cue file, resolved from the cache by the engine thread
+        self.convert = convert
+        self.max_buffered = max_buffered  # PCM bytes queued before writers wait
+        self.done = Future()
+        self.done.set_running_or_notify_cancel()  # Waiters giving up cannot cancel it
+        self.finished = False  # No more audio will be added
+        self.aborted = False
+        self._blocks = deque()
+        self._buffered = 0  # PCM bytes queued
+        self._current = None  # Samples of the block being played
+        self._offset = 0
+        self._waiters = []  # Futures of writers waiting for the queue to drain
+        self._lock = threading.Lock()
+
+    def add(self, block):
+        with self._lock:
+            self._blocks.append(block)
+            if isinstance(block, bytes):
+                self._buffered += len(block)
+
+    def space(self):
+        """Future resolved once the queued PCM is within max_buffered."""
+        future = Future()
+        future.set_running_or_notify_cancel()
+        with self._lock:
+            if (
+                self.aborted
+                or self.max_buffered is None
+                or self._buffered <= self.max_buffered
+            ):
+                future.set_result(None)
+            else:
+                self._waiters.append(future)
+        return future
+
+    def read(self, n):
+        """Up to n of the next samples, fewer when the source is waiting for audio."""
+        parts = []
+        with self._lock:
+            while n:
+                if self._current is None:
+                    if not self._blocks:
+                        break
+                    block = self._blocks.popleft()
+                    if isinstance(block, bytes):
+                        self._buffered -= len(block)
+                        block = self.convert(block)
+                    self._current = block
+                    self._offset = 0
+                part = self._current[self._offset : self._offset + n]
+                parts.append(part)
+                n -= len(part)
+                self._offset += len(part)
+                if self._offset >= len(self._current):
+                    self._current = None
+        if self._waiters and self._buffered <= self.max_buffered:
+            self.release()
+        return parts
+
+    def abort(self):
+        """Stop playing, dropping the queued audio."""
+        self.aborted = True
+        self.release()
+
+    def release(self):
+        """Resolve the futures of the waiting writers."""
+        with self._lock:
+            waiters, self._waiters = self._waiters, []
+        for future in waiters:
+            future.set_result(None)
+
+    def exhausted(self):
+        with self._lock:
+            return self.aborted or (
+                self.finished and not self._blocks and self._current is None
+            )
+
+
+class PCMStream:
+    """
+    Handle to a PCM stream played by the engine, for audio that arrives in chunks.
+    Writing never blocks: chunks are queued as PCM bytes and only converted to
+    float32 at mix time. Each write returns a future to await before writing
+    more, resolved once the queued audio is within max_buffered seconds.
+    """
+
+    def __init__(self, source, sample_rate, channels, sample_width):
+        self._source = source
+        self.frame_size = channels * sample_width
+        self._partial = bytearray()  # Bytes of a frame split across chunks
+
+    def write(self, data):
+        """Queue PCM bytes, holding back an incomplete trailing frame. Returns a future."""
+        data = memoryview(data)
+        if self._partial:
+            data = self._partial + data
+            self._partial = bytearray()
+        complete = len(data) - len(data) % self.frame_size
+        if complete < len(data):
+            self._partial += data[complete:]
+        if complete:
+            self._source.add(bytes(data[:complete]))
+        return self._source.space()
+
+    def finish(self):
+        """Mark the end of the stream. Returns a future resolved once it has been played."""
+        self._source.finished = True
+        return self._source.done
+
+    def abort(self):
+        """Stop the stream as soon as possible, dropping the queued audio."""
+        self._source.abort()
+        return self._source.done
+
+
+class AudioEngine:
+    """
+    Owns one long-lived output stream, fed by a mixing thread.
+    Feedback cues (preloaded and cached at start) and TTS PCM streams are
+    submitted through a priority queue and mixed together, lower priority
+    sources being ducked while a higher priority one plays. Callers only
+    enqueue and get back a future resolved when their audio has been played.
+    """
+
+    def __init__(
+        self,
+        cue_dir=CUE_DIR,
+        sample_rate=AUDIO_ENGINE_SAMPLE_RATE,
+        block_size=AUDIO_ENGINE_BLOCK_SIZE,
+    ):
+        self.cue_dir = cue_dir
+        self.sample_rate = sample_rate
+        self.block_size = block_size
+        self._cues = {}  # path -> samples
+        self._requests = queue.PriorityQueue()
+        self._order = itertools.count()
+        self._stream = None
+        self._stopping = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="audio-engine", daemon=True
+        )
+
+    def start(self):
+        """Preload the cues, open the output stream and start the mixing thread."""
+        if os.path.isdir(self.cue_dir):
+            for name in sorted(os.listdir(self.cue_dir)):
+                if name.endswith(".wav"):
+                    self._load_cue(os.path.join(self.cue_dir, name))
+        try:
+            self._stream = sd.OutputStream(
+                samplerate=self.sample_rate, channels=1, dtype="float32"
+            )
+            self._stream.start()
+        except Exception as e:
+            print(f"Warning: No audio output available: {e}")
+            self._stream = None
+        self._thread.start()
+        return self
+
+    def play_file(self, path, priority=PRIORITY_CUE):
+        """Queue a WAV file (cached after the first use). Returns a completion future."""
+        source = _Source(priority, path=path)
+        source.finished = True
+        self._submit(source)
+        return source.done
+
+    def open_stream(
+        self,
+        sample_rate,
+        channels,
+        sample_width,
+        priority=PRIORITY_SPEECH,
+        max_buffered=AUDIO_ENGINE_MAX_BUFFERED,
+    ):
+        """Open a PCM stream, played as its chunks are written."""
+        source = _Source(
+            priority,
+            convert=lambda data: pcm_to_samples(
+                data, sample_rate, channels, sample_width, self.sample_rate
+            ),
+            max_buffered=int(max_buffered * sample_rate) * channels * sample_width,
+        )
+        self._submit(source)
+        return PCMStream(source, sample_rate, channels, sample_width)
+
+    def close(self, timeout=5.0):
+        """
+        Play what is queued, within timeout seconds, then close the output stream.
+        Streams still playing or unfinished after timeout are dropped.
+        """
+        self._requests.put((float("inf"), next(self._order), None))
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            self._stopping.set()
+            self._thread.join(timeout)
+
+    def _submit(self, source):
+        # Higher priorities first, then first come first served
+        self._requests.put((-source.priority, next(self._order), source))
+
+    def _load_cue(self, path):
+        """Load a WAV file into the cache. Returns its samples, or None if missing."""
+        if path in self._cues:
+            return self._cues[path]
+        if not os.path.exists(path):
+            print("Warning: Audio file does not exist:", path)
+            return None
+        with wave.open(path, "rb") as f:
+            samples = pcm_to_samples(
+                f.readframes(f.getnframes()),
+                f.getframerate(),
+                f.getnchannels(),
+                f.getsampwidth(),
+                self.sample_rate,
+            )
+        self._cues[path] = samples
+        return samples
+
+    @staticmethod
+    def _complete(source):
+        """Resolve the completion future of a source, once."""
+        source.release()
+        if not source.done.done():
+            source.done.set_result(None)
+
+    def _run(self):
+        """Mixing thread: admit queued sources and write mixed blocks until closed."""
+        active = []
+        closing = False
+        try:
+            while not (closing and not active):
+                # Sleep on the queue while nothing is playing
+                while not closing:
+                    try:
+                        _, _, source = self._requests.get(block=not active)
+                    except queue.Empty:
+                        break
+                    if source is None:
+                        closing = True
+                        break
+                    if source.path is not None:
+                        try:
+                            samples = self._load_cue(source.path)
+                        except Exception as e:
+                            print(
+                                f"Warning: Could not load audio file {source.path}: {e}"
+                            )
+                            samples = None
+                        if samples is not None:
+                            source.add(samples)
+                    active.append(source)
+
+                if self._stopping.is_set():
+                    for source in active:
+                        source.abort()
+                playing = [source for source in active if not source.exhausted()]
+                for source in active:
+                    if source not in playing:
+                        self._complete(source)
+                active = playing
+                if not active:
+                    continue
+                if self._stream is None:
+                    for source in active:
+                        source.abort()
+                    continue
+
+                block = np.zeros(self.block_size, np.float32)
+                top = max(source.priority for source in active)
+                for source in active:
+                    gain = 1.0 if source.priority == top else DUCK_GAIN
+                    offset = 0
+                    try:
+                        for part in source.read(self.block_size):
+                            block[offset : offset + len(part)] += gain * part
+                            offset += len(part)
+                    except Exception as e:
+                        # Drop the faulty source, keep playing the others
+                        print(f"Warning: Dropping an audio source: {e}")
+                        source.abort()
+                np.clip(block, -1.0, 1.0, out=block)
+                self._stream.write(block)  # Paces the loop to real time
+        except Exception as e:
+            print(f"❌ Audio engine stopped: {e}")
+        finally:
+            for source in active:
+                self._complete(source)
+            if self._stream is not None:
+                self._stream.stop()
+                self._stream.close()
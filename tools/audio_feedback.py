@@ -1,40 +1,31 @@
-import simpleaudio as sa
 import os
 
+from tools.audio_engine import CUE_DIR, get_audio_engine
+
 # Reference the audio feedback folder
-AUDIO_FEEDBACK_DIR = os.path.join(os.getcwd(), "assets")
+AUDIO_FEEDBACK_DIR = CUE_DIR
 
 def play_audio(audio_file, audio_feedback_dir=AUDIO_FEEDBACK_DIR):
 	# The file needs to be .wav
 	audio_path = os.path.join(audio_feedback_dir, audio_file)
 
-	# Check if the .wav file exists
-	if not os.path.exists(audio_path):
-		print("Warning: Audio file does not exist:", audio_path)
-		return
-
-	# Load the wave file
-	wave_obj = sa.WaveObject.from_wave_file(audio_path)
-
-	# Play the wave file
-	play_obj = wave_obj.play()
-
-	# Wait for playback to finish
-	play_obj.wait_done()
+	# Queue it on the audio engine, without waiting for playback.
+	# Returns a future resolved once the cue has been played.
+	return get_audio_engine().play_file(audio_path)
 
 def startup():
-	play_audio("startup.wav")
+	return play_audio("startup.wav")
 
 def short_startup():
-	play_audio("imsirdavid.wav")
+	return play_audio("imsirdavid.wav")
 
 def turnoff():
-	play_audio("turnoff.wav")
+	return play_audio("turnoff.wav")
 
 def cant_see():
-	play_audio("icantsee.wav")
+	return play_audio("icantsee.wav")
 def i_see():
-	play_audio("isee.wav")
+	return play_audio("isee.wav")
     
 def new_turn():
-	play_audio("new_turn.wav")
\ No newline at end of file
+	return play_audio("new_turn.wav")
\ No newline at end of file
@@ -3,15 +3,611 @@ import asyncio
 import base64
 import errno
 import io
+import math
 import numpy as np
 from PIL import Image
 import imageio
 import boto3
-from datetime import datetime
+import time
+import threading
+from collections import deque
+from contextlib import contextmanager
+from typing import NamedTuple, Optional, Tuple
 
 import tools.audio_feedback as audio_feedback
+from models import ImageCodec, ImageProfile
+from tools.frame_uploader import FrameUploader
+from tools.frame_store import (
+    FrameStore,
+    FRAME_STORE_MAX_MB,
+    FRAME_STORE_MAX_AGE_HOURS,
+)
 
 MOVEMENT_DEFAULT_THRESHOLD = 4
+FRAME_BUFFER_DEFAULT_SIZE = 8
+FRAME_MAX_AGE_DEFAULT = 2.0  # seconds after which a buffered frame is dropped
+FRAME_GRABBER_MAX_READ_ERRORS = 20  # consecutive read errors before the grabber stops
+FRAME_GRABBER_RESUME_SKIP = 2  # frames read after a pause that may predate its end
+GATE_SIZE = 80  # longest side of the low-resolution view used for quality/motion gating
+MOTION_GRID = (8, 8)  # rows, columns of blocks compared by the motion detector
+MOTION_LEARNING_SHIFT = 3  # background learns 1 / 2**shift of the difference per frame
+BACKGROUND_FRACTION_BITS = 4  # fixed point precision of the int16 background
+MOTION_NOISE_FACTOR = 3.0  # active blocks score above this many times the noise floor
+IDLE_AFTER_DARK_FRAMES = 10  # consecutive rejected frames before entering idle
+IDLE_INTERVAL_MIN = 0.2  # seconds between brightness probes right after entering idle
+IDLE_INTERVAL_MAX = 5.0  # backoff cap for brightness probes in idle
+IDLE_WAKE_DELTA = 8  # brightness change (gray levels) that wakes a uniform scene
+PROBE_SIZE = 16  # longest side of the view used by the idle brightness probe
+CAPTURE_STATE_ACTIVE = "active"
+CAPTURE_STATE_IDLE = "idle"
+SAMPLE_RATE_DEFAULT_MIN = 1.0  # frames/sec analysed when the scene is quiet
+SAMPLE_RATE_DEFAULT_MAX = 5.0  # frames/sec analysed right after motion
+SAMPLE_RATE_DECAY = 10.0  # seconds for the boost after motion to decay by 1/e
+SAMPLING_METRICS_WINDOW = 60.0  # seconds of samples used for the effective rate
+WARM_FRAME_MAX_AGE_DEFAULT = 3.0  # seconds a good frame can answer a record, 0 disables
+DEFAULT_IMAGE_PROFILE = ImageProfile()
+IMAGE_FORMATS = {  # PIL format and MIME type of each codec
+    ImageCodec.JPEG: ("JPEG", "image/jpeg"),
+    ImageCodec.WEBP: ("WEBP", "image/webp"),
+}
+
+
+class CapturedFrame:
+    """
+    A frame accepted by the camera, resized by the image profile of the mode.
+    The payload is encoded with the profile's codec lazily and only once, so
+    frames that are rejected by the capture loops never pay for encoding.
+    """
+
+    def __init__(self, image, timestamp=None, profile=DEFAULT_IMAGE_PROFILE):
+        self.image = image  # Resized PIL image
+        self.timestamp = timestamp if timestamp is not None else time.time()
+        self.profile = profile
+        self.encode_time = None  # Seconds spent encoding the payload
+        self._payload = None
+        self._data_url = None
+
+    @property
+    def detail(self):
+        """Detail level the VLM should use for this frame."""
+        return self.profile.detail
+
+    @property
+    def mime_type(self):
+        """MIME type of the encoded payload."""
+        return IMAGE_FORMATS[ImageCodec(self.profile.codec)][1]
+
+    @property
+    def payload(self):
+        """Bytes of the frame, encoded with the codec and quality of the profile."""
+        if self._payload is None:
+            start = time.perf_counter()
+            buffered = io.BytesIO()
+            self.image.save(
+                buffered,
+                format=IMAGE_FORMATS[ImageCodec(self.profile.codec)][0],
+                quality=self.profile.quality,
+            )
+            self._payload = buffered.getvalue()
+            self.encode_time = time.perf_counter() - start
+        return self._payload
+
+    @property
+    def data_url(self):
+        """Data URL for the VLM payload, built with a single bytes-to-str decode."""
+        if self._data_url is None:
+            data_url = bytearray(f"data:{self.mime_type};base64,".encode("ascii"))
+            data_url += base64.b64encode(self.payload)
+            self._data_url = data_url.decode("ascii")
+        return self._data_url
+
+    @property
+    def base64(self):
+        """Base64 string of the encoded payload."""
+        return self.data_url.partition(",")[2]
+
+    def encode(self):
+        """Force encoding (meant to run in executor before handing the frame out)."""
+        return self.data_url
+
+
+class FrameStatistics:
+    """
+    Brightness and colour dispersion statistics computed directly on an RGB
+    uint8 array, without PIL colour-space round trips.
+    Luminance and HSV follow PIL's "L" and "HSV" conversions so the camera
+    thresholds keep their meaning. Intermediate buffers are preallocated per
+    frame shape (and per thread, since frames are processed in executors).
+    """
+
+    def __init__(self, single_pass=False):
+        self.single_pass = single_pass
+        self._local = threading.local()
+
+    def _buffers(self, shape):
+        """Return the preallocated buffers for the given (height, width)."""
+        buffers = getattr(self._local, "buffers", None)
+        if buffers is None or buffers["shape"] != shape:
+            buffers = {
+                "shape": shape,
+                "luma": np.empty(shape, dtype=np.int32),
+                "gray": np.empty(shape, dtype=np.uint8),
+                "tmp_int": np.empty(shape, dtype=np.int32),
+                "maxc": np.empty(shape, dtype=np.uint8),
+                "minc": np.empty(shape, dtype=np.uint8),
+                "delta": np.empty(shape, dtype=np.float32),
+                "hue": np.empty(shape, dtype=np.float32),
+                "sat": np.empty(shape, dtype=np.float32),
+                "tmp": np.empty(shape, dtype=np.float32),
+                "mask": np.empty(shape, dtype=bool),
+                "tmp_mask": np.empty(shape, dtype=bool),
+            }
+            self._local.buffers = buffers
+        return buffers
+
+    def luminance(self, rgb):
+        """
+        Grayscale uint8 view of an RGB uint8 array, same fixed point formula as
+        PIL's "L" conversion. The returned buffer is reused by the next call.
+        """
+        buf = self._buffers(rgb.shape[:2])
+        luma, tmp_int = buf["luma"], buf["tmp_int"]
+        np.multiply(rgb[:, :, 0], 19595, out=luma, dtype=np.int32)
+        np.multiply(rgb[:, :, 1], 38470, out=tmp_int, dtype=np.int32)
+        luma += tmp_int
+        np.multiply(rgb[:, :, 2], 7471, out=tmp_int, dtype=np.int32)
+        luma += tmp_int
+        luma += 0x8000
+        luma >>= 16
+        np.copyto(buf["gray"], luma, casting="unsafe")
+        return buf["gray"]
+
+    def compute(self, rgb):
+        """Return (average_intensity, hue_std, sat_std) for an RGB uint8 array."""
+        buf = self._buffers(rgb.shape[:2])
+        r, g, b = rgb[:, :, 0], rgb[:, :, 1], rgb[:, :, 2]
+
+        gray = self.luminance(rgb)
+
+        # HSV hue and saturation, same as PIL's rgb2hsv (scaled to 0-255 and truncated)
+        maxc, minc = buf["maxc"], buf["minc"]
+        delta, hue, sat, tmp = buf["delta"], buf["hue"], buf["sat"], buf["tmp"]
+        mask, tmp_mask = buf["mask"], buf["tmp_mask"]
+
+        np.maximum(r, g, out=maxc)
+        np.maximum(maxc, b, out=maxc)
+        np.minimum(r, g, out=minc)
+        np.minimum(minc, b, out=minc)
+        np.subtract(maxc, minc, out=delta, dtype=np.float32)
+
+        # Saturation: delta / max (0 where the pixel is grey, including black)
+        np.maximum(maxc, 1, out=tmp, dtype=np.float32)
+        np.divide(delta, tmp, out=sat)
+        sat *= 255.0
+        np.floor(sat, out=sat)
+
+        # Hue: pick the sector by the dominant channel, guard grey pixels
+        np.maximum(delta, 1.0, out=tmp)
+        np.subtract(g, b, out=hue, dtype=np.float32)  # red is max
+        np.equal(g, maxc, out=mask)
+        np.not_equal(r, maxc, out=tmp_mask)
+        mask &= tmp_mask  # green is max
+        np.copyto(hue, np.subtract(b, r, dtype=np.float32) + 2.0 * tmp, where=mask)
+        np.not_equal(g, maxc, out=mask)
+        mask &= tmp_mask  # blue is max
+        np.copyto(hue, np.subtract(r, g, dtype=np.float32) + 4.0 * tmp, where=mask)
+        hue /= tmp
+        hue /= 6.0
+        hue += 1.0
+        np.fmod(hue, 1.0, out=hue)
+        hue *= 255.0
+        np.floor(hue, out=hue)
+        np.equal(delta, 0.0, out=mask)
+        hue[mask] = 0.0
+
+        average_intensity, _ = self._mean_std(gray)
+        _, hue_std = self._mean_std(hue)
+        _, sat_std = self._mean_std(sat)
+        return average_intensity, hue_std, sat_std
+
+    def _mean_std(self, values):
+        """Mean and standard deviation, optionally in a single float32 pass."""
+        if not self.single_pass:
+            return float(values.mean()), float(values.std())
+
+        flat = values.reshape(-1)
+        if flat.dtype != np.float32:
+            flat = flat.astype(np.float32)
+        n = flat.size
+        total = flat.sum(dtype=np.float32)
+        total_sq = np.dot(flat, flat)
+        mean = total / n
+        variance = max(float(total_sq / n - mean * mean), 0.0)
+        return float(mean), variance**0.5
+
+
+class MotionResult(NamedTuple):
+    """Outcome of a motion detector update."""
+
+    detected: bool
+    score: float  # Highest block difference, in gray levels
+    active_fraction: float  # Fraction of blocks above the threshold
+    bbox: Optional[
+        Tuple[float, float, float, float]
+    ]  # Changed blocks (x0, y0, x1, y1), relative to the frame
+
+
+class MotionDetector:
+    """
+    Block-wise motion detector against an exponential running-average background.
+    The background is kept as fixed point int16 and updated in place. Frames are
+    compared with the background scaled by a global gain, from the spread of
+    their block brightness, and the remaining median block offset is removed, so
+    the whole scene dimming or brightening (auto exposure, clouds, flicker)
+    does not count as motion. A block is active when it scores above threshold
+    and above noise_factor times the noise floor, a running average of the
+    lower quartile of the block scores, so sensor noise does not count either.
+    """
+
+    def __init__(
+        self,
+        threshold=MOVEMENT_DEFAULT_THRESHOLD,
+        grid=MOTION_GRID,
+        learning_shift=MOTION_LEARNING_SHIFT,
+        min_active_fraction=0.0,
+        noise_factor=MOTION_NOISE_FACTOR,
+    ):
+        self.threshold = threshold
+        self.grid = grid
+        self.learning_shift = learning_shift
+        self.min_active_fraction = min_active_fraction
+        self.noise_factor = noise_factor
+        self.noise_floor = None  # Block score of a static scene
+        self._background = None  # int16, gray << BACKGROUND_FRACTION_BITS
+        self._diff = None  # int16 work buffer
+        self._residual = None  # float32 work buffer
+        self._update_step = None  # int16 work buffer
+
+    def reset(self):
+        """Forget the background model."""
+        self._background = None
+        self.noise_floor = None
+
+    def _block_means(self, image):
+        """Mean of each block of the grid."""
+        rows, cols = self.grid
+        blocks = image.reshape(
+            rows, image.shape[0] // rows, cols, image.shape[1] // cols
+        )
+        return blocks.mean(axis=(1, 3))
+
+    @staticmethod
+    def _spread(values):
+        """Interquartile range of the values."""
+        values = np.sort(values, axis=None)
+        return values[len(values) * 3 // 4] - values[len(values) // 4]
+
+    def update(self, gray):
+        """
+        Compare a uint8 grayscale frame with the background, then blend it in.
+        Returns a MotionResult.
+        """
+        rows, cols = self.grid
+        block_h, block_w = gray.shape[0] // rows, gray.shape[1] // cols
+        gray = gray[: block_h * rows, : block_w * cols]
+
+        if self._background is None or self._background.shape != gray.shape:
+            self._background = np.left_shift(
+                gray, BACKGROUND_FRACTION_BITS, dtype=np.int16
+            )
+            self._diff = np.empty(gray.shape, dtype=np.int16)
+            self._residual = np.empty(gray.shape, dtype=np.float32)
+            self._update_step = np.empty(gray.shape, dtype=np.int16)
+            self.noise_floor = None
+            return MotionResult(False, 0.0, 0.0, None)
+
+        # Signed difference from the background, in fixed point
+        diff = self._diff
+        np.left_shift(gray, BACKGROUND_FRACTION_BITS, out=diff, dtype=np.int16)
+        diff -= self._background
+
+        # Global gain, ratio of the interquartile ranges of the block brightness,
+        # which an additive shift leaves unchanged, then the remaining global
+        # offset, the median block difference once the gain is applied
+        background_means = self._block_means(self._background)
+        current_means = background_means + self._block_means(diff)
+        background_spread = self._spread(background_means)
+        gain = (
+            self._spread(current_means) / background_spread
+            if background_spread
+            else 1.0
+        )
+        offset = np.median(current_means - gain * background_means)
+
+        # Residual against the lighting-corrected background:
+        # diff + (1 - gain) * background - offset
+        residual = self._residual
+        np.multiply(self._background, 1.0 - gain, out=residual)
+        residual += diff
+        residual -= offset
+
+        # Running average: background += diff * alpha
+        np.right_shift(diff, self.learning_shift, out=self._update_step)
+        self._background += self._update_step
+
+        # Score blocks
+        np.abs(residual, out=residual)
+        block_scores = self._block_means(residual) / (1 << BACKGROUND_FRACTION_BITS)
+
+        # Most blocks are static: their scores follow the noise floor
+        quiet = np.sort(block_scores, axis=None)[block_scores.size // 4]
+        if self.noise_floor is None:
+            self.noise_floor = float(quiet)
+        else:
+            self.noise_floor += (quiet - self.noise_floor) / (1 << self.learning_shift)
+
+        threshold = max(self.threshold, self.noise_factor * self.noise_floor)
+        active = block_scores > threshold
+        active_fraction = float(active.mean())
+        bbox = None
+        if active_fraction > 0:
+            active_rows = np.flatnonzero(active.any(axis=1))
+            active_cols = np.flatnonzero(active.any(axis=0))
+            bbox = (
+                float(active_cols[0] / cols),
+                float(active_rows[0] / rows),
+                float((active_cols[-1] + 1) / cols),
+                float((active_rows[-1] + 1) / rows),
+            )
+
+        return MotionResult(
+            detected=active_fraction > self.min_active_fraction,
+            score=float(block_scores.max()),
+            active_fraction=active_fraction,
+            bbox=bbox,
+        )
+
+
+class SamplingScheduler:
+    """
+    Adaptive sampling rate for movement detection.
+    The rate jumps to max_rate when motion is detected and decays
+    exponentially toward min_rate while the scene stays quiet.
+    """
+
+    def __init__(
+        self,
+        min_rate=SAMPLE_RATE_DEFAULT_MIN,
+        max_rate=SAMPLE_RATE_DEFAULT_MAX,
+        decay=SAMPLE_RATE_DECAY,
+    ):
+        self.decay = decay
+        self.configure(min_rate, max_rate)
+        self.last_motion_time = None
+        self._samples = deque()  # Timestamps of analysed frames
+        self._previous_frame_time = None
+        self._detection_latencies = deque(maxlen=100)
+
+    def configure(self, min_rate, max_rate):
+        """Set the idle (min) and post-motion (max) rates, in frames/sec."""
+        self.min_rate = min_rate
+        self.max_rate = max(max_rate, min_rate)
+
+    def current_rate(self, now=None):
+        """Sampling rate at the given time, in frames/sec."""
+        if self.last_motion_time is None:
+            return self.min_rate
+        now = time.time() if now is None else now
+        boost = math.exp(-(now - self.last_motion_time) / self.decay)
+        return self.min_rate + (self.max_rate - self.min_rate) * boost
+
+    def interval(self, now=None):
+        """Seconds to wait before analysing the next frame."""
+        return 1.0 / self.current_rate(now)
+
+    def record_sample(self, frame_time, motion_detected, now=None):
+        """
+        Register an analysed frame. On motion, the detection latency is estimated
+        from the midpoint between the previous and current sampled frames,
+        since the motion started somewhere in between.
+        """
+        now = time.time() if now is None else now
+        self._samples.append(now)
+        while self._samples and now - self._samples[0] > SAMPLING_METRICS_WINDOW:
+            self._samples.popleft()
+
+        if motion_detected:
+            if self._previous_frame_time is not None:
+                onset = (self._previous_frame_time + frame_time) / 2
+                self._detection_latencies.append(now - onset)
+            self.last_motion_time = now
+        self._previous_frame_time = frame_time
+
+    def metrics(self):
+        """Effective sampling rate and motion-to-detection latency."""
+        effective_rate = 0.0
+        if len(self._samples) > 1:
+            span = self._samples[-1] - self._samples[0]
+            effective_rate = (len(self._samples) - 1) / span if span > 0 else 0.0
+        latencies = self._detection_latencies
+        return {
+            "current_rate": self.current_rate(),
+            "effective_rate": effective_rate,
+            "last_detection_latency": latencies[-1] if latencies else None,
+            "mean_detection_latency": (
+                sum(latencies) / len(latencies) if latencies else None
+            ),
+        }
+
+
+class FrameGrabber:
+    """
+    Reads frames from an imageio reader on a dedicated thread and keeps the
+    most recent ones in a small timestamped ring buffer, so consumers always
+    get the freshest frame without an executor round trip per frame.
+    Frames older than max_age seconds are dropped automatically.
+    The thread only reads while a consumer has resumed it, so the camera is
+    not decoded between captures. After max_read_errors consecutive read
+    errors it stops, and the error is raised to the consumers.
+    """
+
+    def __init__(
+        self,
+        reader,
+        buffer_size=FRAME_BUFFER_DEFAULT_SIZE,
+        max_age=FRAME_MAX_AGE_DEFAULT,
+        max_read_errors=FRAME_GRABBER_MAX_READ_ERRORS,
+    ):
+        self.reader = reader
+        self.max_age = max_age
+        self.max_read_errors = max_read_errors
+        self.error = None  # Error that stopped the grabber, if any
+        self._frames = deque(maxlen=buffer_size)  # (timestamp, frame) pairs
+        self._waiters = []  # (loop, future) pairs waiting for the next frame
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._streaming = threading.Event()  # Set while at least one consumer reads
+        self._consumers = 0
+        self._thread = threading.Thread(
+            target=self._run, name="frame-grabber", daemon=True
+        )
+
+    def start(self):
+        """Start the grabber thread."""
+        self._thread.start()
+        return self
+
+    def resume(self):
+        """Start reading frames for one more consumer."""
+        with self._lock:
+            self._consumers += 1
+            self._streaming.set()
+
+    def pause(self):
+        """Stop reading frames once no consumer needs them anymore."""
+        with self._lock:
+            self._consumers -= 1
+            if self._consumers == 0:
+                self._streaming.clear()
+                self._frames.clear()  # Would be stale by the time reading resumes
+
+    @contextmanager
+    def streaming(self):
+        """Keep the grabber reading frames while the block runs."""
+        self.resume()
+        try:
+            yield self
+        finally:
+            self.pause()
+
+    def _run(self):
+        """Grabber thread: keep the ring buffer filled with the newest frames."""
+        errors = 0
+        skip = 0
+        while not self._stop.is_set():
+            if not self._streaming.is_set():
+                # Paused: the camera and ffmpeg hold on to the frames they had
+                self._streaming.wait(timeout=0.5)
+                skip = FRAME_GRABBER_RESUME_SKIP
+                continue
+
+            try:
+                frame = self.reader.get_next_data()
+            except Exception as e:
+                if self._stop.is_set():
+                    break
+                errors += 1
+                if errors >= self.max_read_errors:
+                    self._fail(
+                        IOError(f"Camera stopped after {errors} read errors: {e}")
+                    )
+                    return
+                print(f"Frame grabber read error: {e}")
+                time.sleep(0.1)
+                continue
+
+            errors = 0
+            if skip:
+                skip -= 1
+                continue
+
+            timestamp = time.time()
+            with self._lock:
+                if not self._consumers:
+                    continue  # Paused while reading, the frame would go stale
+                self._frames.append((timestamp, frame))
+                self._drop_stale(timestamp)
+                waiters, self._waiters = self._waiters, []
+
+            for loop, future in waiters:
+                loop.call_soon_threadsafe(_resolve_future, future, (timestamp, frame))
+
+    def _fail(self, error):
+        """Stop the grabber on error, failing the waiting consumers with it."""
+        print(f"❌ Frame grabber stopped: {error}")
+        with self._lock:
+            self.error = error
+            waiters, self._waiters = self._waiters, []
+        for loop, future in waiters:
+            loop.call_soon_threadsafe(_fail_future, future, error)
+
+    def _drop_stale(self, now):
+        """Drop frames older than max_age (caller holds the lock)."""
+        while self._frames and now - self._frames[0][0] > self.max_age:
+            self._frames.popleft()
+
+    def latest(self):
+        """Return the freshest (timestamp, frame) pair, or None if all are stale."""
+        with self._lock:
+            self._drop_stale(time.time())
+            return self._frames[-1] if self._frames else None
+
+    def recent(self, n=None):
+        """Return the last n fresh (timestamp, frame) pairs, oldest first."""
+        with self._lock:
+            self._drop_stale(time.time())
+            frames = list(self._frames)
+        return frames if n is None else frames[-n:]
+
+    async def next_frame(self, newer_than=0.0):
+        """
+        Return the freshest (timestamp, frame) pair newer than the given timestamp,
+        waiting for the grabber thread only if no such frame is buffered.
+        Must be called while the grabber is resumed. Raises the error that
+        stopped the grabber, if any.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self._drop_stale(time.time())
+            if self._frames and self._frames[-1][0] > newer_than:
+                return self._frames[-1]
+            if self.error is not None:
+                raise self.error
+            if not self._consumers:
+                raise RuntimeError("The frame grabber is paused, resume it first")
+            future = loop.create_future()
+            self._waiters.append((loop, future))
+        return await future
+
+    def close(self):
+        """Stop the grabber thread and close the underlying reader."""
+        self._stop.set()
+        self._streaming.set()
+        if self._thread.is_alive():
+            self._thread.join(timeout=2)
+        self.reader.close()
+
+
+def _resolve_future(future, result):
+    """Set a future result unless its waiter already gave up."""
+    if not future.done():
+        future.set_result(result)
+
+
+def _fail_future(future, error):
+    """Set a future exception unless its waiter already gave up."""
+    if not future.done():
+        future.set_exception(error)
 
 
 class Camera:
@@ -24,6 +620,9 @@ class Camera:
         hue_uniformity_threshold,
         saturation_uniformity_threshold,
         movement_threshold=None,
+        frame_max_age=None,
+        single_pass_stats=None,
+        warm_frame_max_age=None,
     ):
         print(
             f"Instantiating camera with thresholds: {darkness_threshold}, {hue_uniformity_threshold}, {saturation_uniformity_threshold}, movement: {movement_threshold}"
@@ -32,6 +631,7 @@ class Camera:
         self.darkness_threshold = int(darkness_threshold)
 
         # S3 configuration
+        self.uploader = None
         self.use_s3 = os.environ.get("USE_S3_STORAGE", "false").lower() == "true"
         self.s3_bucket = os.environ.get("S3_BUCKET_NAME")
         self.s3_prefix = os.environ.get("S3_KEY_PREFIX", "narrator-frames")
@@ -44,6 +644,19 @@ class Camera:
 
             try:
                 self.s3_client = boto3.client("s3")
+                spill_max_mb = float(os.environ.get("S3_SPILL_MAX_MB", "200"))
+                spill_max_age_hours = float(
+                    os.environ.get("S3_SPILL_MAX_AGE_HOURS", "24")
+                )
+                self.uploader = FrameUploader(
+                    self.s3_client,
+                    self.s3_bucket,
+                    spill_dir=os.path.join(frames_dir, "spill"),
+                    queue_size=int(os.environ.get("S3_UPLOAD_QUEUE_SIZE", "32")),
+                    workers=int(os.environ.get("S3_UPLOAD_WORKERS", "2")),
+                    max_spill_bytes=spill_max_mb * 1024 * 1024,
+                    max_spill_age=spill_max_age_hours * 3600,
+                ).start()
                 print(
                     f"🪣 S3 storage enabled: bucket={self.s3_bucket}, prefix={self.s3_prefix}"
                 )
@@ -61,16 +674,48 @@ class Camera:
             if movement_threshold is not None
             else MOVEMENT_DEFAULT_THRESHOLD
         )
-        self.previous_frame = None  # Store previous frame for movement detection
+        self.frame_max_age = (
+            float(frame_max_age) if frame_max_age is not None else FRAME_MAX_AGE_DEFAULT
+        )
+        self.warm_frame_max_age = (
+            float(warm_frame_max_age)
+            if warm_frame_max_age is not None
+            else WARM_FRAME_MAX_AGE_DEFAULT
+        )
+        self.warm_raw = None  # (timestamp, raw frame) last passing the quality check
+        self.warm_frame = None  # CapturedFrame built from warm_raw, on first use
+        self.warm_frame_stats = {"hits": 0, "misses": 0}
+        self.frame_statistics = FrameStatistics(
+            single_pass=str(single_pass_stats).lower() == "true"
+        )
+        self.motion_detector = MotionDetector(threshold=self.movement_threshold)
+        self.last_motion = None  # Last MotionResult, for reporting
+        self.sampling_scheduler = SamplingScheduler()
+        self.capture_state = CAPTURE_STATE_ACTIVE
+        self.capture_state_times = {CAPTURE_STATE_ACTIVE: 0.0, CAPTURE_STATE_IDLE: 0.0}
+        self._capture_state_since = time.time()
         os.makedirs(self.frames_dir, exist_ok=True)
+        self.frame_store = FrameStore(
+            frames_dir,
+            max_bytes=float(os.environ.get("FRAME_STORE_MAX_MB", FRAME_STORE_MAX_MB))
+            * 1024
+            * 1024,
+            max_age=float(
+                os.environ.get("FRAME_STORE_MAX_AGE_HOURS", FRAME_STORE_MAX_AGE_HOURS)
+            )
+            * 3600,
+        )
         print(f"Camera instantiated.")
 
     async def get_camera(self, camera="<video0>"):
-        """Async version of camera initialization."""
+        """
+        Async version of camera initialization.
+        Returns a started FrameGrabber wrapping the imageio reader.
+        """
         while True:
             try:
                 reader = imageio.get_reader(camera)
-                return reader
+                return FrameGrabber(reader, max_age=self.frame_max_age).start()
             except IOError:
                 # Wait a bit and retry (non-blocking)
                 await asyncio.sleep(0.1)
@@ -91,165 +736,309 @@ class Camera:
                 # File is being written to, wait a bit and retry (non-blocking)
                 await asyncio.sleep(0.1)
 
-    async def capture(self, reader, *, debugging=False):
-        """Async version of frame capture."""
+    async def capture(self, reader, *, debugging=False, profile=DEFAULT_IMAGE_PROFILE):
+        """
+        Async version of frame capture.
+        After IDLE_AFTER_DARK_FRAMES rejected frames the camera goes idle: it only
+        runs a cheap brightness probe, with exponential backoff between probes,
+        and wakes up as soon as the brightness crosses the threshold or changes.
+        The grabber is paused between probes, so idle frames are not decoded.
+        """
         if debugging:
             print("Started camera debugging")
 
         is_dark_or_uniform = True
         count_frames = 0
+        dark_streak = 0
+        last_timestamp = 0.0
+        loop = asyncio.get_running_loop()
+        self._set_capture_state(CAPTURE_STATE_ACTIVE)
 
-        while is_dark_or_uniform or debugging:
-            # Get frame in executor to avoid blocking if needed
-            loop = asyncio.get_running_loop()
-            frame = await loop.run_in_executor(None, reader.get_next_data)
+        with reader.streaming():
+            while is_dark_or_uniform or debugging:
+                # Get the freshest frame from the grabber
+                last_timestamp, frame = await reader.next_frame(last_timestamp)
 
-            # Process frame (CPU-bound, run in executor)
-            img_str, is_dark_or_uniform = await loop.run_in_executor(
-                None, self._process_frame, frame, count_frames, debugging
-            )
+                if self.capture_state == CAPTURE_STATE_IDLE:
+                    brightness = self._probe_brightness(frame)
+                    if not self._should_wake(brightness, idle_reference):
+                        # Stop decoding frames until the next probe
+                        reader.pause()
+                        try:
+                            await asyncio.sleep(idle_interval)
+                        finally:
+                            reader.resume()
+                        idle_interval = min(idle_interval * 2, IDLE_INTERVAL_MAX)
+                        continue
+                    self._set_capture_state(CAPTURE_STATE_ACTIVE)
+                    dark_streak = 0
 
-            if count_frames % self.PRINT_DEBUG_EACH_N_FRAMES == 0:
-                if is_dark_or_uniform:
-                    print("I can't see...")
-                    audio_feedback.cant_see()
-                    print()
-                elif debugging:
-                    print("I can see clear!")
+                # Process frame (CPU-bound, run in executor)
+                captured, is_dark_or_uniform = await loop.run_in_executor(
+                    None,
+                    self._process_frame,
+                    frame,
+                    count_frames,
+                    debugging,
+                    profile,
+                    last_timestamp,
+                )
+
+                if debugging and count_frames % self.PRINT_DEBUG_EACH_N_FRAMES == 0:
+                    if is_dark_or_uniform:
+                        print("I can't see...")
+                        audio_feedback.cant_see()
+                    else:
+                        print("I can see clear!")
+                        audio_feedback.i_see()
                     print()
-                    audio_feedback.i_see()
 
-            # Count frames for debugging prints
-            count_frames += 1
-            if count_frames == self.PRINT_DEBUG_EACH_N_FRAMES + 1:
-                count_frames = 0
+                # Go idle when the scene stays dark or uniform
+                dark_streak = dark_streak + 1 if is_dark_or_uniform else 0
+                if not debugging and dark_streak >= IDLE_AFTER_DARK_FRAMES:
+                    print("I can't see... going idle until the view changes")
+                    audio_feedback.cant_see()
+                    self._set_capture_state(CAPTURE_STATE_IDLE)
+                    idle_reference = self._probe_brightness(frame)
+                    idle_interval = IDLE_INTERVAL_MIN
+
+                # Count frames for debugging prints
+                count_frames += 1
+                if count_frames == self.PRINT_DEBUG_EACH_N_FRAMES + 1:
+                    count_frames = 0
+
+        # We are out of the loop, so the image is ok: encode it once
+        await loop.run_in_executor(None, captured.encode)
+        self.warm_raw, self.warm_frame = (last_timestamp, frame), captured
+        self._set_capture_state(CAPTURE_STATE_ACTIVE)
+        if self.capture_state_times[CAPTURE_STATE_IDLE] > 0:
+            print(f"⏱️ Capture state times: {self.capture_state_report()}")
+        return captured
+
+    async def refresh_warm_frame(self, reader):
+        """
+        Grab a frame and run the quality check on it, keeping it raw as the
+        warm frame when it passes. Only the gating thumbnail is computed,
+        resizing and encoding wait for a record to take the frame.
+        Returns whether the warm frame changed.
+        """
+        with reader.streaming():
+            latest = await reader.next_frame(self.warm_raw[0] if self.warm_raw else 0.0)
+
+        timestamp, frame = latest
+        loop = asyncio.get_running_loop()
+        is_dark_or_uniform = await loop.run_in_executor(
+            None, self._check_image_quality, self._thumbnail(frame), 1
+        )
+        if is_dark_or_uniform:
+            return False
+        self.warm_raw = latest
+        return True
+
+    async def take_warm_frame(self, profile=DEFAULT_IMAGE_PROFILE, max_age=None):
+        """
+        The warm frame, resized and encoded with profile, if it was grabbed less
+        than max_age seconds ago (warm_frame_max_age by default), else None.
+        A frame is built (and saved) the first time it is taken with a profile.
+        """
+        max_age = self.warm_frame_max_age if max_age is None else max_age
+        if self.warm_raw is None or time.time() - self.warm_raw[0] > max_age:
+            self.warm_frame_stats["misses"] += 1
+            return None
+
+        self.warm_frame_stats["hits"] += 1
+        timestamp, frame = self.warm_raw
+        warm = self.warm_frame
+        if warm is None or warm.timestamp != timestamp or warm.profile != profile:
+            warm = await asyncio.get_running_loop().run_in_executor(
+                None, self._build_warm_frame, frame, timestamp, profile
+            )
+            self.warm_frame = warm
+        return warm
+
+    def _build_warm_frame(self, frame, timestamp, profile):
+        """Resize, save and encode a warm frame (synchronous, meant to run in executor)."""
+        captured = self._accept_frame(frame, profile, timestamp, "frame")
+        captured.encode()
+        return captured
+
+    def _set_capture_state(self, state):
+        """Switch capture state, accounting the time spent in the previous one."""
+        now = time.time()
+        self.capture_state_times[self.capture_state] += now - self._capture_state_since
+        self.capture_state = state
+        self._capture_state_since = now
+
+    def capture_state_report(self):
+        """Seconds spent in each capture state so far."""
+        times = dict(self.capture_state_times)
+        times[self.capture_state] += time.time() - self._capture_state_since
+        return {state: round(seconds, 1) for state, seconds in times.items()}
+
+    def _probe_brightness(self, frame):
+        """Cheap brightness estimate on a tiny strided view of the raw frame."""
+        return float(
+            self.frame_statistics.luminance(self._thumbnail(frame, PROBE_SIZE)).mean()
+        )
 
-        # We are out of the loop, so the image is ok
-        return img_str
+    def _should_wake(self, brightness, idle_reference):
+        """Wake from idle when the scene gets bright enough or visibly changes."""
+        if brightness >= self.darkness_threshold > idle_reference:
+            return True
+        return abs(brightness - idle_reference) > IDLE_WAKE_DELTA
 
-    async def capture_movement(self, reader, *, debugging=False):
+    async def capture_movement(
+        self,
+        reader,
+        *,
+        debugging=False,
+        min_rate=SAMPLE_RATE_DEFAULT_MIN,
+        max_rate=SAMPLE_RATE_DEFAULT_MAX,
+        profile=DEFAULT_IMAGE_PROFILE,
+    ):
         """
         Async version of movement detection capture.
-        Capture frames from the camera until movement is detected.
-        Returns the base64 encoded image when movement is found.
+        Capture frames from the camera until movement is detected, sampling
+        between min_rate and max_rate frames/sec depending on recent motion.
+        Returns the CapturedFrame, resized by profile, when movement is found.
         """
         if debugging:
             print("Started movement detection")
 
         movement_detected = False
         count_frames = 0
+        last_timestamp = 0.0
+        loop = asyncio.get_running_loop()
+        scheduler = self.sampling_scheduler
+        scheduler.configure(min_rate, max_rate)
 
-        while not movement_detected or debugging:
-            # Get frame in executor to avoid blocking if needed
-            loop = asyncio.get_running_loop()
-            frame = await loop.run_in_executor(None, reader.get_next_data)
+        with reader.streaming():
+            while not movement_detected or debugging:
+                sample_start = time.time()
 
-            # Process frame and detect movement (CPU-bound, run in executor)
-            img_str, movement_detected = await loop.run_in_executor(
-                None, self._process_movement_frame, frame, count_frames, debugging
-            )
+                # Get the freshest frame from the grabber
+                last_timestamp, frame = await reader.next_frame(last_timestamp)
 
-            if debugging and (
-                count_frames % self.PRINT_DEBUG_EACH_N_FRAMES == 0 or movement_detected
-            ):
-                if movement_detected:
-                    print("Movement detected!")
-                    audio_feedback.i_see()
-                else:
-                    print("No movement detected...")
-                    audio_feedback.cant_see()
-                print()
+                # Process frame and detect movement (CPU-bound, run in executor)
+                captured, movement_detected = await loop.run_in_executor(
+                    None,
+                    self._process_movement_frame,
+                    frame,
+                    count_frames,
+                    debugging,
+                    profile,
+                )
+                scheduler.record_sample(last_timestamp, movement_detected)
 
-            # Count frames for debugging prints
-            count_frames += 1
-            if count_frames == self.PRINT_DEBUG_EACH_N_FRAMES + 1:
-                count_frames = 0
+                if debugging and (
+                    count_frames % self.PRINT_DEBUG_EACH_N_FRAMES == 0
+                    or movement_detected
+                ):
+                    if movement_detected:
+                        print("Movement detected!")
+                        audio_feedback.i_see()
+                    else:
+                        print("No movement detected...")
+                        audio_feedback.cant_see()
+                    print(f"Sampling: {scheduler.metrics()}")
+                    print()
+
+                # Count frames for debugging prints
+                count_frames += 1
+                if count_frames == self.PRINT_DEBUG_EACH_N_FRAMES + 1:
+                    count_frames = 0
 
-            # Small delay to avoid overwhelming the system (non-blocking)
-            if not movement_detected:
-                await asyncio.sleep(1)
+                # Wait for the next sample, at the rate given by recent motion (non-blocking)
+                if not movement_detected:
+                    elapsed = time.time() - sample_start
+                    await asyncio.sleep(max(0.0, scheduler.interval() - elapsed))
 
         # Movement detected! Save the frame and return
         print("✨ Movement captured!")
-        return img_str
+        metrics = scheduler.metrics()
+        if metrics["last_detection_latency"] is not None:
+            print(
+                f"📈 Sampling at {metrics['effective_rate']:.2f} fps, "
+                f"detected {metrics['last_detection_latency']:.2f}s after motion"
+            )
+        await loop.run_in_executor(None, captured.encode)
+        return captured
 
-    def _process_frame(self, frame, count_frames, debugging):
+    def _process_frame(self, frame, count_frames, debugging, profile, timestamp=None):
         """
         Process a single frame (synchronous, meant to run in executor).
-        Returns tuple of (img_str, is_dark_or_uniform).
+        Returns tuple of (captured_frame, is_dark_or_uniform).
+        The quality gate runs on a low-resolution view of the raw frame, the
+        full resize only happens for accepted frames (captured_frame is None otherwise).
         """
-        # Convert the frame to a PIL image
-        pil_img = Image.fromarray(frame)
-
-        # Resize the image
-        max_size = 500
-        ratio = max_size / max(pil_img.size)
-        new_size = tuple([int(x * ratio) for x in pil_img.size])
-        resized_img = pil_img.resize(new_size, Image.LANCZOS)
-
-        # Convert PIL image to a bytes buffer and encode in base64
-        buffered = io.BytesIO()
-        resized_img.save(buffered, format="JPEG")
-        img_str = base64.b64encode(buffered.getvalue()).decode("utf-8")
-
-        # Check image quality
+        # Check image quality on the gating thumbnail
+        thumbnail = self._thumbnail(frame)
         is_dark_or_uniform = self._check_image_quality(
-            resized_img, count_frames, debugging
+            thumbnail, count_frames, debugging
         )
+        if is_dark_or_uniform:
+            return None, is_dark_or_uniform
 
-        # Save the frame if it's good quality
-        if not is_dark_or_uniform:
-            filename = f"frame_{count_frames}.jpg"
-            self.save_frame(resized_img, filename)
+        # Save the frame since it's good quality
+        captured = self._accept_frame(frame, profile, timestamp, "frame")
+        return captured, is_dark_or_uniform
 
-        return img_str, is_dark_or_uniform
+    def _accept_frame(self, frame, profile, timestamp, kind):
+        """Resize and save a frame that passed the quality check."""
+        resized_img = self._resize_frame(frame, profile.max_side, profile.resample)
+        self.save_frame(resized_img, kind)
+        return CapturedFrame(resized_img, timestamp=timestamp, profile=profile)
 
-    def _process_movement_frame(self, frame, count_frames, debugging):
+    def _process_movement_frame(self, frame, count_frames, debugging, profile):
         """
         Process a single frame for movement detection (synchronous, meant to run in executor).
-        Returns tuple of (img_str, movement_detected).
+        Returns tuple of (captured_frame, movement_detected).
+        Movement is detected on the gating thumbnail, the full resize only
+        happens when movement is found (captured_frame is None otherwise).
         """
-        # Convert the frame to a PIL image
-        pil_img = Image.fromarray(frame)
+        current_gray = self.frame_statistics.luminance(self._thumbnail(frame))
 
-        # Resize the image (same as capture method)
-        max_size = 500
-        ratio = max_size / max(pil_img.size)
-        new_size = tuple([int(x * ratio) for x in pil_img.size])
-        resized_img = pil_img.resize(new_size, Image.LANCZOS)
+        # Check for movement against the background model
+        movement_detected = self._detect_movement(current_gray, count_frames, debugging)
 
-        # Convert PIL image to a bytes buffer and encode in base64
-        buffered = io.BytesIO()
-        resized_img.save(buffered, format="JPEG")
-        img_str = base64.b64encode(buffered.getvalue()).decode("utf-8")
+        if not movement_detected:
+            return None, movement_detected
 
-        # Check for movement
-        movement_detected = self._detect_movement(resized_img, count_frames, debugging)
+        # Save frame since movement was detected
+        resized_img = self._resize_frame(frame, profile.max_side, profile.resample)
+        self.save_frame(resized_img, "movement_frame")
 
-        # Store current frame as previous for next iteration
-        self.previous_frame = resized_img.copy()
+        captured = CapturedFrame(resized_img, profile=profile)
+        return captured, movement_detected
 
-        # Save frame if movement detected
-        if movement_detected:
-            filename = f"movement_frame_{count_frames}.jpg"
-            self.save_frame(resized_img, filename)
+    def _thumbnail(self, frame, size=GATE_SIZE):
+        """
+        Low-resolution view of the raw frame, at most size pixels on its longest
+        side, each pixel the mean of a step x step box so that sensor noise
+        averages out. Rows of each box are summed first, over contiguous memory.
+        """
+        step = max(1, -(-max(frame.shape[:2]) // size))
+        if step == 1:
+            return np.ascontiguousarray(frame)
+        rows, cols = frame.shape[0] // step, frame.shape[1] // step
+        channels = frame.shape[2:]
+        boxes = frame[: rows * step, : cols * step].reshape(rows, step, -1)
+        sums = boxes.sum(axis=1, dtype=np.uint16 if step <= 257 else np.uint32)
+        sums = sums.reshape(rows, cols, step, *channels).sum(axis=2, dtype=np.uint32)
+        area = step * step
+        return ((sums + area // 2) // area).astype(np.uint8)
 
-        return img_str, movement_detected
+    def _resize_frame(self, frame, max_size=500, resample="lanczos"):
+        """Convert a raw frame to a PIL image resized to max_size on its longest side."""
+        pil_img = Image.fromarray(frame)
+        ratio = max_size / max(pil_img.size)
+        new_size = tuple([int(x * ratio) for x in pil_img.size])
+        return pil_img.resize(new_size, getattr(Image, resample.upper()))
 
-    def _check_image_quality(self, image, count_frames, debugging=False):
+    def _check_image_quality(self, thumbnail, count_frames, debugging=False):
         """Check if image is too dark or lacks color variance (synchronous)."""
-        # Convert to grayscale and check brightness
-        gray_image = image.convert("L")
-        average_intensity = np.array(gray_image).mean()
-
-        # Convert to HSV and check color uniformity
-        hsv_image = image.convert("HSV")
-        hsv_array = np.array(hsv_image)
-
-        hue_std = hsv_array[:, :, 0].std()  # Standard deviation of the hue channel
-        sat_std = hsv_array[
-            :, :, 1
-        ].std()  # Standard deviation of the saturation channel
+        # Brightness and hue/saturation dispersion straight from the RGB array
+        average_intensity, hue_std, sat_std = self.frame_statistics.compute(thumbnail)
 
         if debugging and count_frames % self.PRINT_DEBUG_EACH_N_FRAMES == 0:
             print(f"Hue std: {hue_std}")
@@ -265,80 +1054,46 @@ class Camera:
 
         return is_dark or lacks_color_variance
 
-    def _detect_movement(self, current_image, count_frames, debugging=False):
+    def _detect_movement(self, current_gray, count_frames, debugging=False):
         """
-        Detect movement by comparing current frame with previous frame (synchronous).
+        Detect movement by comparing the current grayscale thumbnail with the background model (synchronous).
         Returns True if movement is detected, False otherwise.
         """
-        # If no previous frame, initialize it and return False
-        if self.previous_frame is None:
-            self.previous_frame = current_image.copy()
-            return False
-
-        # Convert both images to grayscale for comparison
-        current_gray = current_image.convert("L")
-        previous_gray = self.previous_frame.convert("L")
-
-        # Convert to numpy arrays
-        current_array = np.array(current_gray, dtype=np.float32)
-        previous_array = np.array(previous_gray, dtype=np.float32)
-
-        # Calculate absolute difference
-        diff = np.abs(current_array - previous_array)
-
-        # Calculate mean difference
-        mean_diff = diff.mean()
+        motion = self.motion_detector.update(current_gray)
+        self.last_motion = motion
 
         if debugging and (
-            count_frames % self.PRINT_DEBUG_EACH_N_FRAMES == 0
-            or mean_diff > self.movement_threshold
+            count_frames % self.PRINT_DEBUG_EACH_N_FRAMES == 0 or motion.detected
         ):
             print(
-                f"Movement difference: {mean_diff:.2f} (threshold: {self.movement_threshold})"
+                f"Movement score: {motion.score:.2f} (threshold: {self.movement_threshold}), "
+                f"active blocks: {motion.active_fraction:.0%}, bbox: {motion.bbox}"
             )
 
-        # Return True if movement exceeds threshold
-        return mean_diff > self.movement_threshold
+        return motion.detected
 
-    def save_frame(self, frame, filename):
-        """Save a frame to S3 or local filesystem."""
-        if self.use_s3 and self.s3_client:
-            try:
-                # Create a BytesIO buffer to store the image
-                img_buffer = io.BytesIO()
-                frame.save(img_buffer, format="JPEG", quality=85)
-                img_buffer.seek(0)
-
-                # Create S3 key with timestamp and prefix
-                timestamp = datetime.now().strftime("%Y/%m/%d/%H")
-                s3_key = f"{self.s3_prefix}/{timestamp}/{filename}"
-
-                # Upload to S3
-                self.s3_client.upload_fileobj(
-                    img_buffer,
-                    self.s3_bucket,
-                    s3_key,
-                    ExtraArgs={
-                        "ContentType": "image/jpeg",
-                        "Metadata": {
-                            "source": "narrator-camera",
-                            "timestamp": datetime.now().isoformat(),
-                        },
-                    },
-                )
-                print(f"📤 Frame saved to S3: s3://{self.s3_bucket}/{s3_key}")
+    def save_frame(self, frame, kind):
+        """
+        Save a frame to S3 or to the local frame store, under a unique time-bucketed key.
+        S3 uploads are queued on the write-behind uploader, so they never
+        block frame processing.
+        """
+        if self.use_s3 and self.uploader:
+            # Encode the image once for the upload queue
+            img_buffer = io.BytesIO()
+            frame.save(img_buffer, format="JPEG", quality=85)
 
-            except Exception as e:
-                print(f"❌ Failed to save frame to S3: {e}")
-                print("🔄 Falling back to local storage")
-                # Fall back to local storage
-                self._save_frame_locally(frame, filename)
+            # Same key scheme as the local store, under the S3 prefix
+            s3_key = f"{self.s3_prefix}/{self.frame_store.make_key(kind)}"
+
+            self.uploader.submit(s3_key, img_buffer.getvalue())
         else:
             # Save locally
-            self._save_frame_locally(frame, filename)
+            path = self.frame_store.save(frame, kind)
+            print(f"💾 Frame saved locally: {path}")
 
-    def _save_frame_locally(self, frame, filename):
-        """Save a frame to local filesystem."""
-        path = os.path.join(self.frames_dir, filename)
-        frame.save(path)
-        print(f"💾 Frame saved locally: {path}")
+    def close(self, timeout=10.0):
+        """Flush pending frame uploads and the frame store (synchronous, meant to run in executor)."""
+        if self.uploader:
+            self.uploader.flush(timeout)
+        self.frame_store.close()
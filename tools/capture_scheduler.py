@@ -0,0 +1,79 @@
+import time
+import asyncio
+
+from models import CaptureMode
+
+CAPTURE_REASON_TIMER = "timer"
+CAPTURE_REASON_RECORD = "record"
+
+
+class CaptureScheduler:
+    """
+    Event-driven scheduling of camera captures.
+    CONTINUOUS intervals are timers, RECORD_TRIGGERED records are events and
+    HYBRID modes await both. Nothing runs while idle: the capture task sleeps
+    until the next deadline or until a trigger or mode change wakes it up.
+    """
+
+    def __init__(self, mode_config):
+        self._mode_config = mode_config
+        self._wakeup = asyncio.Event()
+        self._triggered = False
+        self.last_capture_time = 0.0
+        self.last_trigger_time = None
+
+    @property
+    def mode_config(self):
+        """Configuration of the mode currently scheduled."""
+        return self._mode_config
+
+    def set_mode(self, mode_config):
+        """Switch mode: pending timers are rescheduled with the new configuration at once."""
+        self._mode_config = mode_config
+        self._wakeup.set()
+
+    def trigger(self):
+        """Request a capture for a new record (honoured in RECORD_TRIGGERED and HYBRID modes)."""
+        self._triggered = True
+        self.last_trigger_time = time.time()
+        self._wakeup.set()
+
+    def mark_captured(self, capture_time):
+        """Register the start time of the last capture, the next timer counts from it."""
+        self.last_capture_time = capture_time
+
+    def next_deadline(self):
+        """Time of the next timed capture, or None if the mode only captures on records."""
+        if self._mode_config.capture_mode in (
+            CaptureMode.CONTINUOUS,
+            CaptureMode.HYBRID,
+        ):
+            return self.last_capture_time + self._mode_config.sleep_interval
+        return None
+
+    async def wait_for_capture(self):
+        """
+        Wait until a capture is due.
+        Returns (mode_config, reason) with reason CAPTURE_REASON_RECORD or CAPTURE_REASON_TIMER.
+        """
+        while True:
+            mode_config = self._mode_config
+            if self._triggered and mode_config.capture_mode in (
+                CaptureMode.RECORD_TRIGGERED,
+                CaptureMode.HYBRID,
+            ):
+                self._triggered = False
+                return mode_config, CAPTURE_REASON_RECORD
+
+            deadline = self.next_deadline()
+            now = time.time()
+            if deadline is not None and now >= deadline:
+                return mode_config, CAPTURE_REASON_TIMER
+
+            # No await between the checks above and clear(), so no wake-up is lost
+            self._wakeup.clear()
+            timeout = None if deadline is None else deadline - now
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
@@ -0,0 +1,119 @@
+import asyncio
+from collections import deque
+
+from utils.common_utils import count_tokens
+
+SCRIPT_TOKEN_BUDGET = 1500  # tokens of recent turns resent with every call
+SCRIPT_KEEP_FRACTION = 0.5  # eviction goes down to this fraction of the budget
+SUMMARY_MAX_WORDS = 150
+PROMPT_HISTORY_SIZE = 100  # prompt sizes kept for reporting
+
+
+class ConversationWindow:
+    """
+    Token-budgeted window over the narrator's script.
+    Recent turns are kept verbatim while they fit in the budget. When they
+    overflow, the oldest are evicted in one batch, down to a fraction of the
+    budget, and folded into a running summary by a background task. The
+    summary sits right after the system prompt and only changes when a
+    summarization completes, so the prompt prefix stays stable between
+    evictions.
+    """
+
+    def __init__(self, client=None, max_tokens=SCRIPT_TOKEN_BUDGET):
+        self.client = client  # AsyncOpenAI client for summaries, None to only evict
+        self.max_tokens = max_tokens
+        self.summary = None
+        self._turns = []
+        self._tokens = 0
+        self._evicted = []  # Turns waiting to be folded into the summary
+        self._summary_task = None
+        self.prompt_tokens = deque(maxlen=PROMPT_HISTORY_SIZE)
+        self.cached_tokens = deque(maxlen=PROMPT_HISTORY_SIZE)
+
+    def messages(self):
+        """Messages to send after the system prompt: the summary, then the recent turns."""
+        prefix = []
+        if self.summary:
+            prefix.append(
+                {
+                    "role": "system",
+                    "content": f"Summary of what you said earlier: {self.summary}",
+                }
+            )
+        return prefix + self._turns
+
+    def append(self, entry):
+        """Add a turn, evicting the oldest ones if the budget is exceeded."""
+        self._turns.append(entry)
+        self._tokens += count_tokens(entry["content"])
+        if self._tokens > self.max_tokens:
+            self._evict()
+
+    def remove(self, entry):
+        """Remove a turn that should not have been said (e.g. a discarded narration)."""
+        self._turns.remove(entry)
+        self._tokens -= count_tokens(entry["content"])
+
+    def __contains__(self, entry):
+        return entry in self._turns
+
+    def __len__(self):
+        return len(self.messages())
+
+    def record_usage(self, usage):
+        """Register and print the prompt size reported for a call."""
+        cached = getattr(
+            getattr(usage, "prompt_tokens_details", None), "cached_tokens", 0
+        )
+        self.prompt_tokens.append(usage.prompt_tokens)
+        self.cached_tokens.append(cached or 0)
+        print(
+            f"🧾 Prompt: {usage.prompt_tokens} tokens ({cached or 0} cached), "
+            f"script: {len(self._turns)} turns / {self._tokens} tokens"
+            + (", summarized history" if self.summary else "")
+        )
+
+    def _evict(self):
+        """Move the oldest turns out of the window and summarize them in the background."""
+        keep = self.max_tokens * SCRIPT_KEEP_FRACTION
+        while self._turns and self._tokens > keep:
+            entry = self._turns.pop(0)
+            self._tokens -= count_tokens(entry["content"])
+            self._evicted.append(entry)
+
+        if self.client is None:
+            self._evicted.clear()
+        elif self._summary_task is None or self._summary_task.done():
+            self._summary_task = asyncio.get_running_loop().create_task(
+                self._summarize()
+            )
+
+    async def _summarize(self):
+        """Fold the evicted turns into the summary, until none are left."""
+        while self._evicted:
+            turns, self._evicted = self._evicted, []
+            said = "\n".join(f"- {entry['content']}" for entry in turns)
+            previous = f"Summary so far: {self.summary}\n\n" if self.summary else ""
+            try:
+                response = await self.client.chat.completions.create(
+                    model="gpt-4o",
+                    messages=[
+                        {
+                            "role": "system",
+                            "content": (
+                                "You keep the memory of a narrator. Summarize what the "
+                                f"narrator already said in at most {SUMMARY_MAX_WORDS} "
+                                "words, keeping names, jokes and facts so that they are "
+                                "not repeated."
+                            ),
+                        },
+                        {"role": "user", "content": f"{previous}Said since:\n{said}"},
+                    ],
+                    max_tokens=SUMMARY_MAX_WORDS * 2,
+                )
+                self.summary = response.choices[0].message.content
+                print(f"🗜️ Summarized {len(turns)} old turns of the script")
+            except Exception as e:
+                # The turns are dropped: the window must stay within budget
+                print(f"Warning: Could not summarize the script: {e}")
@@ -7,22 +7,100 @@ Created on Thu Aug 22 16:46:34 2024
 
 import boto3
 import json
+import time
 import asyncio
+import queue
+import threading
+from concurrent.futures import Executor, Future
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 from utils.env_utils import get_env_var
 
-# Initialize the SQS client
-sqs = boto3.client(
-    "sqs",
-    region_name=get_env_var("AWS_REGION"),
-    aws_access_key_id=get_env_var("AWS_QUEUE_KEY_ID"),
-    aws_secret_access_key=get_env_var("AWS_QUEUE_API_KEY"),
-)
+SQS_WAIT_TIME_SECONDS = 20  # Long polling, the maximum allowed by SQS
+SQS_MAX_MESSAGES = 10  # Maximum allowed by SQS per receive call
+SQS_MAX_POOL_CONNECTIONS = 1  # The single SQS thread makes one call at a time
 
 # SQS queue URL
 queue_url = get_env_var("AWS_QUEUE")
 
+# The SQS client is created lazily, on first use
+_sqs = None
+_sqs_lock = threading.Lock()
+
+# API usage, for reporting
+sqs_stats = {"receive_calls": 0, "delete_calls": 0, "messages": 0, "since": time.time()}
+
+
+def get_sqs_client():
+    """Return the shared SQS client, creating it with a pooled connection on first use."""
+    global _sqs
+    if _sqs is None:
+        with _sqs_lock:
+            if _sqs is None:
+                _sqs = boto3.client(
+                    "sqs",
+                    region_name=get_env_var("AWS_REGION"),
+                    aws_access_key_id=get_env_var("AWS_QUEUE_KEY_ID"),
+                    aws_secret_access_key=get_env_var("AWS_QUEUE_API_KEY"),
+                    config=Config(
+                        max_pool_connections=SQS_MAX_POOL_CONNECTIONS,
+                        tcp_keepalive=True,
+                        # Must outlast the long poll
+                        read_timeout=SQS_WAIT_TIME_SECONDS + 10,
+                    ),
+                )
+    return _sqs
+
+
+class SQSExecutor(Executor):
+    """
+    Single daemon thread running the blocking SQS calls in submission order.
+    Long polls never occupy the default executor, and unlike ThreadPoolExecutor
+    workers the daemon thread does not hold up interpreter exit while a poll
+    is in flight.
+    """
+
+    def __init__(self):
+        self._calls = queue.Queue()
+        self._shutdown = False
+        self._thread = threading.Thread(target=self._run, name="sqs", daemon=True)
+        self._thread.start()
+
+    def submit(self, fn, *args, **kwargs):
+        if self._shutdown:
+            raise RuntimeError("The SQS executor is shut down")
+        future = Future()
+        self._calls.put((future, fn, args, kwargs))
+        return future
+
+    def _run(self):
+        while True:
+            call = self._calls.get()
+            if call is None:
+                return
+            future, fn, args, kwargs = call
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+
+    def shutdown(self, wait=True, *, cancel_futures=False):
+        self._shutdown = True
+        if cancel_futures:
+            while True:
+                try:
+                    call = self._calls.get_nowait()
+                except queue.Empty:
+                    break
+                if call is not None:
+                    call[0].cancel()
+        self._calls.put(None)
+        if wait:
+            self._thread.join()
+
 
 def process_message(message):
     # Parse the message body
@@ -38,47 +116,85 @@ def process_message(message):
     return body
 
 
-async def fetch_record(verbose=False):
+def _receive_messages(wait_time, max_messages):
+    """Long poll the queue (blocking, meant to run on the SQS thread)."""
+    response = get_sqs_client().receive_message(
+        QueueUrl=queue_url,
+        MaxNumberOfMessages=max_messages,
+        WaitTimeSeconds=wait_time,
+        AttributeNames=["MessageGroupId"],
+    )
+    sqs_stats["receive_calls"] += 1
+    return response.get("Messages", [])
+
+
+def _delete_messages(messages):
+    """Delete processed messages in one batch call (blocking, meant to run on the SQS thread)."""
+    response = get_sqs_client().delete_message_batch(
+        QueueUrl=queue_url,
+        Entries=[
+            {"Id": str(i), "ReceiptHandle": message["ReceiptHandle"]}
+            for i, message in enumerate(messages)
+        ],
+    )
+    sqs_stats["delete_calls"] += 1
+    for failure in response.get("Failed", []):
+        # Message will return to the queue after visibility timeout
+        print(f"Failed to delete message {failure['Id']}: {failure.get('Message')}")
+
+
+def api_calls_per_hour():
+    """SQS API calls per hour since the module was loaded."""
+    elapsed = max(time.time() - sqs_stats["since"], 1.0)
+    calls = sqs_stats["receive_calls"] + sqs_stats["delete_calls"]
+    return calls * 3600 / elapsed
+
+
+async def fetch_records(
+    executor,
+    verbose=False,
+    wait_time=SQS_WAIT_TIME_SECONDS,
+    max_messages=SQS_MAX_MESSAGES,
+):
+    """
+    Long poll SQS on the executor and return the received records, in order.
+    Returns as soon as messages arrive, or with an empty list after wait_time seconds.
+    """
+    loop = asyncio.get_running_loop()
+    records = []
     try:
         # Receive messages from SQS FIFO queue
-        response = sqs.receive_message(
-            QueueUrl=queue_url,
-            MaxNumberOfMessages=1,
-            WaitTimeSeconds=0,  # Short polling
-            AttributeNames=["MessageGroupId"],
+        messages = await loop.run_in_executor(
+            executor, _receive_messages, wait_time, max_messages
         )
 
-        # Process message if received
-        messages = response.get("Messages", [])
-        if messages:
-            message = messages[0]
+        processed = []
+        for message in messages:
             if verbose:
                 print(f"New message: {message}")
             try:
-                record = process_message(message)
-
-                # Delete the message from the queue after successful processing
-                sqs.delete_message(
-                    QueueUrl=queue_url, ReceiptHandle=message["ReceiptHandle"]
-                )
+                records.append(process_message(message))
+                processed.append(message)
                 if verbose:
-                    print(
-                        f"Successfully processed and deleted message: {message['MessageId']}"
-                    )
                     print(
                         f"Message Group ID: {message['Attributes']['MessageGroupId']}"
                     )
-
-                return record
-
             except Exception as e:
                 print(f"Error processing message {message['MessageId']}: {e}")
                 # Message will return to the queue after visibility timeout
-        else:
+
+        # Delete the messages from the queue after successful processing
+        if processed:
+            await loop.run_in_executor(executor, _delete_messages, processed)
+            sqs_stats["messages"] += len(processed)
             if verbose:
-                # print("No messages found.")
-                pass
+                print(
+                    f"Successfully processed and deleted {len(processed)} messages "
+                    f"({api_calls_per_hour():.0f} SQS calls/hour)"
+                )
 
     except ClientError as e:
         print(f"An error occurred: {e}")
         await asyncio.sleep(5)  # Wait a bit longer on errors
+
+    return records
@@ -0,0 +1,190 @@
+import os
+import time
+import threading
+from collections import deque
+from datetime import datetime
+
+FRAME_STORE_MAX_MB = 500  # disk budget for stored frames
+FRAME_STORE_MAX_AGE_HOURS = 72  # frames older than this are deleted
+FSYNC_BATCH_SIZE = 16  # writes between directory fsyncs
+FSYNC_INTERVAL = 5.0  # seconds between directory fsyncs
+INDEX_FILENAME = "index.tsv"
+
+
+class FrameStore:
+    """
+    Bounded local store for camera frames.
+    Frames are written under time-bucketed, non-colliding keys
+    (YYYY/MM/DD/HH/<kind>_<HHMMSS>_<ms>_<session>_<seq>.jpg), the same keys
+    used for S3 objects. A compact append-only index keeps recent frames
+    findable without listing directories, and a size/age retention policy
+    deletes the oldest frames. Directory fsyncs are batched.
+    """
+
+    def __init__(
+        self,
+        root_dir,
+        max_bytes=FRAME_STORE_MAX_MB * 1024 * 1024,
+        max_age=FRAME_STORE_MAX_AGE_HOURS * 3600,
+    ):
+        self.root_dir = root_dir
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.index_path = os.path.join(root_dir, INDEX_FILENAME)
+        self._session = os.urandom(2).hex()
+        self._seq = 0
+        self._lock = threading.Lock()
+        self._entries = deque()  # (timestamp, key, size), oldest first
+        self._total_bytes = 0
+        self._evicted_since_compaction = 0
+        self._dirty_dirs = set()
+        self._writes_since_sync = 0
+        self._last_sync = time.time()
+        self._index_file = None
+
+        os.makedirs(root_dir, exist_ok=True)
+        self._load_index()
+        self._index_file = open(self.index_path, "a")
+
+    def make_key(self, kind, timestamp=None):
+        """Build a unique, time-bucketed key for a frame of the given kind."""
+        timestamp = timestamp if timestamp is not None else time.time()
+        moment = datetime.fromtimestamp(timestamp)
+        with self._lock:
+            self._seq += 1
+            seq = self._seq
+        return (
+            f"{moment:%Y/%m/%d/%H}/"
+            f"{kind}_{moment:%H%M%S}_{moment.microsecond // 1000:03d}"
+            f"_{self._session}_{seq:06d}.jpg"
+        )
+
+    def save(self, frame, kind, timestamp=None):
+        """Save a PIL image under a new key and apply the retention policy. Returns the path."""
+        timestamp = timestamp if timestamp is not None else time.time()
+        key = self.make_key(kind, timestamp)
+        path = os.path.join(self.root_dir, key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        frame.save(path, format="JPEG")
+        size = os.path.getsize(path)
+
+        with self._lock:
+            self._entries.append((timestamp, key, size))
+            self._total_bytes += size
+            self._index_file.write(f"{timestamp:.3f}\t{key}\t{size}\n")
+            self._dirty_dirs.add(os.path.dirname(path))
+            self._writes_since_sync += 1
+            self._apply_retention(timestamp)
+            if (
+                self._writes_since_sync >= FSYNC_BATCH_SIZE
+                or timestamp - self._last_sync >= FSYNC_INTERVAL
+            ):
+                self._sync()
+        return path
+
+    def recent(self, n=10, kind=None):
+        """Paths of the n most recent frames (newest first), optionally of one kind."""
+        paths = []
+        with self._lock:
+            for _, key, _ in reversed(self._entries):
+                if kind is None or os.path.basename(key).startswith(f"{kind}_"):
+                    paths.append(os.path.join(self.root_dir, key))
+                    if len(paths) == n:
+                        break
+        return paths
+
+    def usage(self):
+        """Number of stored frames and bytes used."""
+        with self._lock:
+            return {"frames": len(self._entries), "bytes": self._total_bytes}
+
+    def flush(self):
+        """Fsync pending index writes and directory entries."""
+        with self._lock:
+            self._sync()
+
+    def close(self):
+        """Flush and close the index."""
+        self.flush()
+        self._index_file.close()
+
+    def _apply_retention(self, now):
+        """Delete the oldest frames while over the size or age limits (caller holds the lock)."""
+        while self._entries and (
+            self._total_bytes > self.max_bytes
+            or now - self._entries[0][0] > self.max_age
+        ):
+            _, key, size = self._entries.popleft()
+            self._total_bytes -= size
+            self._evicted_since_compaction += 1
+            path = os.path.join(self.root_dir, key)
+            try:
+                os.remove(path)
+                self._dirty_dirs.add(os.path.dirname(path))
+                os.removedirs(os.path.dirname(path))
+            except OSError:
+                pass  # Already gone, or the hour directory still has frames
+
+        if self._evicted_since_compaction > max(len(self._entries), FSYNC_BATCH_SIZE):
+            self._compact_index()
+
+    def _sync(self):
+        """Fsync the index and every directory touched since the last sync (caller holds the lock)."""
+        self._index_file.flush()
+        os.fsync(self._index_file.fileno())
+        for directory in self._dirty_dirs:
+            try:
+                fd = os.open(directory, os.O_RDONLY)
+            except OSError:
+                continue  # Removed by retention
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+        self._dirty_dirs.clear()
+        self._writes_since_sync = 0
+        self._last_sync = time.time()
+
+    def _compact_index(self):
+        """Rewrite the index with live entries only (caller holds the lock)."""
+        tmp_path = self.index_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            for timestamp, key, size in self._entries:
+                f.write(f"{timestamp:.3f}\t{key}\t{size}\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+        if self._index_file is not None:
+            self._index_file.close()
+        os.replace(tmp_path, self.index_path)
+        if self._index_file is not None:
+            self._index_file = open(self.index_path, "a")
+        self._dirty_dirs.add(self.root_dir)
+        self._evicted_since_compaction = 0
+
+    def _load_index(self):
+        """
+        Load the index from disk. Retention always deletes the oldest frames,
+        so entries evicted since the last compaction form a prefix of the index:
+        only that prefix needs checking against the filesystem.
+        """
+        if not os.path.exists(self.index_path):
+            return
+
+        with open(self.index_path) as f:
+            for line in f:
+                try:
+                    timestamp, key, size = line.rstrip("\n").split("\t")
+                    entry = (float(timestamp), key, int(size))
+                except ValueError:
+                    continue  # Truncated line from an unclean shutdown
+                if not self._entries and not os.path.exists(
+                    os.path.join(self.root_dir, key)
+                ):
+                    self._evicted_since_compaction += 1
+                    continue
+                self._entries.append(entry)
+                self._total_bytes += entry[2]
+
+        if self._evicted_since_compaction:
+            self._compact_index()
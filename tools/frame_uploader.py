@@ -0,0 +1,240 @@
+import os
+import io
+import time
+import queue
+import threading
+from collections import deque
+from datetime import datetime
+
+UPLOAD_QUEUE_SIZE = 32  # frames kept in memory waiting for upload
+UPLOAD_WORKERS = 2
+UPLOAD_MAX_RETRIES = 3
+UPLOAD_BACKOFF = 0.5  # seconds, doubled at each retry
+UPLOAD_IDLE_TIMEOUT = 5.0  # seconds a worker waits before re-queueing spilled frames
+SPILL_BATCH_SIZE = 8  # spilled frames re-queued per idle worker wake-up
+SPILL_MAX_MB = 200  # disk budget for spilled frames, the oldest are dropped beyond it
+SPILL_MAX_AGE_HOURS = 24  # spilled frames older than this are dropped
+
+
+class FrameUploader:
+    """
+    Write-behind uploader for camera frames.
+    Frames are put in a bounded in-memory queue and uploaded to S3 by a small
+    pool of worker threads, with retries and exponential backoff. When the
+    queue is full, or an upload keeps failing, the frame is spilled to a local
+    directory and re-queued later when the workers are idle, oldest first.
+    The spill directory is bounded in size and age: beyond its limits the
+    oldest spilled frames are dropped, and counted in stats["dropped"].
+    """
+
+    def __init__(
+        self,
+        s3_client,
+        bucket,
+        spill_dir,
+        queue_size=UPLOAD_QUEUE_SIZE,
+        workers=UPLOAD_WORKERS,
+        max_retries=UPLOAD_MAX_RETRIES,
+        backoff=UPLOAD_BACKOFF,
+        max_spill_bytes=SPILL_MAX_MB * 1024 * 1024,
+        max_spill_age=SPILL_MAX_AGE_HOURS * 3600,
+    ):
+        self.s3_client = s3_client
+        self.bucket = bucket
+        self.spill_dir = spill_dir
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_spill_bytes = max_spill_bytes
+        self.max_spill_age = max_spill_age
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._spill_lock = threading.Lock()
+        self._spilled = deque()  # (mtime, key, size) of spilled frames, oldest first
+        self._spilled_bytes = 0
+        self._stats_lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._workers = [
+            threading.Thread(target=self._run, name=f"frame-uploader-{i}", daemon=True)
+            for i in range(workers)
+        ]
+        self.stats = {
+            "uploaded": 0,
+            "retries": 0,
+            "spilled": 0,
+            "failed": 0,
+            "dropped": 0,
+        }
+        os.makedirs(self.spill_dir, exist_ok=True)
+        self._load_spilled()
+
+    def start(self):
+        """Start the upload workers."""
+        for worker in self._workers:
+            worker.start()
+        return self
+
+    def submit(self, key, data, timestamp=None):
+        """
+        Queue JPEG bytes for upload under the given key without blocking.
+        Returns False if the queue was full and the frame was spilled to disk.
+        """
+        timestamp = timestamp if timestamp is not None else time.time()
+        try:
+            self._queue.put_nowait((key, data, timestamp))
+            return True
+        except queue.Full:
+            self._spill(key, data)
+            return False
+
+    def _run(self):
+        """Worker thread: upload queued frames until a stop sentinel arrives."""
+        while True:
+            try:
+                item = self._queue.get(timeout=UPLOAD_IDLE_TIMEOUT)
+            except queue.Empty:
+                if not self._stopping.is_set():
+                    self._requeue_spilled()
+                continue
+
+            try:
+                if item is None:
+                    return
+                key, data, timestamp = item
+                if not self._upload_with_retries(key, data, timestamp):
+                    self._spill(key, data)
+            finally:
+                self._queue.task_done()
+
+    def _upload_with_retries(self, key, data, timestamp):
+        """Upload a frame, retrying with exponential backoff. Returns success."""
+        for attempt in range(self.max_retries + 1):
+            try:
+                self.s3_client.upload_fileobj(
+                    io.BytesIO(data),
+                    self.bucket,
+                    key,
+                    ExtraArgs={
+                        "ContentType": "image/jpeg",
+                        "Metadata": {
+                            "source": "narrator-camera",
+                            "timestamp": datetime.fromtimestamp(timestamp).isoformat(),
+                        },
+                    },
+                )
+                self._count("uploaded")
+                print(f"📤 Frame saved to S3: s3://{self.bucket}/{key}")
+                return True
+            except Exception as e:
+                if attempt == self.max_retries or self._stopping.is_set():
+                    print(f"❌ Failed to save frame to S3: {e}")
+                    self._count("failed")
+                    return False
+                self._count("retries")
+                time.sleep(self.backoff * 2**attempt)
+
+    def _count(self, stat, n=1):
+        """Increment a stat, from any worker thread."""
+        with self._stats_lock:
+            self.stats[stat] += n
+
+    def _load_spilled(self):
+        """Account the frames left in the spill directory by a previous run."""
+        spilled = []
+        for root, _, files in os.walk(self.spill_dir):
+            for name in files:
+                path = os.path.join(root, name)
+                key = os.path.relpath(path, self.spill_dir).replace(os.sep, "/")
+                spilled.append((os.path.getmtime(path), key, os.path.getsize(path)))
+        with self._spill_lock:
+            for entry in sorted(spilled):
+                self._spilled.append(entry)
+                self._spilled_bytes += entry[2]
+            self._enforce_spill_limits()
+
+    def _spill(self, key, data):
+        """Write a frame to the local spill directory, keyed like its S3 object."""
+        path = os.path.join(self.spill_dir, key)
+        with self._spill_lock:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as f:
+                f.write(data)
+            self._spilled.append((time.time(), key, len(data)))
+            self._spilled_bytes += len(data)
+            self._enforce_spill_limits()
+        self._count("spilled")
+        print(f"💾 Frame spilled locally for later upload: {path}")
+
+    def _enforce_spill_limits(self):
+        """Drop the oldest spilled frames beyond the size and age limits (caller holds the lock)."""
+        now = time.time()
+        dropped = 0
+        while self._spilled and (
+            self._spilled_bytes > self.max_spill_bytes
+            or now - self._spilled[0][0] > self.max_spill_age
+        ):
+            _, key, size = self._spilled.popleft()
+            self._spilled_bytes -= size
+            try:
+                os.remove(os.path.join(self.spill_dir, key))
+            except FileNotFoundError:
+                pass
+            dropped += 1
+        if dropped:
+            self._count("dropped", dropped)
+            print(f"🗑️ Dropped {dropped} spilled frames over the spill limits")
+
+    def _requeue_spilled(self):
+        """Move a batch of the oldest spilled frames back into the upload queue."""
+        with self._spill_lock:
+            for _ in range(min(SPILL_BATCH_SIZE, len(self._spilled))):
+                if self._queue.full() or self._stopping.is_set():
+                    return
+                mtime, key, size = self._spilled[0]
+                path = os.path.join(self.spill_dir, key)
+                try:
+                    with open(path, "rb") as f:
+                        data = f.read()
+                except FileNotFoundError:
+                    data = None
+                if data is not None:
+                    try:
+                        self._queue.put_nowait((key, data, mtime))
+                    except queue.Full:
+                        return
+                    os.remove(path)
+                self._spilled.popleft()
+                self._spilled_bytes -= size
+
+    def pending(self):
+        """Number of frames waiting in the in-memory queue."""
+        return self._queue.qsize()
+
+    def flush(self, timeout=10.0):
+        """
+        Upload what is queued, within timeout seconds, then stop the workers.
+        Frames still queued at the deadline are spilled to disk.
+        """
+        deadline = time.time() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks and time.time() < deadline:
+                self._queue.all_tasks_done.wait(deadline - time.time())
+
+        self._stopping.set()
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not None:
+                self._spill(item[0], item[1])
+            self._queue.task_done()
+
+        for worker in self._workers:
+            try:
+                self._queue.put(None, timeout=max(0.1, deadline - time.time()))
+            except queue.Full:
+                break  # A worker is stuck, the daemon threads die with the process
+        # One second of grace for the workers to see their stop marker
+        stop_by = max(deadline, time.time()) + 1
+        for worker in self._workers:
+            worker.join(timeout=max(0.0, stop_by - time.time()))
+        print(f"📤 Frame uploader stopped: {self.stats}")
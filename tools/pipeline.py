@@ -0,0 +1,81 @@
+import time
+from contextlib import contextmanager
+
+from models import CaptureMode
+
+PIPELINE_STAGES = ("capture", "analyze", "speak")
+
+
+class NarrationJob:
+    """A narration moving through the capture -> VLM -> TTS pipeline."""
+
+    def __init__(self, mode, mode_config, record=None, frame=None, text=None):
+        self.mode = mode
+        self.mode_config = mode_config
+        self.record = record
+        self.frame = frame  # CapturedFrame, None when the text is already known
+        self.text = text
+        self.created_at = time.time()
+        self.script_entry = None  # Entry added to the conversation script, if any
+        self.sentences = None  # asyncio.Queue of streamed sentences, None-terminated
+        self.stream_task = None  # Task filling sentences while the VLM streams
+        self.filler_task = None  # Task playing a filler phrase while the VLM thinks
+
+    def cancel(self):
+        """Stop the streaming and the filler of a discarded job."""
+        for task in (self.stream_task, self.filler_task):
+            if task:
+                task.cancel()
+
+    def stale_reason(self, current_mode, current_record):
+        """Why this job should be discarded instead of spoken, or None if it is still fresh."""
+        if self.mode != current_mode:
+            return "mode changed"
+        if (
+            self.mode_config.capture_mode != CaptureMode.CONTINUOUS
+            and self.record is not current_record
+        ):
+            return "a newer record arrived"
+        age = time.time() - self.created_at
+        if age > self.mode_config.max_staleness:
+            return f"captured {age:.1f}s ago"
+        return None
+
+
+class PipelineStats:
+    """Throughput and per-stage utilization of the narration pipeline."""
+
+    def __init__(self):
+        self.started_at = time.time()
+        self.busy = {stage: 0.0 for stage in PIPELINE_STAGES}
+        self.narrations = 0
+        self.discarded = 0
+
+    @contextmanager
+    def stage(self, name):
+        """Account the time spent inside the block as busy time of the stage."""
+        start = time.time()
+        try:
+            yield
+        finally:
+            self.busy[name] += time.time() - start
+
+    def report(self):
+        """Narrations per minute, discarded jobs and utilization of each stage."""
+        elapsed = max(time.time() - self.started_at, 1e-6)
+        return {
+            "narrations_per_minute": self.narrations * 60 / elapsed,
+            "discarded": self.discarded,
+            "utilization": {stage: busy / elapsed for stage, busy in self.busy.items()},
+        }
+
+    def summary(self):
+        """One line summary of the report."""
+        report = self.report()
+        utilization = ", ".join(
+            f"{stage} {value:.0%}" for stage, value in report["utilization"].items()
+        )
+        return (
+            f"{report['narrations_per_minute']:.1f} narrations/min, "
+            f"{report['discarded']} discarded, utilization: {utilization}"
+        )
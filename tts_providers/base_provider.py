@@ -1,23 +1,47 @@
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import Callable, Optional
 
 
 class TTSProvider(ABC):
     """Abstract base class for TTS providers."""
 
     @abstractmethod
-    def play_audio(self, text: str, mode: str = "") -> None:
+    def play_audio(
+        self,
+        text: str,
+        mode: str = "",
+        sink: Optional[Callable[[bytes], None]] = None,
+    ) -> None:
         """
         Generate and play audio from the given text.
 
         Args:
             text: The text to convert to speech
+            sink: Optional callable receiving each chunk of the generated audio, in order
 
         Raises:
             Exception: If TTS generation or playback fails
         """
         pass
 
+    @abstractmethod
+    def synthesize(self, text: str, mode: str = "") -> bytes:
+        """Generate the audio of the given text without playing it."""
+        pass
+
+    @abstractmethod
+    def play_bytes(self, audio: bytes, mode: str = "") -> None:
+        """Play audio previously generated by this provider (e.g. from a cache)."""
+        pass
+
+    @abstractmethod
+    def voice_signature(self, mode: str = "") -> dict:
+        """
+        Everything besides the text that determines the generated audio:
+        provider, voice id, voice settings and model.
+        """
+        pass
+
     @abstractmethod
     def initialize(self) -> None:
         """Initialize the TTS provider (API keys, configuration, etc.)."""
@@ -39,18 +63,42 @@ class AsyncTTSProvider(ABC):
     """Abstract base class for async TTS providers."""
 
     @abstractmethod
-    async def play_audio_async(self, text: str, mode: str = "") -> None:
+    async def play_audio_async(
+        self,
+        text: str,
+        mode: str = "",
+        sink: Optional[Callable[[bytes], None]] = None,
+    ) -> None:
         """
         Generate and play audio from the given text asynchronously.
 
         Args:
             text: The text to convert to speech
+            sink: Optional callable receiving each chunk of the generated audio, in order
 
         Raises:
             Exception: If TTS generation or playback fails
         """
         pass
 
+    @abstractmethod
+    async def synthesize_async(self, text: str, mode: str = "") -> bytes:
+        """Generate the audio of the given text without playing it."""
+        pass
+
+    @abstractmethod
+    async def play_bytes_async(self, audio: bytes, mode: str = "") -> None:
+        """Play audio previously generated by this provider (e.g. from a cache)."""
+        pass
+
+    @abstractmethod
+    def voice_signature(self, mode: str = "") -> dict:
+        """
+        Everything besides the text that determines the generated audio:
+        provider, voice id, voice settings and model.
+        """
+        pass
+
     @abstractmethod
     async def initialize_async(self) -> None:
         """Initialize the TTS provider asynchronously."""
@@ -0,0 +1,246 @@
+import os
+import json
+import zlib
+import asyncio
+import hashlib
+import threading
+import unicodedata
+from collections import OrderedDict
+from typing import Union
+
+from .base_provider import TTSProvider, AsyncTTSProvider
+
+TTS_CACHE_DIR = "tts_cache"
+TTS_CACHE_MAX_MB = 200
+MIN_COMPRESSION_GAIN = 0.9  # keep zlib output only if it is at most 90% of the audio
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_tts_cache():
+    """Get the shared TTS cache, configured from the environment on first use."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = TTSCache(
+                os.environ.get("TTS_CACHE_DIR", TTS_CACHE_DIR),
+                max_bytes=float(os.environ.get("TTS_CACHE_MAX_MB", TTS_CACHE_MAX_MB))
+                * 1024
+                * 1024,
+            )
+        return _cache
+
+
+def normalize_text(text: str) -> str:
+    """Text as far as synthesis is concerned: NFC, whitespace collapsed."""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+class TTSCache:
+    """
+    Content-addressed store of synthesized audio.
+    Clips are keyed by a hash of the voice signature (provider, voice id,
+    voice settings, model) and the normalized text. They are stored on disk,
+    zlib-compressed when that pays off (PCM does, MP3 does not), under a size
+    cap with least-recently-used eviction. The index lives in memory and is
+    rebuilt from the directory at startup, modification times giving the
+    LRU order.
+    """
+
+    def __init__(self, root_dir, max_bytes=TTS_CACHE_MAX_MB * 1024 * 1024):
+        self.root_dir = root_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._index = OrderedDict()  # key -> stored size, least recently used first
+        self._total_bytes = 0
+        self.stats = {"hits": 0, "misses": 0, "bytes_saved": 0, "evicted": 0}
+
+        os.makedirs(root_dir, exist_ok=True)
+        self._load_index()
+
+    @staticmethod
+    def make_key(signature: dict, text: str) -> str:
+        """Cache key of a text spoken with the given voice signature."""
+        payload = json.dumps([signature, normalize_text(text)], sort_keys=True)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def contains(self, key):
+        """Whether audio is stored under key, without counting a lookup."""
+        with self._lock:
+            return key in self._index
+
+    def get(self, key):
+        """Audio bytes stored under key, or None. Counts a hit or a miss."""
+        with self._lock:
+            if key not in self._index:
+                self.stats["misses"] += 1
+                return None
+            self._index.move_to_end(key)
+
+        try:
+            with open(self._path(key), "rb") as f:
+                stored = f.read()
+            audio = zlib.decompress(stored[1:]) if stored[:1] == b"z" else stored[1:]
+            os.utime(self._path(key))  # Persist the LRU order
+        except (OSError, zlib.error):
+            self._discard(key)
+            with self._lock:
+                self.stats["misses"] += 1
+            return None
+
+        with self._lock:
+            self.stats["hits"] += 1
+            self.stats["bytes_saved"] += len(audio)
+        return audio
+
+    def put(self, key, audio):
+        """Store audio under key, evicting the least recently used clips if over the cap."""
+        compressed = zlib.compress(audio)
+        if len(compressed) <= len(audio) * MIN_COMPRESSION_GAIN:
+            stored = b"z" + compressed
+        else:
+            stored = b"r" + audio
+        if len(stored) > self.max_bytes:
+            return
+
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(stored)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            self._total_bytes += len(stored) - self._index.pop(key, 0)
+            self._index[key] = len(stored)
+            evicted = []
+            while self._total_bytes > self.max_bytes:
+                old_key, size = self._index.popitem(last=False)
+                self._total_bytes -= size
+                self.stats["evicted"] += 1
+                evicted.append(old_key)
+        for old_key in evicted:
+            try:
+                os.remove(self._path(old_key))
+            except OSError:
+                pass
+
+    def hit_rate(self):
+        """Fraction of lookups served from the cache."""
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return self.stats["hits"] / lookups if lookups else 0.0
+
+    def usage(self):
+        """Number of cached clips and bytes used on disk."""
+        with self._lock:
+            return {"clips": len(self._index), "bytes": self._total_bytes}
+
+    def summary(self):
+        """One line summary of the cache statistics."""
+        usage = self.usage()
+        return (
+            f"hit rate {self.hit_rate():.0%} ({self.stats['hits']} hits, "
+            f"{self.stats['misses']} misses), {self.stats['bytes_saved'] / 1024:.0f} KB "
+            f"not synthesized, {usage['clips']} clips in {usage['bytes'] / 1024:.0f} KB"
+        )
+
+    def _path(self, key):
+        return os.path.join(self.root_dir, key[:2], key)
+
+    def _discard(self, key):
+        with self._lock:
+            self._total_bytes -= self._index.pop(key, 0)
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            pass
+
+    def _load_index(self):
+        """Rebuild the index from the cache directory, oldest clips first."""
+        entries = []
+        for root, _, files in os.walk(self.root_dir):
+            for name in files:
+                path = os.path.join(root, name)
+                if name.endswith(".tmp"):
+                    os.remove(path)  # Interrupted write
+                    continue
+                stat = os.stat(path)
+                entries.append((stat.st_mtime, name, stat.st_size))
+        for _, key, size in sorted(entries):
+            self._index[key] = size
+            self._total_bytes += size
+
+
+class CachedTTSProvider(AsyncTTSProvider):
+    """
+    Puts a TTSCache in front of any provider: cached utterances are played
+    straight from disk, the others are synthesized and played by the provider
+    as usual. Only the repeated phrases given to warm_async (fillers) are
+    stored, live narration is never buffered for the cache.
+    """
+
+    def __init__(self, provider: Union[TTSProvider, AsyncTTSProvider], cache):
+        self.provider = provider
+        self.cache = cache
+
+    async def initialize_async(self) -> None:
+        """Initialize the wrapped provider."""
+        if isinstance(self.provider, AsyncTTSProvider):
+            await self.provider.initialize_async()
+        else:
+            self.provider.initialize()
+
+    async def play_audio_async(self, text: str, mode: str = "", sink=None) -> None:
+        """Play the cached audio of the text, or stream it from the provider on a miss."""
+        key = self.cache.make_key(self.provider.voice_signature(mode), text)
+        audio = await asyncio.to_thread(self.cache.get, key)
+        if audio is not None:
+            if sink is not None:
+                sink(audio)
+            await self.play_bytes_async(audio, mode)
+            return
+
+        if isinstance(self.provider, AsyncTTSProvider):
+            await self.provider.play_audio_async(text, mode, sink=sink)
+        else:
+            await asyncio.to_thread(self.provider.play_audio, text, mode, sink)
+
+    async def warm_async(self, text: str, mode: str = "") -> bool:
+        """Synthesize and cache the text unless already cached. Returns True if synthesized."""
+        key = self.cache.make_key(self.provider.voice_signature(mode), text)
+        if self.cache.contains(key):
+            return False
+        audio = await self.synthesize_async(text, mode)
+        await asyncio.to_thread(self.cache.put, key, audio)
+        return True
+
+    async def synthesize_async(self, text: str, mode: str = "") -> bytes:
+        """Generate the audio of the text with the wrapped provider, without playing it."""
+        if isinstance(self.provider, AsyncTTSProvider):
+            return await self.provider.synthesize_async(text, mode)
+        return await asyncio.to_thread(self.provider.synthesize, text, mode)
+
+    async def play_bytes_async(self, audio: bytes, mode: str = "") -> None:
+        """Play audio previously generated by the wrapped provider."""
+        if isinstance(self.provider, AsyncTTSProvider):
+            await self.provider.play_bytes_async(audio, mode)
+        else:
+            await asyncio.to_thread(self.provider.play_bytes, audio, mode)
+
+    def voice_signature(self, mode: str = "") -> dict:
+        """Voice signature of the wrapped provider."""
+        return self.provider.voice_signature(mode)
+
+    async def cleanup_async(self) -> None:
+        """Clean up the wrapped provider and report the cache statistics."""
+        print(f"🗄️ TTS cache: {self.cache.summary()}")
+        if isinstance(self.provider, AsyncTTSProvider):
+            await self.provider.cleanup_async()
+        else:
+            self.provider.cleanup()
+
+    @property
+    def provider_name(self) -> str:
+        """Return the name of the wrapped provider."""
+        return self.provider.provider_name
@@ -1,10 +1,16 @@
 import os
+import time
+import queue
+import shutil
 import base64
+import asyncio
+import threading
+import subprocess
 
 from elevenlabs import generate, play, set_api_key, voices, RateLimitError
 from elevenlabs import Voice, VoiceSettings
 
-from .base_provider import TTSProvider
+from .base_provider import TTSProvider, AsyncTTSProvider
 from utils.env_utils import (
     get_env_var,
     get_elevenlabs_voice_id,
@@ -13,12 +19,51 @@ from utils.env_utils import (
     get_elevenlabs_style,
 )
 
+ELEVENLABS_MODEL = "eleven_multilingual_v2"
+
+
+def _create_voice(mode: str) -> Voice:
+    """Create the ElevenLabs voice configured for the agent of the given mode."""
+    return Voice(
+        voice_id=get_elevenlabs_voice_id(mode),
+        settings=VoiceSettings(
+            stability=float(get_elevenlabs_stability(mode)),
+            similarity_boost=float(get_elevenlabs_similarity(mode)),
+            style=float(get_elevenlabs_style(mode)),
+            use_speaker_boost=True,
+        ),
+    )
+
+
+def _voice_signature(mode: str) -> dict:
+    """Voice id, settings and model the audio of the given mode is generated with."""
+    return {
+        "provider": "ElevenLabs",
+        "voice": get_elevenlabs_voice_id(mode),
+        "settings": [
+            float(get_elevenlabs_stability(mode)),
+            float(get_elevenlabs_similarity(mode)),
+            float(get_elevenlabs_style(mode)),
+            True,  # use_speaker_boost
+        ],
+        "model": ELEVENLABS_MODEL,
+    }
+
+
+def _new_archive_path() -> str:
+    """Create a unique narration directory and return the path of its audio file."""
+    unique_id = base64.urlsafe_b64encode(os.urandom(30)).decode("utf-8").rstrip("=")
+    dir_path = os.path.join("narration", unique_id)
+    os.makedirs(dir_path, exist_ok=True)
+    return os.path.join(dir_path, "audio.wav")
+
 
 class ElevenLabsProvider(TTSProvider):
     """ElevenLabs TTS provider implementation."""
 
     def __init__(self):
         self._initialized = False
+        self.last_time_to_first_audio = None
 
     def initialize(self) -> None:
         """Initialize the ElevenLabs API."""
@@ -26,37 +71,43 @@ class ElevenLabsProvider(TTSProvider):
             set_api_key(get_env_var("ELEVENLABS_API_KEY"))
             self._initialized = True
 
-    def play_audio(self, text: str, mode: str = "") -> None:
+    def play_audio(self, text: str, mode: str = "", sink=None) -> None:
         """Generate and play audio using ElevenLabs TTS."""
         if not self._initialized:
             self.initialize()
 
+        started = time.time()
         audio = generate(
             text,
-            voice=Voice(
-                voice_id=get_elevenlabs_voice_id(mode),
-                settings=VoiceSettings(
-                    stability=float(get_elevenlabs_stability(mode)),
-                    similarity_boost=float(get_elevenlabs_similarity(mode)),
-                    style=float(get_elevenlabs_style(mode)),
-                    use_speaker_boost=True,
-                ),
-            ),
-            model="eleven_multilingual_v2",
+            voice=_create_voice(mode),
+            model=ELEVENLABS_MODEL,
         )
 
         # Save audio file for persistence
-        unique_id = base64.urlsafe_b64encode(os.urandom(30)).decode("utf-8").rstrip("=")
-        dir_path = os.path.join("narration", unique_id)
-        os.makedirs(dir_path, exist_ok=True)
-        file_path = os.path.join(dir_path, "audio.wav")
-
-        with open(file_path, "wb") as f:
+        with open(_new_archive_path(), "wb") as f:
             f.write(audio)
 
+        if sink is not None:
+            sink(audio)
+
         # Play the audio
+        self.last_time_to_first_audio = time.time() - started
         play(audio)
 
+    def synthesize(self, text: str, mode: str = "") -> bytes:
+        """Generate the audio of the given text without playing it."""
+        if not self._initialized:
+            self.initialize()
+        return generate(text, voice=_create_voice(mode), model=ELEVENLABS_MODEL)
+
+    def play_bytes(self, audio: bytes, mode: str = "") -> None:
+        """Play audio previously generated by this provider."""
+        play(audio)
+
+    def voice_signature(self, mode: str = "") -> dict:
+        """Provider, voice id, voice settings and model used for the given mode."""
+        return _voice_signature(mode)
+
     def cleanup(self) -> None:
         """Clean up ElevenLabs resources."""
         # ElevenLabs doesn't require explicit cleanup
@@ -66,3 +117,160 @@ class ElevenLabsProvider(TTSProvider):
     def provider_name(self) -> str:
         """Return the name of this provider."""
         return "ElevenLabs"
+
+
+class _ArchiveWriter:
+    """Writes audio chunks to a file on its own thread, so archiving never delays playback."""
+
+    def __init__(self, path):
+        self._chunks = queue.Queue()
+        self._thread = threading.Thread(
+            target=self._run, args=(path,), name="audio-archive", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self, path):
+        with open(path, "wb") as f:
+            while (chunk := self._chunks.get()) is not None:
+                f.write(chunk)
+
+    def write(self, chunk):
+        """Queue a chunk for writing."""
+        self._chunks.put(chunk)
+
+    def close(self):
+        """Write the remaining chunks and close the file."""
+        self._chunks.put(None)
+        self._thread.join()
+
+
+class _StreamPlayer:
+    """
+    mpv process playing streamed MP3 chunks, as elevenlabs.stream does, but
+    owned by the provider so playback can be aborted mid-utterance.
+    """
+
+    def __init__(self):
+        if not shutil.which("mpv"):
+            raise ValueError(
+                "mpv not found, necessary to stream audio. "
+                "Install it from https://mpv.io/installation/"
+            )
+        self._process = subprocess.Popen(
+            ["mpv", "--no-cache", "--no-terminal", "--", "fd://0"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+    def write(self, chunk):
+        """Send a chunk to the player."""
+        self._process.stdin.write(chunk)
+        self._process.stdin.flush()
+
+    def finish(self):
+        """Close the input and wait for the queued audio to play out."""
+        self._process.stdin.close()
+        self._process.wait()
+
+    def abort(self):
+        """Stop playback now, dropping the queued audio."""
+        self._process.kill()
+
+
+class ElevenLabsStreamingProvider(AsyncTTSProvider):
+    """
+    ElevenLabs TTS provider streaming the synthesized audio to the player as it
+    arrives. The archival copy is written in parallel from the same chunks.
+    """
+
+    def __init__(self):
+        self._initialized = False
+        self.last_time_to_first_audio = None
+
+    async def initialize_async(self) -> None:
+        """Initialize the ElevenLabs API."""
+        if not self._initialized:
+            set_api_key(get_env_var("ELEVENLABS_API_KEY"))
+            self._initialized = True
+
+    async def play_audio_async(self, text: str, mode: str = "", sink=None) -> None:
+        """Generate and play audio using ElevenLabs streaming TTS."""
+        if not self._initialized:
+            await self.initialize_async()
+
+        # Streaming playback blocks on the player, keep it off the event loop.
+        # Cancelling kills the player and stops pulling chunks from the stream.
+        player = _StreamPlayer()
+        aborted = threading.Event()
+        try:
+            await asyncio.to_thread(
+                self._stream_audio, text, mode, player, aborted, sink
+            )
+        except BaseException:
+            aborted.set()
+            player.abort()
+            raise
+
+    async def synthesize_async(self, text: str, mode: str = "") -> bytes:
+        """Generate the audio of the given text without playing it."""
+        if not self._initialized:
+            await self.initialize_async()
+        return await asyncio.to_thread(
+            generate, text, voice=_create_voice(mode), model=ELEVENLABS_MODEL
+        )
+
+    async def play_bytes_async(self, audio: bytes, mode: str = "") -> None:
+        """Play audio previously generated by this provider."""
+        await asyncio.to_thread(play, audio)
+
+    def voice_signature(self, mode: str = "") -> dict:
+        """Provider, voice id, voice settings and model used for the given mode."""
+        return _voice_signature(mode)
+
+    def _stream_audio(self, text: str, mode: str, player, aborted, sink=None) -> None:
+        """
+        Stream audio chunks to the player and the archive (synchronous).
+        Stops between chunks once aborted is set.
+        """
+        started = time.time()
+        self.last_time_to_first_audio = None
+        audio_stream = generate(
+            text,
+            voice=_create_voice(mode),
+            model=ELEVENLABS_MODEL,
+            stream=True,
+        )
+        archive = _ArchiveWriter(_new_archive_path())
+        try:
+            for chunk in audio_stream:
+                if aborted.is_set():
+                    return
+                if not chunk:
+                    continue
+                if self.last_time_to_first_audio is None:
+                    self.last_time_to_first_audio = time.time() - started
+                    print(
+                        f"⏱️ ElevenLabs first audio after {self.last_time_to_first_audio:.2f}s"
+                    )
+                archive.write(chunk)
+                if sink is not None:
+                    sink(chunk)
+                player.write(chunk)
+            player.finish()
+        except (BrokenPipeError, ValueError):
+            # The player was killed while writing to it
+            if not aborted.is_set():
+                raise
+        finally:
+            archive.close()
+
+    async def cleanup_async(self) -> None:
+        """Clean up ElevenLabs resources."""
+        # ElevenLabs doesn't require explicit cleanup
+        pass
+
+    @property
+    def provider_name(self) -> str:
+        """Return the name of this provider."""
+        return "ElevenLabs"
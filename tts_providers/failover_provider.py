@@ -0,0 +1,232 @@
+import time
+import asyncio
+from typing import Union
+
+from .base_provider import TTSProvider, AsyncTTSProvider
+
+FAILOVER_HEALTH_ALPHA = 0.5  # weight of the latest utterance in the health score
+FAILOVER_HEALTH_THRESHOLD = 0.6  # below this score a provider is rested
+FAILOVER_RETRY_AFTER = 60.0  # seconds before a rested provider is tried again
+FAILOVER_SLOW_FIRST_AUDIO = 3.0  # seconds to first audio that count as half a failure
+
+
+class ProviderHealth:
+    """
+    Health score of a TTS provider: exponentially weighted outcome of its
+    recent utterances, 1 for a good one, 0.5 for a slow one, 0 for a failure.
+    """
+
+    def __init__(
+        self,
+        alpha=FAILOVER_HEALTH_ALPHA,
+        threshold=FAILOVER_HEALTH_THRESHOLD,
+        retry_after=FAILOVER_RETRY_AFTER,
+    ):
+        self.alpha = alpha
+        self.threshold = threshold
+        self.retry_after = retry_after
+        self.score = 1.0
+        self.degraded_at = None  # Last utterance that was not good
+
+    def record(self, outcome, now=None):
+        """Fold the outcome of an utterance, between 0 and 1, into the score."""
+        self.score += self.alpha * (outcome - self.score)
+        if outcome < 1.0:
+            self.degraded_at = now if now is not None else time.time()
+
+    def available(self, now=None):
+        """Whether the provider is healthy, or has rested long enough to be tried again."""
+        if self.score >= self.threshold:
+            return True
+        now = now if now is not None else time.time()
+        return now - self.degraded_at >= self.retry_after
+
+
+class FailoverTTSProvider(AsyncTTSProvider):
+    """
+    A primary provider with a warm standby, both initialized at startup.
+    Each utterance goes to the first available provider by health score,
+    the primary first. When it fails, the same utterance is spoken by the
+    other one right away, so the narrator keeps running and never restarts.
+    """
+
+    def __init__(
+        self,
+        primary: Union[TTSProvider, AsyncTTSProvider],
+        standby: Union[TTSProvider, AsyncTTSProvider],
+    ):
+        self.providers = [primary, standby]
+        self.health = [ProviderHealth(), ProviderHealth()]
+        self.active = 0  # Index of the provider that spoke last
+        self.failover_latencies = []  # Seconds from a failure to the standby's audio
+        self._ready = [None, None]  # Initialization tasks
+
+    async def initialize_async(self) -> None:
+        """Initialize the primary, and the standby in the background."""
+        self._ready = [self._start_initialization(index) for index in range(2)]
+        try:
+            await self._ready[0]
+        except Exception:
+            # The standby takes over, raises if it fails too
+            await self._ready[1]
+            self.active = 1
+
+    async def play_audio_async(self, text: str, mode: str = "", sink=None) -> None:
+        """Speak the text with the healthiest provider, failing over within the utterance."""
+
+        async def play(provider, timed_sink):
+            if isinstance(provider, AsyncTTSProvider):
+                await provider.play_audio_async(text, mode, sink=timed_sink)
+            else:
+                await asyncio.to_thread(provider.play_audio, text, mode, timed_sink)
+
+        await self._with_failover(play, sink)
+
+    async def warm_async(self, text: str, mode: str = "") -> bool:
+        """Cache the text with the healthiest provider that has a cache."""
+
+        async def warm(provider, _):
+            if not hasattr(provider, "warm_async"):
+                return False
+            return await provider.warm_async(text, mode)
+
+        return await self._with_failover(warm)
+
+    async def synthesize_async(self, text: str, mode: str = "") -> bytes:
+        """Generate the audio of the text with the healthiest provider, without playing it."""
+
+        async def synthesize(provider, _):
+            if isinstance(provider, AsyncTTSProvider):
+                return await provider.synthesize_async(text, mode)
+            return await asyncio.to_thread(provider.synthesize, text, mode)
+
+        return await self._with_failover(synthesize)
+
+    async def play_bytes_async(self, audio: bytes, mode: str = "") -> None:
+        """Play audio previously generated by synthesize_async, with the healthiest provider."""
+
+        async def play_bytes(provider, _):
+            if isinstance(provider, AsyncTTSProvider):
+                await provider.play_bytes_async(audio, mode)
+            else:
+                await asyncio.to_thread(provider.play_bytes, audio, mode)
+
+        await self._with_failover(play_bytes)
+
+    async def _with_failover(self, call, sink=None):
+        """
+        Run call(provider, sink) on each provider in the order of _candidates()
+        until one succeeds, accounting the outcome in their health scores.
+        The sink passed to call times the first audio before forwarding it to sink.
+        Returns the result of the successful call, raises the last error if all fail.
+        """
+        failed_at = None
+        error = None
+        for index in self._candidates():
+            provider = self.providers[index]
+            first_audio = []
+
+            def timed_sink(chunk):
+                if not first_audio:
+                    first_audio.append(time.perf_counter())
+                if sink is not None:
+                    sink(chunk)
+
+            start = time.perf_counter()
+            try:
+                await self._wait_ready(index)
+                result = await call(provider, timed_sink)
+            except Exception as e:
+                print(f"⚠️ {provider.provider_name} TTS failed: {e}")
+                self.health[index].record(0.0)
+                failed_at = failed_at or time.perf_counter()
+                error = e
+                continue
+
+            first_audio_at = first_audio[0] if first_audio else time.perf_counter()
+            slow = first_audio_at - start > FAILOVER_SLOW_FIRST_AUDIO
+            self.health[index].record(0.5 if slow else 1.0)
+            if failed_at is not None:
+                latency = first_audio_at - failed_at
+                self.failover_latencies.append(latency)
+                print(
+                    f"🔀 Failed over to {provider.provider_name}, "
+                    f"audio {latency:.2f}s after the failure"
+                )
+            self.active = index
+            return result
+        raise error
+
+    def voice_signature(self, mode: str = "") -> dict:
+        """Voice signature of the active provider."""
+        return self.providers[self.active].voice_signature(mode)
+
+    def summary(self):
+        """One line summary of the failovers and of the health of each provider."""
+        latencies = self.failover_latencies
+        health = ", ".join(
+            f"{provider.provider_name} {health.score:.2f}"
+            for provider, health in zip(self.providers, self.health)
+        )
+        mean = f", {sum(latencies) / len(latencies):.2f}s mean" if latencies else ""
+        return f"{len(latencies)} failovers{mean}, health: {health}"
+
+    async def cleanup_async(self) -> None:
+        """Clean up both providers and report the failovers."""
+        print(f"🔀 TTS failover: {self.summary()}")
+        for index, provider in enumerate(self.providers):
+            task = self._ready[index]
+            if task is None:
+                continue
+            if not task.done():
+                task.cancel()
+                continue
+            if task.cancelled() or task.exception() is not None:
+                continue
+            try:
+                if isinstance(provider, AsyncTTSProvider):
+                    await provider.cleanup_async()
+                else:
+                    provider.cleanup()
+            except Exception as e:
+                print(f"Warning: Could not clean up {provider.provider_name}: {e}")
+
+    @property
+    def provider_name(self) -> str:
+        """Return the name of the active provider."""
+        return self.providers[self.active].provider_name
+
+    def _candidates(self):
+        """Provider indexes in the order to try: available ones first, primary first."""
+        now = time.time()
+        return sorted(range(2), key=lambda index: not self.health[index].available(now))
+
+    def _start_initialization(self, index):
+        """Initialize a provider in a task, accounting a failure in its health."""
+        provider = self.providers[index]
+        if isinstance(provider, AsyncTTSProvider):
+            task = asyncio.create_task(provider.initialize_async())
+        else:
+            task = asyncio.create_task(asyncio.to_thread(provider.initialize))
+
+        def initialized(task):
+            if task.cancelled():
+                return
+            if task.exception() is not None:
+                print(
+                    f"⚠️ {provider.provider_name} TTS provider failed to initialize: "
+                    f"{task.exception()}"
+                )
+                self.health[index].record(0.0)
+            elif index == 1:
+                print(f"🛟 {provider.provider_name} ready as standby TTS provider")
+
+        task.add_done_callback(initialized)
+        return task
+
+    async def _wait_ready(self, index):
+        """Wait for a provider to be initialized, retrying a failed initialization."""
+        task = self._ready[index]
+        if task.done() and not task.cancelled() and task.exception() is not None:
+            task = self._ready[index] = self._start_initialization(index)
+        await task
@@ -1,18 +1,51 @@
 import os
 import asyncio
 import time
+import struct
 import numpy as np
 
 from pyht.async_client import AsyncClient
 from pyht.client import TTSOptions
 from pyht.protos import api_pb2
-import simpleaudio as sa
+from tools.audio_engine import get_audio_engine
 from utils.env_utils import get_env_var, get_playht_voice_id
 
 from .base_provider import AsyncTTSProvider
 
 AUDIO_GENERATION_SAMPLE_RATE = 22050
 MAX_MINUTES_PER_AUDIO = 4
+PLAYHT_VOICE_ENGINE = "Play3.0-mini"
+
+
+def _parse_wav_header(buffer):
+    """
+    Parse the header at the start of a WAV stream.
+    Returns (sample_rate, channels, sample_width, data_offset), or None while
+    the buffer does not yet contain the whole header.
+    """
+    if len(buffer) < 12:
+        return None
+    if buffer[:4] != b"RIFF" or buffer[8:12] != b"WAVE":
+        raise ValueError("PlayHT audio stream is not WAV")
+
+    offset = 12
+    fmt = None
+    while offset + 8 <= len(buffer):
+        chunk_id = bytes(buffer[offset : offset + 4])
+        (size,) = struct.unpack_from("<I", buffer, offset + 4)
+        if chunk_id == b"data":
+            # Streamed WAVs carry a placeholder data size: the data runs to the end
+            if fmt is None:
+                raise ValueError("WAV data chunk before fmt chunk")
+            return (*fmt, offset + 8)
+        if offset + 8 + size > len(buffer):
+            return None
+        if chunk_id == b"fmt ":
+            channels, sample_rate = struct.unpack_from("<HI", buffer, offset + 10)
+            (bits_per_sample,) = struct.unpack_from("<H", buffer, offset + 22)
+            fmt = (sample_rate, channels, bits_per_sample // 8)
+        offset += 8 + size + (size & 1)
+    return None
 
 
 class PlayHTProvider(AsyncTTSProvider):
@@ -22,6 +55,7 @@ class PlayHTProvider(AsyncTTSProvider):
         self.client = None
         self.options = None
         self._initialized = False
+        self.last_time_to_first_audio = None
 
     async def initialize_async(self) -> None:
         """Initialize the PlayHT API client."""
@@ -32,16 +66,54 @@ class PlayHTProvider(AsyncTTSProvider):
             self.client = AsyncClient(user_id=user_id, api_key=api_key)
             self._initialized = True
 
-    async def play_audio_async(self, text: str, mode: str = "") -> None:
+    async def play_audio_async(self, text: str, mode: str = "", sink=None) -> None:
         """Generate and play audio using PlayHT TTS."""
         if not self._initialized:
             await self.initialize_async()
 
         self.options = self._create_playht_options(mode)
         await self._async_play_audio(
-            self.client.tts(text, voice_engine="Play3.0-mini", options=self.options)
+            self._audio_chunks(
+                self.client.tts(
+                    text, voice_engine=PLAYHT_VOICE_ENGINE, options=self.options
+                )
+            ),
+            sink,
         )
 
+    async def synthesize_async(self, text: str, mode: str = "") -> bytes:
+        """Generate the WAV audio of the given text without playing it."""
+        if not self._initialized:
+            await self.initialize_async()
+
+        chunks = []
+        async for data in self._audio_chunks(
+            self.client.tts(
+                text,
+                voice_engine=PLAYHT_VOICE_ENGINE,
+                options=self._create_playht_options(mode),
+            )
+        ):
+            chunks.append(data)
+        return b"".join(chunks)
+
+    async def play_bytes_async(self, audio: bytes, mode: str = "") -> None:
+        """Play WAV audio previously generated by this provider."""
+
+        async def single_chunk():
+            yield audio
+
+        await self._async_play_audio(single_chunk())
+
+    def voice_signature(self, mode: str = "") -> dict:
+        """Provider, voice id, output format and voice engine used for the given mode."""
+        return {
+            "provider": "PlayHT",
+            "voice": get_playht_voice_id(mode),
+            "settings": [AUDIO_GENERATION_SAMPLE_RATE, "wav"],
+            "model": PLAYHT_VOICE_ENGINE,
+        }
+
     async def cleanup_async(self) -> None:
         """Clean up PlayHT resources."""
         if self.client:
@@ -60,29 +132,57 @@ class PlayHTProvider(AsyncTTSProvider):
             format=api_pb2.FORMAT_WAV,
         )
 
-    async def _async_play_audio(self, audio_stream):
-        """Play audio from async stream."""
-        # Collect audio data
-        audio_data = b""
+    @staticmethod
+    async def _audio_chunks(audio_stream):
+        """Audio bytes of the non-empty chunks of a PlayHT stream."""
         async for chunk in audio_stream:
             if chunk.data:
-                audio_data += chunk.data
-
-        if not audio_data:
+                yield chunk.data
+
+    async def _async_play_audio(self, audio_chunks, sink=None):
+        """
+        Play audio from an async iterator of WAV bytes.
+        Chunks go to the audio engine as they arrive, only the WAV header is buffered.
+        """
+        started = time.time()
+        self.last_time_to_first_audio = None
+        header = bytearray()
+        player = None
+        try:
+            async for data in audio_chunks:
+                if sink is not None:
+                    sink(data)
+                if player is None:
+                    header += data
+                    parsed = _parse_wav_header(header)
+                    if parsed is None:
+                        continue
+                    sample_rate, channels, sample_width, data_offset = parsed
+                    player = get_audio_engine().open_stream(
+                        sample_rate, channels, sample_width
+                    )
+                    data = memoryview(header)[data_offset:]
+
+                if self.last_time_to_first_audio is None and len(data):
+                    self.last_time_to_first_audio = time.time() - started
+                    print(
+                        f"⏱️ PlayHT first audio after {self.last_time_to_first_audio:.2f}s"
+                    )
+                # Wait while the engine has enough audio queued
+                await asyncio.wrap_future(player.write(data))
+        except BaseException:
+            if player is not None:
+                player.abort()
+            raise
+
+        if player is None:
             print("No audio data received")
             return
 
-        # Write to temporary file
-        temp_file = "temp_audio.wav"
-        with open(temp_file, "wb") as f:
-            f.write(audio_data)
-
+        # Let the queued audio play out without blocking the event loop
         try:
-            # Play the audio file
-            wave_obj = sa.WaveObject.from_wave_file(temp_file)
-            play_obj = wave_obj.play()
-            play_obj.wait_done()
-        finally:
-            # Clean up temporary file
-            if os.path.exists(temp_file):
-                os.remove(temp_file)
+            await asyncio.wrap_future(player.finish())
+        except asyncio.CancelledError:
+            # Stop the buffered audio too, the next utterance must not overlap it
+            player.abort()
+            raise
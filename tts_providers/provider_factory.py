@@ -2,8 +2,10 @@ import os
 from typing import Union
 
 from .base_provider import TTSProvider, AsyncTTSProvider
-from .elevenlabs_provider import ElevenLabsProvider
+from .elevenlabs_provider import ElevenLabsProvider, ElevenLabsStreamingProvider
 from .playht_provider import PlayHTProvider
+from .cached_provider import CachedTTSProvider, get_tts_cache
+from .failover_provider import FailoverTTSProvider
 
 
 class ProviderFactory:
@@ -11,15 +13,24 @@ class ProviderFactory:
 
     PROVIDERS = {
         "elevenlabs": ElevenLabsProvider,
+        "elevenlabs_stream": ElevenLabsStreamingProvider,
         "playht": PlayHTProvider,
     }
 
+    # Standby used when TTS_FAILOVER_PROVIDER is not set
+    STANDBY_PROVIDERS = {
+        "elevenlabs": "playht",
+        "elevenlabs_stream": "playht",
+        "playht": "elevenlabs_stream",
+    }
+
     @classmethod
     def create_provider(
         cls, provider_name: str = None
     ) -> Union[TTSProvider, AsyncTTSProvider]:
         """
         Create a TTS provider instance.
+        Unless TTS_CACHE is "false", the provider is wrapped in the shared TTS cache.
 
         Args:
             provider_name: Name of the provider to create. If None, uses TTS_PROVIDER env var.
@@ -41,8 +52,51 @@ class ProviderFactory:
                 f"Unsupported provider '{provider_name}'. Available: {available}"
             )
 
-        provider_class = cls.PROVIDERS[provider_name]
-        return provider_class()
+        provider = cls.PROVIDERS[provider_name]()
+        if os.environ.get("TTS_CACHE", "true").lower() == "true":
+            provider = CachedTTSProvider(provider, get_tts_cache())
+        return provider
+
+    @classmethod
+    def create_failover_provider(
+        cls, provider_name: str = None, standby_name: str = None
+    ) -> Union[TTSProvider, AsyncTTSProvider]:
+        """
+        Create a TTS provider with a warm standby that takes over, in process,
+        when it fails. Unless TTS_FAILOVER is "false", in which case the
+        provider is returned alone.
+
+        Args:
+            provider_name: Name of the primary provider. If None, uses TTS_PROVIDER env var.
+            standby_name: Name of the standby provider. If None, uses TTS_FAILOVER_PROVIDER
+                env var or the other provider.
+
+        Returns:
+            TTS provider instance
+
+        Raises:
+            ValueError: If provider_name is not supported
+        """
+        provider_name = (
+            provider_name or os.environ.get("TTS_PROVIDER", "playht")
+        ).lower()
+        provider = cls.create_provider(provider_name)
+        if os.environ.get("TTS_FAILOVER", "true").lower() != "true":
+            return provider
+
+        standby_name = (
+            standby_name
+            or os.environ.get("TTS_FAILOVER_PROVIDER")
+            or cls.STANDBY_PROVIDERS.get(provider_name)
+        )
+        if not standby_name or standby_name.lower() == provider_name:
+            return provider
+        try:
+            standby = cls.create_provider(standby_name)
+        except Exception as e:
+            print(f"Warning: Could not create standby TTS provider: {e}")
+            return provider
+        return FailoverTTSProvider(provider, standby)
 
     @classmethod
     def get_available_providers(cls) -> list[str]:
@@ -0,0 +1,121 @@
+"""
+In-memory registry of the agent configurations.
+"""
+
+import os
+import threading
+from types import MappingProxyType
+
+import dotenv
+
+from models import AgentConfig
+
+AGENT_RELOAD_INTERVAL = 5.0  # seconds between checks of the agent files' mtimes
+
+# Env var suffix of each AgentConfig field, e.g. DAVIDE_AGENT_NAME
+AGENT_ENV_SUFFIXES = {
+    "name": "AGENT_NAME",
+    "prompt": "AGENT_PROMPT",
+    "first_image_prompt": "FIRST_IMAGE_PROMPT",
+    "new_image_prompt": "NEW_IMAGE_PROMPT",
+    "elevenlabs_voice_id": "ELEVENLABS_VOICE_ID",
+    "elevenlabs_stability": "ELEVENLABS_STABILITY",
+    "elevenlabs_similarity": "ELEVENLABS_SIMILARITY",
+    "elevenlabs_style": "ELEVENLABS_STYLE",
+    "playht_voice_id": "PLAYHT_VOICE_ID",
+    "filler_phrases": "FILLER_PHRASES",
+}
+
+
+def _mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+class AgentRegistry:
+    """
+    Immutable agent configurations, parsed once from the agent env files.
+    Lookups are plain dictionary reads with no filesystem I/O. The whole
+    snapshot is replaced when a file's mtime changes, checked by a background
+    watcher, or when a reload is requested (e.g. on SIGHUP).
+    As with dotenv, variables already set in the environment take precedence
+    over the files.
+    """
+
+    def __init__(self, env_files, reload_interval=AGENT_RELOAD_INTERVAL):
+        self.env_files = dict(env_files)
+        self.reload_interval = reload_interval
+        self._reload_requested = threading.Event()
+        self._watcher = None
+        self._mtimes = {}
+        self._agents = MappingProxyType({})
+        self.reload()
+
+    def get(self, agent):
+        """Configuration of the agent, or None if it is unknown."""
+        return self._agents.get(agent)
+
+    def agents(self):
+        """Snapshot of all agent configurations by agent key."""
+        return self._agents
+
+    def reload(self):
+        """Parse every agent file and swap in the new snapshot."""
+        mtimes = {agent: _mtime(path) for agent, path in self.env_files.items()}
+        agents = {}
+        for agent, path in self.env_files.items():
+            values = dotenv.dotenv_values(path) if mtimes[agent] is not None else {}
+            agents[agent] = self._parse(agent, values)
+        self._mtimes = mtimes
+        self._agents = MappingProxyType(agents)
+
+    def request_reload(self):
+        """Ask the watcher to reload the agent files now (safe from signal handlers)."""
+        self._reload_requested.set()
+
+    def start_watching(self):
+        """Start the background thread reloading the files when they change."""
+        if self._watcher is None:
+            self._watcher = threading.Thread(
+                target=self._watch, name="agent-registry-watcher", daemon=True
+            )
+            self._watcher.start()
+        return self
+
+    def _watch(self):
+        while True:
+            requested = self._reload_requested.wait(self.reload_interval)
+            self._reload_requested.clear()
+            changed = [
+                agent
+                for agent, path in self.env_files.items()
+                if _mtime(path) != self._mtimes.get(agent)
+            ]
+            if requested or changed:
+                try:
+                    self.reload()
+                    print(f"🔁 Agent configurations reloaded {changed or ''}")
+                except Exception as e:
+                    print(f"Warning: Could not reload agent configurations: {e}")
+
+    @staticmethod
+    def _parse(agent, values):
+        """Build the AgentConfig of an agent from its file values and the environment."""
+        fields = {}
+        for field, suffix in AGENT_ENV_SUFFIXES.items():
+            key = f"{agent.upper()}_{suffix}"
+            value = os.environ.get(key, values.get(key))
+            if value is not None and value != "":
+                fields[field] = value
+
+        if "new_image_prompt" not in fields and "first_image_prompt" in fields:
+            # Some agents use the same prompt for the first and the next images
+            fields["new_image_prompt"] = fields["first_image_prompt"]
+        fields["filler_phrases"] = tuple(
+            phrase.strip()
+            for phrase in fields.get("filler_phrases", "").split("|")
+            if phrase.strip()
+        )
+        return AgentConfig(agent=agent, **fields)
@@ -37,29 +37,18 @@ def get_agent_config(agent_name: str) -> Dict[str, Any]:
     Returns:
         Dictionary containing all found configuration variables
     """
-    if not agent_name:
-        return {}
+    from utils.env_utils import AGENT_REGISTRY
+    from utils.agent_registry import AGENT_ENV_SUFFIXES
 
-    # Standard configuration keys we look for
-    config_keys = [
-        "AGENT_NAME",
-        "AGENT_PROMPT",
-        "FIRST_IMAGE_PROMPT",
-        "NEW_IMAGE_PROMPT",
-        "ELEVENLABS_VOICE_ID",
-        "ELEVENLABS_STABILITY",
-        "ELEVENLABS_SIMILARITY",
-        "ELEVENLABS_STYLE",
-        "PLAYHT_VOICE_ID",
-    ]
-
-    config = {}
-    for key in config_keys:
-        value = get_agent_env_var(agent_name, key)
-        if value is not None:
-            config[key.lower()] = value
+    config = AGENT_REGISTRY.get(agent_name) if agent_name else None
+    if config is None:
+        return {}
 
-    return config
+    return {
+        suffix.lower(): getattr(config, field)
+        for field, suffix in AGENT_ENV_SUFFIXES.items()
+        if getattr(config, field)
+    }
 
 
 def list_available_agents() -> Dict[str, str]:
@@ -84,17 +73,14 @@ def validate_agent(agent_name: str) -> Dict[str, Any]:
     Returns:
         Dictionary with validation results
     """
-    from utils.env_utils import load_agent_env
-
     if not agent_name:
         return {"valid": False, "error": "Agent name cannot be empty"}
 
-    # Load agent environment
-    load_agent_env(agent_name)
+    config = get_agent_config(agent_name)
 
     # Check for required fields
-    agent_display_name = get_agent_env_var(agent_name, "AGENT_NAME")
-    agent_prompt = get_agent_env_var(agent_name, "AGENT_PROMPT")
+    agent_display_name = config.get("agent_name")
+    agent_prompt = config.get("agent_prompt")
 
     issues = []
     if not agent_display_name:
@@ -103,8 +89,8 @@ def validate_agent(agent_name: str) -> Dict[str, Any]:
         issues.append(f"Missing {agent_name.upper()}_AGENT_PROMPT")
 
     # Check for at least one voice provider
-    has_elevenlabs = get_agent_env_var(agent_name, "ELEVENLABS_VOICE_ID") is not None
-    has_playht = get_agent_env_var(agent_name, "PLAYHT_VOICE_ID") is not None
+    has_elevenlabs = "elevenlabs_voice_id" in config
+    has_playht = "playht_voice_id" in config
 
     if not has_elevenlabs and not has_playht:
         issues.append(
@@ -116,5 +102,5 @@ def validate_agent(agent_name: str) -> Dict[str, Any]:
         "issues": issues,
         "has_elevenlabs": has_elevenlabs,
         "has_playht": has_playht,
-        "config": get_agent_config(agent_name),
+        "config": config,
     }
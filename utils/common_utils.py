@@ -1,4 +1,3 @@
-import subprocess
 import os
 import re
 
@@ -7,22 +6,6 @@ from utils.env_utils import get_first_image_prompt, get_new_image_prompt
 # Create the frames folder if it doesn't exist
 FRAMES_DIR = os.path.join(os.getcwd(), "frames")
 
-""" **************************************************************************************************** """
-""" ERROR HANDLING UTILS """
-
-
-def maybe_start_alternative_narrator(e, from_error, text, alternative_narrator):
-    if (
-        from_error
-    ):  # If this script was run from an error of another narrator, we stop it here to not create loops of runs.
-        print(f"Error occurred: {e}\nThis was the alternative narrator..\n\n")
-        raise e
-    else:  # We start the alternative narrator.
-        print(f"Error occurred: {e}\nStarting the alternative narrator.\n\n")
-        command = ["python", alternative_narrator, "--from-error", "--text", text]
-        subprocess.run(command)
-
-
 """ **************************************************************************************************** """
 """ LLM UTILS """
 
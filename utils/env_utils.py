@@ -1,6 +1,7 @@
 import os
 import dotenv
 from models.narrator_mode import MODE_CONFIGS, NarratorMode
+from utils.agent_registry import AgentRegistry
 
 # Load base environment variables
 dotenv.load_dotenv()
@@ -12,6 +13,9 @@ AGENT_ENV_FILES = {
     "piersilvio": "agents/piers.env",
 }
 
+# Agent configurations, parsed once. Getters below read from memory only.
+AGENT_REGISTRY = AgentRegistry(AGENT_ENV_FILES)
+
 
 def load_agent_env(agent_name):
     """Load agent-specific environment variables based on agent name."""
@@ -34,6 +38,14 @@ def get_agent_from_mode(mode):
     return mode_config.agent if mode_config else None
 
 
+def get_agent_config_for_mode(mode):
+    """Get the AgentConfig of the agent of the given mode, or None."""
+    agent = get_agent_from_mode(mode)
+    if not agent:
+        return None
+    return AGENT_REGISTRY.get(agent)
+
+
 def get_env_var(key, mode=None):
     """Get environment variable, loading agent-specific env if mode is provided."""
     if mode:
@@ -43,123 +55,59 @@ def get_env_var(key, mode=None):
 
 def get_agent_name(mode):
     """Get agent name for the given mode."""
-    agent = get_agent_from_mode(mode)
-    if not agent:
-        return None
-
-    load_agent_env(agent)
-
-    # Use convention: AGENT_NAME_AGENT_NAME (e.g., DAVIDE_AGENT_NAME)
-    env_var = f"{agent.upper()}_AGENT_NAME"
-    return os.environ.get(env_var)
+    config = get_agent_config_for_mode(mode)
+    return config.name if config else None
 
 
 def get_agent_prompt(mode):
     """Get agent prompt for the given mode."""
-    agent = get_agent_from_mode(mode)
-    if not agent:
-        return None
-
-    load_agent_env(agent)
-
-    # Use convention: AGENT_NAME_AGENT_PROMPT (e.g., DAVIDE_AGENT_PROMPT)
-    env_var = f"{agent.upper()}_AGENT_PROMPT"
-    return os.environ.get(env_var)
+    config = get_agent_config_for_mode(mode)
+    return config.prompt if config else None
 
 
 def get_first_image_prompt(mode):
     """Get first image prompt for the given mode."""
-    agent = get_agent_from_mode(mode)
-    if not agent:
-        return None
-
-    load_agent_env(agent)
-
-    # Use convention: AGENT_NAME_FIRST_IMAGE_PROMPT (e.g., DAVIDE_FIRST_IMAGE_PROMPT)
-    env_var = f"{agent.upper()}_FIRST_IMAGE_PROMPT"
-    return os.environ.get(env_var)
+    config = get_agent_config_for_mode(mode)
+    return config.first_image_prompt if config else None
 
 
 def get_new_image_prompt(mode):
-    """Get new image prompt for the given mode."""
-    agent = get_agent_from_mode(mode)
-    if not agent:
-        return None
-
-    load_agent_env(agent)
-
-    # Try convention: AGENT_NAME_NEW_IMAGE_PROMPT (e.g., DAVIDE_NEW_IMAGE_PROMPT)
-    env_var = f"{agent.upper()}_NEW_IMAGE_PROMPT"
-    result = os.environ.get(env_var)
-
-    # If not found, fall back to FIRST_IMAGE_PROMPT (some agents use same prompt for both)
-    if not result:
-        env_var = f"{agent.upper()}_FIRST_IMAGE_PROMPT"
-        result = os.environ.get(env_var)
-
-    return result
+    """Get new image prompt for the given mode (falls back to the first image prompt)."""
+    config = get_agent_config_for_mode(mode)
+    return config.new_image_prompt if config else None
 
 
 def get_elevenlabs_voice_id(mode):
     """Get ElevenLabs voice ID for the given mode."""
-    agent = get_agent_from_mode(mode)
-    if not agent:
-        return None
-
-    load_agent_env(agent)
-
-    # Use convention: AGENT_NAME_ELEVENLABS_VOICE_ID (e.g., DAVIDE_ELEVENLABS_VOICE_ID)
-    env_var = f"{agent.upper()}_ELEVENLABS_VOICE_ID"
-    return os.environ.get(env_var)
+    config = get_agent_config_for_mode(mode)
+    return config.elevenlabs_voice_id if config else None
 
 
 def get_elevenlabs_stability(mode):
     """Get ElevenLabs stability for the given mode."""
-    agent = get_agent_from_mode(mode)
-    if not agent:
-        return None
-
-    load_agent_env(agent)
-
-    # Use convention: AGENT_NAME_ELEVENLABS_STABILITY (e.g., DAVIDE_ELEVENLABS_STABILITY)
-    env_var = f"{agent.upper()}_ELEVENLABS_STABILITY"
-    return os.environ.get(env_var)
+    config = get_agent_config_for_mode(mode)
+    return config.elevenlabs_stability if config else None
 
 
 def get_elevenlabs_similarity(mode):
     """Get ElevenLabs similarity for the given mode."""
-    agent = get_agent_from_mode(mode)
-    if not agent:
-        return None
-
-    load_agent_env(agent)
-
-    # Use convention: AGENT_NAME_ELEVENLABS_SIMILARITY (e.g., DAVIDE_ELEVENLABS_SIMILARITY)
-    env_var = f"{agent.upper()}_ELEVENLABS_SIMILARITY"
-    return os.environ.get(env_var)
+    config = get_agent_config_for_mode(mode)
+    return config.elevenlabs_similarity if config else None
 
 
 def get_elevenlabs_style(mode):
     """Get ElevenLabs style for the given mode."""
-    agent = get_agent_from_mode(mode)
-    if not agent:
-        return None
-
-    load_agent_env(agent)
-
-    # Use convention: AGENT_NAME_ELEVENLABS_STYLE (e.g., DAVIDE_ELEVENLABS_STYLE)
-    env_var = f"{agent.upper()}_ELEVENLABS_STYLE"
-    return os.environ.get(env_var)
+    config = get_agent_config_for_mode(mode)
+    return config.elevenlabs_style if config else None
 
 
 def get_playht_voice_id(mode):
     """Get PlayHT voice ID for the given mode."""
-    agent = get_agent_from_mode(mode)
-    if not agent:
-        return None
+    config = get_agent_config_for_mode(mode)
+    return config.playht_voice_id if config else None
 
-    load_agent_env(agent)
 
-    # Use convention: AGENT_NAME_PLAYHT_VOICE_ID (e.g., DAVIDE_PLAYHT_VOICE_ID)
-    env_var = f"{agent.upper()}_PLAYHT_VOICE_ID"
-    return os.environ.get(env_var)
+def get_filler_phrases(mode):
+    """Get the short filler phrases played while the agent of the given mode thinks."""
+    config = get_agent_config_for_mode(mode)
+    return list(config.filler_phrases) if config else []